@@ -1,5 +1,8 @@
 """Configuration settings for the Telegram Solana Alert Bot."""
+import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
 class Config:
@@ -10,6 +13,14 @@ class Config:
     BIRDEYE_API_KEY: Optional[str] = os.getenv('BIRDEYE_API_KEY')
     DEXSCREENER_API_KEY: Optional[str] = os.getenv('DEXSCREENER_API_KEY')
     
+    # Update delivery - webhook mode needs a public HTTPS base URL; otherwise long polling is used
+    USE_WEBHOOK: bool = os.getenv('USE_WEBHOOK', 'false').lower() == 'true'
+    WEBHOOK_URL: Optional[str] = os.getenv('WEBHOOK_URL')
+    WEBHOOK_LISTEN: str = os.getenv('WEBHOOK_LISTEN', '0.0.0.0')
+    WEBHOOK_PORT: int = int(os.getenv('WEBHOOK_PORT', os.getenv('PORT', '8443')))
+    # Sent by Telegram in X-Telegram-Bot-Api-Secret-Token; requests without it are rejected
+    WEBHOOK_SECRET: Optional[str] = os.getenv('WEBHOOK_SECRET')
+    
     # Database settings - Railway compatible
     DATABASE_PATH: str = os.getenv('DATABASE_PATH', 'tokens.db')
     
@@ -63,4 +74,31 @@ class Config:
         if not cls.TELEGRAM_BOT_TOKEN:
             print("❌ TELEGRAM_BOT_TOKEN is required!")
             return False
+        if cls.USE_WEBHOOK and not cls.WEBHOOK_URL:
+            print("❌ WEBHOOK_URL is required when USE_WEBHOOK is enabled!")
+            return False
         return True
+
+def setup_logging() -> Optional[QueueListener]:
+    """Route logging through a queue and return the started listener.
+
+    Records are formatted on the event loop but written to bot.log/stderr by the
+    listener thread, so slow disk or console I/O never stalls the loop. Returns
+    None when the root logger is already configured (e.g. by railway_start.py).
+    The caller stops the listener on shutdown to flush what is still queued.
+    """
+    if logging.getLogger().handlers:
+        return None
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
+        logging.StreamHandler()
+    )
+    logging.basicConfig(
+        level=getattr(logging, Config.LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    listener.start()
+    return listener
@@ -3,13 +3,128 @@ import asyncio
 import json
 import shutil
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+# Hot-path statements kept as constants so SQLite's per-connection statement
+# cache can reuse the prepared plan.
+# Parameters: ?1 contract_address, ?2 current_mcap, ?3 current_price, ?4 last_updated
+UPDATE_PRICES_SQL = '''
+    UPDATE tokens
+    SET current_mcap = ?2, current_price = ?3, last_updated = ?4,
+        lowest_mcap = MIN(COALESCE(lowest_mcap, ?2), ?2),
+        lowest_price = MIN(COALESCE(lowest_price, ?3), ?3),
+        highest_mcap = MAX(COALESCE(highest_mcap, ?2), ?2),
+        highest_price = MAX(COALESCE(highest_price, ?3), ?3),
+        confirmed_scan_mcap = CASE WHEN COALESCE(scan_confirmation_count, 0) < 3
+                                   THEN ?2 ELSE COALESCE(confirmed_scan_mcap, ?2) END,
+        scan_confirmation_count = CASE WHEN COALESCE(scan_confirmation_count, 0) < 3
+                                       THEN COALESCE(scan_confirmation_count, 0) + 1
+                                       ELSE scan_confirmation_count END
+    WHERE contract_address = ?1 AND is_active = 1
+'''
+
+# Each row's multiplier and a trend code (0 down, 1 flat, 2 up) for tokens aliased as t,
+# so the list views need no per-row arithmetic.
+TOKEN_TREND_COLUMNS = '''
+           CASE WHEN t.initial_mcap > 0 THEN COALESCE(t.current_mcap, 0) / t.initial_mcap
+                WHEN t.initial_mcap = 0 THEN COALESCE(t.current_mcap, 0)
+                ELSE 0 END AS multiplier,
+           CASE WHEN t.initial_mcap > 0 THEN
+                    CASE WHEN COALESCE(t.current_mcap, 0) > t.initial_mcap THEN 2
+                         WHEN COALESCE(t.current_mcap, 0) < t.initial_mcap THEN 0 ELSE 1 END
+                WHEN t.initial_mcap = 0 THEN
+                    CASE WHEN COALESCE(t.current_mcap, 0) > 1 THEN 2
+                         WHEN COALESCE(t.current_mcap, 0) < 1 THEN 0 ELSE 1 END
+                ELSE 0 END AS trend
+'''
+
+# Parameter: ?1 chat_id. Active tokens, newest first, with TOKEN_TREND_COLUMNS.
+CHAT_TOKENS_SQL = '''
+    SELECT t.*, g.chat_title, g.chat_type,''' + TOKEN_TREND_COLUMNS + '''
+    FROM tokens t
+    LEFT JOIN groups g ON t.group_id = g.id
+    WHERE t.chat_id = ?1 AND t.is_active = TRUE
+    ORDER BY t.detected_at DESC
+'''
+
+# Parameters: ?1 chat_id, ?2 limit, ?3 offset. One page of CHAT_TOKENS_SQL.
+CHAT_TOKENS_PAGE_SQL = CHAT_TOKENS_SQL + '''    LIMIT ?2 OFFSET ?3
+'''
+
+# Parameter: ?1 chat_id
+TOKEN_STATS_SQL = '''
+    SELECT 
+        COUNT(*) as total_tokens,
+        COUNT(CASE WHEN is_active = TRUE THEN 1 END) as active_tokens,
+        COUNT(CASE WHEN current_mcap > initial_mcap THEN 1 END) as pumping_tokens,
+        COUNT(CASE WHEN current_mcap < initial_mcap THEN 1 END) as dumping_tokens,
+        AVG(current_mcap / initial_mcap) as avg_multiplier,
+        MAX(current_mcap / initial_mcap) as max_multiplier
+    FROM tokens 
+    WHERE chat_id = ?1
+'''
+
+def _stats_from_row(row) -> Dict:
+    """Turn a TOKEN_STATS_SQL row into the stats dict the bot renders."""
+    if row:
+        return {
+            'total_tokens': row[0] or 0,
+            'active_tokens': row[1] or 0,
+            'pumping_tokens': row[2] or 0,
+            'dumping_tokens': row[3] or 0,
+            'avg_multiplier': round(row[4] or 1.0, 2),
+            'max_multiplier': round(row[5] or 1.0, 2)
+        }
+    return {
+        'total_tokens': 0,
+        'active_tokens': 0,
+        'pumping_tokens': 0,
+        'dumping_tokens': 0,
+        'avg_multiplier': 1.0,
+        'max_multiplier': 1.0
+    }
+
+# Parameters: ?1 contract_address, ?2 symbol, ?3 name, ?4 initial_mcap, ?5 initial_price,
+# ?6 chat_id, ?7 group_id, ?8 message_id, ?9 platform, ?10 source_api, ?11 dex_name,
+# ?12 pair_address, ?13 liquidity_usd, ?14 volume_24h, ?15 price_change_24h
+INSERT_TOKEN_SQL = '''
+    INSERT OR REPLACE INTO tokens 
+    (contract_address, symbol, name, initial_mcap, current_mcap, 
+     initial_price, current_price, lowest_mcap, lowest_price,
+     highest_mcap, highest_price, chat_id, group_id, message_id, platform,
+     source_api, dex_name, pair_address, liquidity_usd, volume_24h, price_change_24h,
+     confirmed_scan_mcap, scan_confirmation_count)
+    VALUES (?1, ?2, ?3, ?4, ?4, ?5, ?5, ?4, ?5, ?4, ?5, ?6, ?7, ?8, ?9,
+            ?10, ?11, ?12, ?13, ?14, ?15, ?4, 1)
+'''
+
+# Characters of a Solana address; a callback's address prefix must use only these
+BASE58_ALPHABET = frozenset('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
+
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once to the shared handler connection. journal_mode=WAL persists in the database
+# file; the rest (cache_size is negative = KiB) only last as long as the connection.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Most queued writes the writer commits in one BEGIN IMMEDIATE transaction
+WRITE_BATCH_SIZE = 64
+
 class Database:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None  # long-lived connection opened by apply_pragmas
+        self._write_queue: Optional[asyncio.Queue] = None  # (sql, params, many, future) for the writer task
+        self._writer_task: Optional[asyncio.Task] = None
         self.backup_dir = Path(db_path).parent / "backups"
         self.backup_dir.mkdir(exist_ok=True)
         
@@ -199,6 +314,114 @@ class Database:
         await self.save_all_group_data()
         print("💾 All group data auto-saved")
         
+    async def apply_pragmas(self):
+        """Open the shared connection used by the bot's command handlers and tune it."""
+        if self._conn is None:
+            self._conn = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+            self._conn.row_factory = aiosqlite.Row
+        for pragma in CONNECTION_PRAGMAS:
+            await self._conn.execute(pragma)
+    
+    def start_writer(self):
+        """Serialize register/add/remove writes through one task on the shared connection."""
+        if self._conn is None:
+            raise RuntimeError("apply_pragmas() must open the shared connection first")
+        if self._writer_task is None:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _writer_loop(self):
+        """Commit queued writes in batches of up to WRITE_BATCH_SIZE, one transaction each."""
+        while True:
+            batch = [await self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+            results = []
+            try:
+                await self._conn.execute("BEGIN IMMEDIATE")
+                for sql, params, many, _ in batch:
+                    try:
+                        if many:
+                            results.append(await self._execute_all(sql, params))
+                        else:
+                            cursor = await self._conn.execute(sql, params)
+                            results.append((cursor.rowcount, cursor.lastrowid))
+                    except Exception as e:  # only this item is undone; the batch still commits
+                        results.append(e)
+                await self._conn.commit()
+            except Exception as e:
+                if self._conn.in_transaction:
+                    await self._conn.rollback()
+                results = [e] * len(batch)
+            for (_, _, _, future), result in zip(batch, results):
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                self._write_queue.task_done()
+    
+    async def _write(self, sql: str, params) -> Tuple[int, Optional[int]]:
+        """Run one write statement and return its (rowcount, lastrowid)."""
+        if self._writer_task is None:
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute(sql, params)
+                await db.commit()
+                return cursor.rowcount, cursor.lastrowid
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((sql, params, False, future))
+        return await future
+    
+    async def _write_many(self, sql: str, rows: List[tuple]) -> List[int]:
+        """Run one write statement per row, all or none of them, and return each row's lastrowid."""
+        if self._writer_task is None:
+            async with aiosqlite.connect(self.db_path) as db:
+                # Leaving without commit() rolls every row back
+                row_ids = []
+                for row in rows:
+                    cursor = await db.execute(sql, row)
+                    row_ids.append(cursor.lastrowid or 0)
+                await db.commit()
+                return row_ids
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((sql, rows, True, future))
+        return await future
+    
+    async def _execute_all(self, sql: str, rows: List[tuple]) -> List[int]:
+        """Writer side of _write_many: a savepoint undoes every row if one of them fails."""
+        await self._conn.execute("SAVEPOINT write_many")
+        try:
+            row_ids = []
+            for row in rows:
+                cursor = await self._conn.execute(sql, row)
+                row_ids.append(cursor.lastrowid or 0)
+        except Exception:
+            await self._conn.execute("ROLLBACK TO write_many")
+            raise
+        finally:
+            await self._conn.execute("RELEASE write_many")
+        return row_ids
+    
+    async def close(self):
+        """Flush queued writes and close the shared connection, if one was opened."""
+        if self._writer_task is not None:
+            await self._write_queue.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+    
+    @asynccontextmanager
+    async def _connection(self):
+        """Yield the shared connection, or a short-lived one when apply_pragmas hasn't run."""
+        if self._conn is not None:
+            yield self._conn
+            return
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            yield db
+    
     async def init_db(self):
         """Initialize the database with enhanced tables for group-specific tracking."""
         async with aiosqlite.connect(self.db_path) as db:
@@ -299,6 +522,11 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_tokens_chat ON tokens(chat_id)
             ''')
             
+            # get_token_by_contract: a chat's address prefix is a range scan on this
+            await db.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tokens_chat_contract ON tokens(chat_id, contract_address)
+            ''')
+            
             await db.execute('''
                 CREATE INDEX IF NOT EXISTS idx_groups_chat ON groups(chat_id)
             ''')
@@ -307,13 +535,20 @@ class Database:
     
     async def register_group(self, chat_id: int, chat_title: Optional[str] = None, chat_type: str = 'private') -> int:
         """Register a new group/chat for tracking."""
+        _, lastrowid = await self._write('''
+            INSERT OR REPLACE INTO groups (chat_id, chat_title, chat_type)
+            VALUES (?, ?, ?)
+        ''', (chat_id, chat_title or f"Chat {chat_id}", chat_type))
+        return lastrowid or 0
+    
+    async def get_registered_groups(self) -> Dict[int, tuple]:
+        """Get chat_id -> (chat_title, chat_type) for every registered group."""
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute('''
-                INSERT OR REPLACE INTO groups (chat_id, chat_title, chat_type)
-                VALUES (?, ?, ?)
-            ''', (chat_id, chat_title or f"Chat {chat_id}", chat_type))
-            await db.commit()
-            return cursor.lastrowid or 0
+                SELECT chat_id, chat_title, chat_type FROM groups
+            ''')
+            rows = await cursor.fetchall()
+            return {chat_id: (chat_title, chat_type) for chat_id, chat_title, chat_type in rows}
     
     async def get_group_settings(self, chat_id: int) -> Dict:
         """Get group-specific settings."""
@@ -344,32 +579,53 @@ class Database:
                        pair_address: Optional[str] = None, liquidity_usd: float = 0,
                        volume_24h: float = 0, price_change_24h: float = 0) -> int:
         """Add a new token to tracking with comprehensive data"""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Get or create group
+        # Get or create group
+        async with self._connection() as db:
             group_cursor = await db.execute('''
                 SELECT id FROM groups WHERE chat_id = ?
             ''', (chat_id,))
             group_row = await group_cursor.fetchone()
-            group_id = group_row[0] if group_row else None
-            
-            if not group_id:
-                group_id = await self.register_group(chat_id)
-            
-            cursor = await db.execute('''
-                INSERT OR REPLACE INTO tokens 
-                (contract_address, symbol, name, initial_mcap, current_mcap, 
-                 initial_price, current_price, lowest_mcap, lowest_price,
-                 highest_mcap, highest_price, chat_id, group_id, message_id, platform,
-                 source_api, dex_name, pair_address, liquidity_usd, volume_24h, price_change_24h,
-                 confirmed_scan_mcap, scan_confirmation_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (contract_address, symbol, name, initial_mcap, initial_mcap,
-                  initial_price, initial_price, initial_mcap, initial_price,
-                  initial_mcap, initial_price, chat_id, group_id, message_id, platform,
-                  source_api, dex_name, pair_address, liquidity_usd, volume_24h, price_change_24h,
-                  initial_mcap, 1))
-            await db.commit()
-            return cursor.lastrowid or 0
+        group_id = group_row[0] if group_row else None
+        
+        if not group_id:
+            group_id = await self.register_group(chat_id)
+        
+        _, lastrowid = await self._write(INSERT_TOKEN_SQL, (
+            contract_address, symbol, name, initial_mcap, initial_price, chat_id, group_id,
+            message_id, platform, source_api, dex_name, pair_address, liquidity_usd,
+            volume_24h, price_change_24h
+        ))
+        return lastrowid or 0
+    
+    async def add_tokens_bulk(self, tokens: List[Dict]) -> List[int]:
+        """Add several tokens in one transaction and return their ids; each dict takes add_token's keyword arguments."""
+        if not tokens:
+            return []
+        
+        # Get or create each chat's group once
+        chat_ids = {token['chat_id'] for token in tokens}
+        group_ids = {}
+        async with self._connection() as db:
+            for chat_id in chat_ids:
+                group_cursor = await db.execute('''
+                    SELECT id FROM groups WHERE chat_id = ?
+                ''', (chat_id,))
+                group_row = await group_cursor.fetchone()
+                if group_row:
+                    group_ids[chat_id] = group_row[0]
+        for chat_id in chat_ids - group_ids.keys():
+            group_ids[chat_id] = await self.register_group(chat_id)
+        
+        rows = [(
+            token['contract_address'], token['symbol'], token['name'],
+            token['initial_mcap'], token['initial_price'], token['chat_id'],
+            group_ids[token['chat_id']], token.get('message_id'), token.get('platform'),
+            token.get('source_api', 'dexscreener'), token.get('dex_name'), token.get('pair_address'),
+            token.get('liquidity_usd', 0), token.get('volume_24h', 0), token.get('price_change_24h', 0)
+        ) for token in tokens]
+        
+        # One write-queue item: every row is saved, or none is
+        return await self._write_many(INSERT_TOKEN_SQL, rows)
     
     async def update_token_price(self, contract_address: str, current_mcap: float, 
                                 current_price: float):
@@ -472,8 +728,7 @@ class Database:
     
     async def get_tokens_for_chat(self, chat_id: int, active_only: bool = True) -> List[Dict]:
         """Get all tokens tracked in a specific chat/group"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             where_clause = "WHERE t.chat_id = ?"
             params = [chat_id]
             
@@ -490,21 +745,58 @@ class Database:
             rows = await cursor.fetchall()
             return [dict(row) for row in rows]
     
-    async def remove_token(self, contract_address: str, chat_id: int) -> bool:
-        """Remove a token from tracking for a specific chat"""
+    async def get_tracked_contracts(self) -> Dict[int, set]:
+        """Get chat_id -> set of actively tracked contract addresses."""
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute('''
-                UPDATE tokens SET is_active = FALSE 
-                WHERE contract_address = ? AND chat_id = ?
+                SELECT chat_id, contract_address FROM tokens WHERE is_active = TRUE
+            ''')
+            # fetchall is one hop to the connection thread; iterating the cursor costs one per row
+            tracked = {}
+            for chat_id, contract_address in await cursor.fetchall():
+                tracked.setdefault(chat_id, set()).add(contract_address)
+            return tracked
+    
+    async def get_token_by_contract(self, chat_id: int, contract_address: str) -> Optional[Dict]:
+        """Get a chat's active token by contract address, or by the address prefix a remove button carries"""
+        # Only a short, purely base58 argument is a prefix; base58 has no GLOB metacharacters, so the
+        # pattern is an indexed range scan. Anything else from callback data must match exactly.
+        if 0 < len(contract_address) < 43 and BASE58_ALPHABET.issuperset(contract_address):
+            match, value = 'contract_address GLOB ?', contract_address + '*'
+        else:
+            match, value = 'contract_address = ?', contract_address
+        async with self._connection() as db:
+            cursor = await db.execute(f'''
+                SELECT * FROM tokens
+                WHERE {match} AND chat_id = ? AND is_active = TRUE
+                LIMIT 1
+            ''', (value, chat_id))
+            row = await cursor.fetchone()
+            return dict(row) if row else None
+    
+    async def is_tracked(self, chat_id: int, contract_address: str) -> bool:
+        """Check whether a contract is actively tracked in a chat"""
+        async with self._connection() as db:
+            cursor = await db.execute('''
+                SELECT 1 FROM tokens
+                WHERE contract_address = ? AND chat_id = ? AND is_active = TRUE
+                LIMIT 1
             ''', (contract_address, chat_id))
-            await db.commit()
-            
-            # Auto-save after token removal
-            if cursor.rowcount > 0:
-                await self.auto_save_on_update()
-                print(f"💾 Auto-saved after removing token {contract_address[:8]}... from chat {chat_id}")
-            
-            return cursor.rowcount > 0
+            return await cursor.fetchone() is not None
+    
+    async def remove_token(self, contract_address: str, chat_id: int) -> bool:
+        """Remove a token from tracking for a specific chat"""
+        rowcount, _ = await self._write('''
+            UPDATE tokens SET is_active = FALSE 
+            WHERE contract_address = ? AND chat_id = ?
+        ''', (contract_address, chat_id))
+        
+        # Auto-save after token removal
+        if rowcount > 0:
+            await self.auto_save_on_update()
+            print(f"💾 Auto-saved after removing token {contract_address[:8]}... from chat {chat_id}")
+        
+        return rowcount > 0
     
     async def permanently_delete_token(self, contract_address: str, chat_id: int) -> bool:
         """Permanently delete a token from tracking for a specific chat"""
@@ -524,45 +816,31 @@ class Database:
     
     async def get_token_stats(self, chat_id: int) -> Dict:
         """Get token tracking statistics for a chat"""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute('''
-                SELECT 
-                    COUNT(*) as total_tokens,
-                    COUNT(CASE WHEN is_active = TRUE THEN 1 END) as active_tokens,
-                    COUNT(CASE WHEN current_mcap > initial_mcap THEN 1 END) as pumping_tokens,
-                    COUNT(CASE WHEN current_mcap < initial_mcap THEN 1 END) as dumping_tokens,
-                    AVG(current_mcap / initial_mcap) as avg_multiplier,
-                    MAX(current_mcap / initial_mcap) as max_multiplier
-                FROM tokens 
-                WHERE chat_id = ?
-            ''', (chat_id,))
-            row = await cursor.fetchone()
-            
-            if row:
-                return {
-                    'total_tokens': row[0] or 0,
-                    'active_tokens': row[1] or 0,
-                    'pumping_tokens': row[2] or 0,
-                    'dumping_tokens': row[3] or 0,
-                    'avg_multiplier': round(row[4] or 1.0, 2),
-                    'max_multiplier': round(row[5] or 1.0, 2)
-                }
-            return {
-                'total_tokens': 0,
-                'active_tokens': 0,
-                'pumping_tokens': 0,
-                'dumping_tokens': 0,
-                'avg_multiplier': 1.0,
-                'max_multiplier': 1.0
-            }
+        async with self._connection() as db:
+            cursor = await db.execute(TOKEN_STATS_SQL, (chat_id,))
+            return _stats_from_row(await cursor.fetchone())
+    
+    async def get_tokens_with_stats(self, chat_id: int) -> Tuple[List[Dict], Dict]:
+        """Get a chat's active tokens (with multiplier and trend) and its stats over one connection"""
+        async with self._connection() as db:
+            cursor = await db.execute(CHAT_TOKENS_SQL, (chat_id,))
+            tokens = [dict(row) for row in await cursor.fetchall()]
+            cursor = await db.execute(TOKEN_STATS_SQL, (chat_id,))
+            return tokens, _stats_from_row(await cursor.fetchone())
+    
+    async def get_tokens_for_chat_page(self, chat_id: int, limit: int, offset: int = 0) -> List[Dict]:
+        """Get one newest-first page of a chat's active tokens (with multiplier and trend)"""
+        async with self._connection() as db:
+            cursor = await db.execute(CHAT_TOKENS_PAGE_SQL, (chat_id, limit, offset))
+            return [dict(row) for row in await cursor.fetchall()]
     
     async def search_tokens(self, chat_id: int, query: str) -> List[Dict]:
-        """Search tokens by symbol, name, or contract address"""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        """Search tokens by symbol, name, or contract address (with multiplier and trend)"""
+        async with self._connection() as db:
             search_pattern = f"%{query}%"
             cursor = await db.execute('''
-                SELECT * FROM tokens 
+                SELECT t.*,''' + TOKEN_TREND_COLUMNS + '''
+                FROM tokens t
                 WHERE chat_id = ? AND is_active = TRUE 
                 AND (symbol LIKE ? OR name LIKE ? OR contract_address LIKE ?)
                 ORDER BY detected_at DESC
@@ -12,7 +12,7 @@ from datetime import datetime
 # Add the project directory to the path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from token_tracker_enhanced import TokenTracker
+from token_tracker_enhanced import TokenTracker, TokenRecord
 import config
 
 class IntegrationDebugBot:
@@ -55,21 +55,21 @@ async def debug_cross_group_integration():
         print("1️⃣ Setting up token in all groups...")
         for i, group_id in enumerate(groups, 1):
             tracker.tracking_tokens_by_group[group_id] = {
-                test_token: {
-                    'name': 'Integration Test Token',
-                    'symbol': 'ITT',
-                    'initial_price': 0.002,
-                    'initial_mcap': initial_mcap,
-                    'confirmed_scan_mcap': initial_mcap,
-                    'current_price': 0.002,
-                    'current_mcap': initial_mcap,
-                    'highest_mcap': initial_mcap,
-                    'lowest_mcap': initial_mcap,
-                    'chat_id': group_id,
-                    'message_id': i,
-                    'last_updated': datetime.now(),
-                    'current_loss_percentage': 0.0
-                }
+                test_token: TokenRecord(
+                    name='Integration Test Token',
+                    symbol='ITT',
+                    initial_price=0.002,
+                    initial_mcap=initial_mcap,
+                    confirmed_scan_mcap=initial_mcap,
+                    current_price=0.002,
+                    current_mcap=initial_mcap,
+                    highest_mcap=initial_mcap,
+                    lowest_mcap=initial_mcap,
+                    chat_id=group_id,
+                    message_id=i,
+                    last_updated=datetime.now(),
+                    current_loss_percentage=0.0
+                )
             }
             print(f"   ✅ Group {i}: Token added")
         
@@ -112,8 +112,8 @@ async def debug_cross_group_integration():
         print(f"\n4️⃣ Token Data Verification:")
         for i, group_id in enumerate(groups, 1):
             token_data = tracker.tracking_tokens_by_group[group_id][test_token]
-            current_mcap = token_data['current_mcap']
-            loss_pct = token_data.get('current_loss_percentage', 'N/A')
+            current_mcap = token_data.current_mcap
+            loss_pct = token_data.current_loss_percentage
             print(f"   Group {i}: ${current_mcap:,.0f} (Loss: {loss_pct}%)")
         
         success = len(debug_bot.alerts) > 0 and len(set(alert['group'] for alert in debug_bot.alerts)) == len(groups)
@@ -12,7 +12,7 @@ from datetime import datetime
 # Add the project directory to the path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from token_tracker_enhanced import TokenTracker
+from token_tracker_enhanced import TokenTracker, TokenRecord
 import config
 
 class DebugBot:
@@ -51,21 +51,21 @@ async def debug_loss_alerts():
     
     # Setup token
     tracker.tracking_tokens_by_group[test_group] = {
-        test_token: {
-            'name': 'Debug Token',
-            'symbol': 'DEBUG',
-            'initial_price': 0.001,
-            'initial_mcap': initial_mcap,
-            'confirmed_scan_mcap': initial_mcap,
-            'current_price': 0.0003,
-            'current_mcap': new_mcap,
-            'highest_mcap': initial_mcap,
-            'lowest_mcap': new_mcap,
-            'chat_id': test_group,
-            'message_id': 1,
-            'last_updated': datetime.now(),
-            'current_loss_percentage': -70.0  # Pre-calculated
-        }
+        test_token: TokenRecord(
+            name='Debug Token',
+            symbol='DEBUG',
+            initial_price=0.001,
+            initial_mcap=initial_mcap,
+            confirmed_scan_mcap=initial_mcap,
+            current_price=0.0003,
+            current_mcap=new_mcap,
+            highest_mcap=initial_mcap,
+            lowest_mcap=new_mcap,
+            chat_id=test_group,
+            message_id=1,
+            last_updated=datetime.now(),
+            current_loss_percentage=-70.0  # Pre-calculated
+        )
     }
     
     print("1️⃣ Manually testing loss alert logic...")
@@ -74,8 +74,8 @@ async def debug_loss_alerts():
     token_data = tracker.tracking_tokens_by_group[test_group][test_token]
     
     # Calculate loss percentage
-    baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-    current_mcap = token_data['current_mcap']
+    baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
+    current_mcap = token_data.current_mcap
     loss_percentage = ((current_mcap - baseline_mcap) / baseline_mcap) * 100
     
     print(f"   📊 Calculated loss: {loss_percentage:.1f}%")
@@ -98,7 +98,7 @@ async def debug_loss_alerts():
     print(f"   📋 Should trigger: {triggered_thresholds}")
     
     # Check sent alerts
-    sent_loss_alerts = token_data.get('loss_alerts_sent', '[]')
+    sent_loss_alerts = token_data.loss_alerts_sent
     print(f"   📝 Sent alerts JSON: {sent_loss_alerts}")
     
     try:
@@ -13,7 +13,7 @@ import json
 # Add the project directory to the path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from token_tracker_enhanced import TokenTracker
+from token_tracker_enhanced import TokenTracker, TokenRecord
 import config
 
 class StatePollutionBot:
@@ -86,21 +86,21 @@ async def debug_state_pollution():
         print("1️⃣ Setting up token in all groups...")
         for i, group_id in enumerate(groups, 1):
             tracker.tracking_tokens_by_group[group_id] = {
-                test_token: {
-                    'name': 'State Test Token',
-                    'symbol': 'STATE',
-                    'initial_price': 0.01,
-                    'initial_mcap': initial_mcap,
-                    'confirmed_scan_mcap': initial_mcap,
-                    'current_price': 0.01,
-                    'current_mcap': initial_mcap,
-                    'highest_mcap': initial_mcap,
-                    'lowest_mcap': initial_mcap,
-                    'chat_id': group_id,
-                    'message_id': i,
-                    'last_updated': datetime.now(),
-                    'current_loss_percentage': 0.0
-                }
+                test_token: TokenRecord(
+                    name='State Test Token',
+                    symbol='STATE',
+                    initial_price=0.01,
+                    initial_mcap=initial_mcap,
+                    confirmed_scan_mcap=initial_mcap,
+                    current_price=0.01,
+                    current_mcap=initial_mcap,
+                    highest_mcap=initial_mcap,
+                    lowest_mcap=initial_mcap,
+                    chat_id=group_id,
+                    message_id=i,
+                    last_updated=datetime.now(),
+                    current_loss_percentage=0.0
+                )
             }
             print(f"   ✅ Group {i}: Token added")
         
@@ -127,8 +127,8 @@ async def debug_state_pollution():
         print(f"\n   🔍 Token state after multiplier phase:")
         for i, group_id in enumerate(groups, 1):
             token_data = tracker.tracking_tokens_by_group[group_id][test_token]
-            sent_alerts = token_data.get('loss_alerts_sent', '[]')
-            print(f"      Group {i}: mcap=${token_data['current_mcap']:,.0f}, loss_alerts_sent={sent_alerts}")
+            sent_alerts = token_data.loss_alerts_sent
+            print(f"      Group {i}: mcap=${token_data.current_mcap:,.0f}, loss_alerts_sent={sent_alerts}")
         
         print("\n3️⃣ PHASE 2: Testing loss alerts...")
         test_bot.set_phase('loss')
@@ -141,10 +141,10 @@ async def debug_state_pollution():
         print(f"   🔍 Token state BEFORE loss processing:")
         for i, group_id in enumerate(groups, 1):
             token_data = tracker.tracking_tokens_by_group[group_id][test_token]
-            baseline = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-            current = token_data['current_mcap']
+            baseline = token_data.confirmed_scan_mcap or token_data.initial_mcap
+            current = token_data.current_mcap
             loss_pct = ((current - baseline) / baseline) * 100 if baseline > 0 else 0
-            sent_alerts = token_data.get('loss_alerts_sent', '[]')
+            sent_alerts = token_data.loss_alerts_sent
             
             print(f"      Group {i}: baseline=${baseline:,.0f}, current=${current:,.0f}")
             print(f"               loss={loss_pct:.1f}%, sent_alerts={sent_alerts}")
@@ -160,10 +160,10 @@ async def debug_state_pollution():
         print(f"\n   🔍 Token state AFTER loss processing:")
         for i, group_id in enumerate(groups, 1):
             token_data = tracker.tracking_tokens_by_group[group_id][test_token]
-            baseline = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-            current = token_data['current_mcap']
+            baseline = token_data.confirmed_scan_mcap or token_data.initial_mcap
+            current = token_data.current_mcap
             loss_pct = ((current - baseline) / baseline) * 100 if baseline > 0 else 0
-            sent_alerts = token_data.get('loss_alerts_sent', '[]')
+            sent_alerts = token_data.loss_alerts_sent
             
             print(f"      Group {i}: baseline=${baseline:,.0f}, current=${current:,.0f}")
             print(f"               loss={loss_pct:.1f}%, sent_alerts={sent_alerts}")
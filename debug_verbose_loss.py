@@ -13,7 +13,7 @@ import json
 # Add the project directory to the path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from token_tracker_enhanced import TokenTracker
+from token_tracker_enhanced import TokenTracker, TokenRecord
 import config
 
 class VerboseTestBot:
@@ -29,13 +29,13 @@ class VerboseTestBot:
 # Monkey patch the loss alert method to add debug output
 original_check_loss_alerts = TokenTracker._check_loss_alerts_for_group
 
-async def debug_check_loss_alerts_for_group(self, contract_address: str, token_data: dict, chat_id: int):
+async def debug_check_loss_alerts_for_group(self, contract_address: str, token_data: TokenRecord, chat_id: int):
     """Debug version of loss alert checking"""
     print(f"\n🔍 DEBUG: Checking loss alerts for {contract_address} in group {chat_id}")
     
     try:
-        baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-        current_mcap = token_data['current_mcap']
+        baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
+        current_mcap = token_data.current_mcap
         
         print(f"   📊 Baseline: ${baseline_mcap:,.0f}")
         print(f"   📊 Current: ${current_mcap:,.0f}")
@@ -56,7 +56,7 @@ async def debug_check_loss_alerts_for_group(self, contract_address: str, token_d
         
         # Load sent loss alerts
         try:
-            sent_loss_alerts_str = token_data.get('loss_alerts_sent', '[]')
+            sent_loss_alerts_str = token_data.loss_alerts_sent
             sent_loss_alerts = json.loads(sent_loss_alerts_str)
             print(f"   📝 Sent alerts: {sent_loss_alerts}")
         except Exception as e:
@@ -84,7 +84,7 @@ async def debug_check_loss_alerts_for_group(self, contract_address: str, token_d
                 
                 # Mark as sent
                 sent_loss_alerts.append(threshold)
-                token_data['loss_alerts_sent'] = json.dumps(sent_loss_alerts)
+                token_data.loss_alerts_sent = json.dumps(sent_loss_alerts)
                 
                 # Update database
                 await self._update_loss_alerts_db(contract_address, sent_loss_alerts)
@@ -132,21 +132,21 @@ async def test_loss_alert_debugging():
         
         # Set up token data
         tracker.tracking_tokens_by_group[test_group] = {
-            test_token: {
-                'name': 'Debug Loss Token',
-                'symbol': 'DLT',
-                'initial_price': 0.005,
-                'initial_mcap': initial_mcap,
-                'confirmed_scan_mcap': initial_mcap,
-                'current_price': 0.001,
-                'current_mcap': current_mcap,
-                'highest_mcap': initial_mcap,
-                'lowest_mcap': current_mcap,
-                'chat_id': test_group,
-                'message_id': 1,
-                'last_updated': datetime.now(),
-                'current_loss_percentage': -80.0
-            }
+            test_token: TokenRecord(
+                name='Debug Loss Token',
+                symbol='DLT',
+                initial_price=0.005,
+                initial_mcap=initial_mcap,
+                confirmed_scan_mcap=initial_mcap,
+                current_price=0.001,
+                current_mcap=current_mcap,
+                highest_mcap=initial_mcap,
+                lowest_mcap=current_mcap,
+                chat_id=test_group,
+                message_id=1,
+                last_updated=datetime.now(),
+                current_loss_percentage=-80.0
+            )
         }
         
         # Test the cross-group alert method
@@ -12,7 +12,7 @@ from datetime import datetime
 # Add the project directory to the path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from token_tracker_enhanced import TokenTracker
+from token_tracker_enhanced import TokenTracker, TokenRecord
 
 class DemoBot:
     """Demo bot to show cross-group functionality"""
@@ -61,21 +61,21 @@ async def demonstrate_fix():
         (group_signals, "Signals")
     ], 1):
         tracker.tracking_tokens_by_group[group_id] = {
-            demo_token: {
-                'name': 'Demo Token',
-                'symbol': 'DEMO',
-                'initial_price': 0.001,
-                'initial_mcap': 1000000,  # $1M
-                'confirmed_scan_mcap': 1000000,
-                'current_price': 0.001,
-                'current_mcap': 1000000,
-                'highest_mcap': 1000000,
-                'lowest_mcap': 1000000,
-                'chat_id': group_id,
-                'message_id': i,
-                'last_updated': datetime.now(),
-                'current_loss_percentage': 0.0
-            }
+            demo_token: TokenRecord(
+                name='Demo Token',
+                symbol='DEMO',
+                initial_price=0.001,
+                initial_mcap=1000000,  # $1M
+                confirmed_scan_mcap=1000000,
+                current_price=0.001,
+                current_mcap=1000000,
+                highest_mcap=1000000,
+                lowest_mcap=1000000,
+                chat_id=group_id,
+                message_id=i,
+                last_updated=datetime.now(),
+                current_loss_percentage=0.0
+            )
         }
         print(f"   ✅ {group_name} Group: ${1000000:,.0f} @ $0.001")
     
@@ -100,8 +100,8 @@ async def demonstrate_fix():
         (group_signals, "Signals")
     ]:
         token_data = tracker.tracking_tokens_by_group[group_id][demo_token]
-        current_mcap = token_data['current_mcap']
-        current_price = token_data['current_price']
+        current_mcap = token_data.current_mcap
+        current_price = token_data.current_price
         
         status = "✅ UPDATED" if current_mcap == 3000000 else "❌ NOT UPDATED"
         print(f"   {status} {group_name} Group: ${current_mcap:,.0f} @ ${current_price}")
@@ -124,7 +124,7 @@ async def demonstrate_fix():
         (group_signals, "Signals")
     ]:
         token_data = tracker.tracking_tokens_by_group[group_id][demo_token]
-        print(f"      📊 {group_name}: ${token_data['current_mcap']:,.0f} @ ${token_data['current_price']}")
+        print(f"      📊 {group_name}: ${token_data.current_mcap:,.0f} @ ${token_data.current_price}")
     
     print()
     print("🎉 DEMONSTRATION COMPLETE!")
@@ -4,20 +4,11 @@ Enhanced Multi-Group Bot Launcher - Production Ready
 import asyncio
 import signal
 import sys
-from config import Config
+from config import Config, setup_logging
 from token_tracker_enhanced import TokenTracker
 from database import Database
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 class EnhancedSolanaBot:
@@ -88,6 +79,8 @@ async def main():
     print(f"🔄 Alert cooldown: {Config.ALERT_COOLDOWN} seconds")
     print("=" * 50)
     
+    log_listener = setup_logging()
+    
     # Create and initialize bot
     bot = EnhancedSolanaBot()
     await bot.initialize()
@@ -116,6 +109,9 @@ async def main():
     finally:
         await bot.stop()
         logger.info("👋 Enhanced bot shutdown complete")
+        # Flush whatever is still queued to the log handlers
+        if log_listener:
+            log_listener.stop()
 
 if __name__ == "__main__":
     try:
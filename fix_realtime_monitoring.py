@@ -6,9 +6,12 @@ This script fixes the issue where only the first token gets real-time updates.
 import asyncio
 import sys
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+import aiosqlite
+import numpy as np
 sys.path.append('.')
-from database import Database
+from database import Database, STATEMENT_CACHE_SIZE, UPDATE_PRICES_SQL
 from solana_api import SolanaAPI
 from config import Config
 
@@ -16,57 +19,113 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SELECT_ACTIVE = '''
+    SELECT contract_address, symbol, name,
+           initial_mcap, current_mcap, initial_price, current_price,
+           chat_id, is_active, last_updated
+    FROM tokens
+    WHERE is_active = 1
+    ORDER BY last_updated DESC
+'''
+
+@dataclass(slots=True)
+class TokenState:
+    """Per-token metadata; live mcap/price are kept in FixedTokenTracker's arrays."""
+    contract_address: str
+    symbol: str
+    name: str
+    initial_mcap: float
+    initial_price: float
+    chat_id: int
+    last_updated: str
+
+def _row_to_token(row):
+    """Build the TokenState for one _SELECT_ACTIVE row."""
+    contract, symbol, name, initial_mcap, _, initial_price, _, chat_id, _, last_updated = row
+    return TokenState(contract, symbol, name, initial_mcap, initial_price, chat_id, last_updated)
+
+# Fold the WAL back into tokens.db every N cycles (~5 minutes at 5s per cycle)
+WAL_CHECKPOINT_EVERY = 60
+
+# Sleeps between API retries, and how long a token that still fails is skipped
+RETRY_BACKOFF = (0.2, 0.4)
+FAILURE_COOLDOWN = 10
+
 class FixedTokenTracker:
     def __init__(self):
         self.database = Database(Config.DATABASE_PATH)
         self.api = SolanaAPI()
-        self.tracking_tokens = {}  # contract -> token_data
+        self.tracking_tokens = {}  # contract -> TokenState
+        # Columnar live values: row i of mcap/price belongs to contracts[i]
+        self.contracts = []
+        self.idx = {}  # contract -> row
+        self.mcap = np.zeros(0, dtype=np.float64)
+        self.price = np.zeros(0, dtype=np.float64)
+        self._next_try_at = {}  # contract -> loop.time() before which it is skipped
+        # Long-lived connections: under WAL the reader never blocks on the writer
+        self._reader_conn = None
+        self._writer_conn = None
+        self._write_lock = asyncio.Lock()
         self.is_running = False
+    
+    async def _connect(self):
+        conn = await aiosqlite.connect(Config.DATABASE_PATH, cached_statements=STATEMENT_CACHE_SIZE)
+        await conn.execute_fetchall("PRAGMA journal_mode=WAL")
+        return conn
+    
+    async def open_connections(self):
+        """Open the shared reader and writer connections (no-op if already open)."""
+        if self._writer_conn is None:
+            self._writer_conn = await self._connect()
+        if self._reader_conn is None:
+            self._reader_conn = await self._connect()
+    
+    async def close(self):
+        """Close the HTTP session and both database connections."""
+        await self.api.close()
+        for conn in (self._reader_conn, self._writer_conn):
+            if conn is not None:
+                await conn.close()
+        self._reader_conn = self._writer_conn = None
+    
+    async def write(self, sql: str, params=()):
+        """Run a write on the single writer connection and commit it."""
+        async with self._write_lock:
+            await self._writer_conn.execute(sql, params)
+            await self._writer_conn.commit()
+    
+    async def write_many(self, sql: str, params_seq):
+        """Run a batched write on the single writer connection and commit it."""
+        async with self._write_lock:
+            await self._writer_conn.executemany(sql, params_seq)
+            await self._writer_conn.commit()
         
     async def load_all_active_tokens(self):
         """Load ALL active tokens from database regardless of group."""
         try:
             await self.database.init_db()
+            await self.open_connections()
             
             # Get all active tokens from all groups
-            import sqlite3
-            conn = sqlite3.connect('tokens.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT contract_address, symbol, name, 
-                       initial_mcap, current_mcap, initial_price, current_price,
-                       chat_id, is_active, last_updated
-                FROM tokens 
-                WHERE is_active = 1
-                ORDER BY last_updated DESC
-            ''')
-            
-            results = cursor.fetchall()
-            conn.close()
+            results = await self._reader_conn.execute_fetchall(_SELECT_ACTIVE)
             
             # Load into tracking dictionary
-            self.tracking_tokens = {}
-            for row in results:
-                contract, symbol, name, initial_mcap, current_mcap, initial_price, current_price, chat_id, is_active, last_updated = row
-                
-                self.tracking_tokens[contract] = {
-                    'contract_address': contract,
-                    'symbol': symbol,
-                    'name': name,
-                    'initial_mcap': initial_mcap,
-                    'current_mcap': current_mcap or initial_mcap,
-                    'initial_price': initial_price,
-                    'current_price': current_price or initial_price,
-                    'chat_id': chat_id,
-                    'last_updated': last_updated
-                }
+            self.tracking_tokens = {row[0]: _row_to_token(row) for row in results}
+            # current_mcap/current_price, falling back to the initial values
+            live_values = {row[0]: (row[4] or row[3], row[6] or row[5]) for row in results}
+            
+            # Current mcap/price live in parallel arrays so each cycle's change math is vectorized
+            count = len(live_values)
+            self.contracts = list(live_values)
+            self.idx = {contract: row for row, contract in enumerate(self.contracts)}
+            self.mcap = np.fromiter((mcap for mcap, _ in live_values.values()), dtype=np.float64, count=count)
+            self.price = np.fromiter((price for _, price in live_values.values()), dtype=np.float64, count=count)
             
-            logger.info(f"✅ Loaded {len(self.tracking_tokens)} active tokens for monitoring")
+            logger.info("✅ Loaded %d active tokens for monitoring", len(self.tracking_tokens))
             return len(self.tracking_tokens)
             
         except Exception as e:
-            logger.error(f"❌ Error loading tokens: {e}")
+            logger.error("❌ Error loading tokens: %s", e)
             return 0
     
     async def update_all_tokens_realtime(self):
@@ -75,64 +134,115 @@ class FixedTokenTracker:
             logger.warning("⚠️ No tokens loaded for monitoring")
             return
         
-        logger.info(f"🔄 Starting real-time update for {len(self.tracking_tokens)} tokens...")
+        logger.info("🔄 Starting real-time update for %d tokens...", len(self.tracking_tokens))
+        
+        # Reuse one HTTP session across cycles (no-op once it is open)
+        await self.api.start()
+        
+        # One timestamp for the whole cycle rather than one isoformat() per token
+        iso_now = datetime.now().isoformat()
         
         # Create tasks for parallel processing
         update_tasks = []
-        async with self.api:
-            for contract_address, token_data in self.tracking_tokens.items():
-                task = self.update_single_token(contract_address, token_data)
-                update_tasks.append(task)
+        for contract_address, token_data in self.tracking_tokens.items():
+            task = self.update_single_token(contract_address, token_data, iso_now)
+            update_tasks.append(task)
+        
+        # Execute all updates in parallel, collecting rows as each response lands
+        if update_tasks:
+            batch = []
+            unchanged = 0
+            for next_result in asyncio.as_completed(update_tasks):
+                try:
+                    result = await next_result
+                except Exception as e:
+                    logger.error("❌ Update task failed: %s", e)
+                    continue
+                # Tokens whose quote did not move come back as True and need no write
+                if result is True:
+                    unchanged += 1
+                elif result:
+                    batch.append(result)
             
-            # Execute all updates in parallel
-            if update_tasks:
-                results = await asyncio.gather(*update_tasks, return_exceptions=True)
-                
-                # Count successful updates
-                successful = sum(1 for r in results if r is True)
-                failed = len(results) - successful
-                
-                logger.info(f"✅ Update complete: {successful} successful, {failed} failed")
-            else:
-                logger.warning("⚠️ No update tasks created")
+            # Write every fresh price in one transaction instead of one commit per token
+            if batch:
+                self.apply_price_batch(batch)
+                await self.write_many(UPDATE_PRICES_SQL, batch)
+            
+            # Count successful updates
+            successful = len(batch) + unchanged
+            failed = len(update_tasks) - successful
+            
+            logger.info("✅ Update complete: %d successful (%d unchanged), %d failed", successful, unchanged, failed)
+        else:
+            logger.warning("⚠️ No update tasks created")
+    
+    def apply_price_batch(self, batch: list):
+        """Fold one cycle of (contract, mcap, price, timestamp) results into the live arrays."""
+        count = len(batch)
+        rows = np.fromiter((self.idx[item[0]] for item in batch), dtype=np.intp, count=count)
+        new_mcap = np.fromiter((item[1] for item in batch), dtype=np.float64, count=count)
+        new_price = np.fromiter((item[2] for item in batch), dtype=np.float64, count=count)
+        old_mcap = self.mcap[rows]
+        
+        # Calculate change for every token at once
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change_pct = (new_mcap - old_mcap) / old_mcap * 100.0
+        significant = (old_mcap > 0) & (np.abs(change_pct) > 1)
+        
+        if logger.isEnabledFor(logging.INFO):
+            for i in np.flatnonzero(significant):  # Log significant changes
+                logger.info("📈 %s: %+.2f%% ($%s → $%s)", self.tracking_tokens[batch[i][0]].symbol,
+                            change_pct[i], format(old_mcap[i], ',.0f'), format(new_mcap[i], ',.0f'))
+        
+        self.mcap[rows] = new_mcap
+        self.price[rows] = new_price
     
-    async def update_single_token(self, contract_address: str, token_data: dict):
-        """Update a single token with real-time price data."""
+    async def update_single_token(self, contract_address: str, token_data: TokenState, iso_now: str):
+        """Update a single token with real-time price data.
+        
+        Returns a (contract_address, mcap, price, iso_now) tuple for the batched DB write,
+        True if the quote is identical to the stored one, or False if no data
+        could be fetched. A lookup without market data is retried with backoff;
+        a token that still has none is skipped for FAILURE_COOLDOWN seconds.
+        """
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._next_try_at.get(contract_address, 0):
+            return False
+        
         try:
-            # Get current token info from API
-            current_info = await self.api.get_token_info(contract_address)
+            # get_token_info never raises: a failing provider shows up as a result without market data
+            for backoff in (*RETRY_BACKOFF, None):
+                current_info = await self.api.get_token_info(contract_address)
+                if current_info and current_info.get('market_cap', 0) > 0:
+                    break
+                if backoff is None:
+                    self._next_try_at[contract_address] = loop.time() + FAILURE_COOLDOWN
+                    logger.warning("⚠️ No data for %s (%.8s...)", token_data.symbol, contract_address)
+                    return False
+                await asyncio.sleep(backoff)
+            self._next_try_at.pop(contract_address, None)
             
-            if current_info and current_info.get('market_cap', 0) > 0:
-                new_mcap = current_info['market_cap']
-                new_price = current_info['price']
-                
-                # Calculate change
-                old_mcap = token_data['current_mcap']
-                if old_mcap > 0:
-                    change_pct = ((new_mcap - old_mcap) / old_mcap) * 100
-                    if abs(change_pct) > 1:  # Log significant changes
-                        logger.info(f"📈 {token_data['symbol']}: {change_pct:+.2f}% (${old_mcap:,.0f} → ${new_mcap:,.0f})")
-                
-                # Update in-memory tracking
-                token_data['current_mcap'] = new_mcap
-                token_data['current_price'] = new_price
-                token_data['last_updated'] = datetime.now().isoformat()
-                
-                # Update database immediately
-                await self.database.update_token_price(contract_address, new_mcap, new_price)
-                
+            new_mcap = current_info['market_cap']
+            new_price = current_info['price']
+            
+            # Nothing moved since the last poll - skip the DB write entirely
+            row = self.idx[contract_address]
+            if new_mcap == self.mcap[row] and new_price == self.price[row]:
                 return True
-            else:
-                logger.warning(f"⚠️ No data for {token_data['symbol']} ({contract_address[:8]}...)")
-                return False
+            
+            # Change detection and the live arrays are handled per batch in apply_price_batch
+            token_data.last_updated = iso_now
+            
+            return (contract_address, new_mcap, new_price, iso_now)
                 
         except Exception as e:
-            logger.error(f"❌ Error updating {contract_address}: {e}")
+            logger.error("❌ Error updating %s: %s", contract_address, e)
             return False
     
     async def start_continuous_monitoring(self, duration_minutes=5):
         """Start continuous real-time monitoring for specified duration."""
-        logger.info(f"🚀 Starting continuous monitoring for {duration_minutes} minutes...")
+        logger.info("🚀 Starting continuous monitoring for %s minutes...", duration_minutes)
         
         # Load tokens
         token_count = await self.load_all_active_tokens()
@@ -140,32 +250,41 @@ class FixedTokenTracker:
             logger.error("❌ No tokens to monitor!")
             return
         
+        # Open the HTTP session once so keep-alive connections survive between cycles
+        await self.api.start()
+        
         # Monitor continuously
         start_time = datetime.now()
         cycles = 0
         
-        while True:
-            cycle_start = datetime.now()
-            cycles += 1
-            
-            logger.info(f"🔄 Cycle {cycles}: Updating {len(self.tracking_tokens)} tokens...")
-            
-            # Update all tokens
-            await self.update_all_tokens_realtime()
-            
-            # Check if we should continue
-            elapsed_minutes = (datetime.now() - start_time).total_seconds() / 60
-            if elapsed_minutes >= duration_minutes:
-                logger.info(f"✅ Monitoring complete after {elapsed_minutes:.1f} minutes ({cycles} cycles)")
-                break
-            
-            # Wait for next cycle (5 seconds)
-            cycle_time = (datetime.now() - cycle_start).total_seconds()
-            sleep_time = max(0, 5 - cycle_time)
-            
-            if sleep_time > 0:
-                logger.info(f"⏱️ Cycle {cycles} took {cycle_time:.1f}s, sleeping {sleep_time:.1f}s...")
-                await asyncio.sleep(sleep_time)
+        try:
+            while True:
+                cycle_start = datetime.now()
+                cycles += 1
+                
+                logger.info("🔄 Cycle %d: Updating %d tokens...", cycles, len(self.tracking_tokens))
+                
+                # Update all tokens
+                await self.update_all_tokens_realtime()
+                
+                if cycles % WAL_CHECKPOINT_EVERY == 0:
+                    await self.write("PRAGMA wal_checkpoint(PASSIVE)")
+                
+                # Check if we should continue
+                elapsed_minutes = (datetime.now() - start_time).total_seconds() / 60
+                if elapsed_minutes >= duration_minutes:
+                    logger.info("✅ Monitoring complete after %.1f minutes (%d cycles)", elapsed_minutes, cycles)
+                    break
+                
+                # Wait for next cycle (5 seconds)
+                cycle_time = (datetime.now() - cycle_start).total_seconds()
+                sleep_time = max(0, 5 - cycle_time)
+                
+                if sleep_time > 0:
+                    logger.info("⏱️ Cycle %d took %.1fs, sleeping %.1fs...", cycles, cycle_time, sleep_time)
+                    await asyncio.sleep(sleep_time)
+        finally:
+            await self.close()
 
 async def test_fixed_monitoring():
     """Test the fixed monitoring system."""
@@ -193,4 +312,10 @@ async def test_fixed_monitoring():
     print("\\n✅ Fixed monitoring test complete!")
 
 if __name__ == "__main__":
+    # uvloop is optional; fall back to the stdlib loop when it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(test_fixed_monitoring())
@@ -4,7 +4,7 @@ Simple HTTP health check server for Railway deployment
 import asyncio
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import threading
-import json
+import orjson
 from datetime import datetime
 
 class HealthCheckHandler(BaseHTTPRequestHandler):
@@ -21,7 +21,7 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                 "version": "2.0.0"
             }
             
-            self.wfile.write(json.dumps(health_data).encode())
+            self.wfile.write(orjson.dumps(health_data))
         else:
             self.send_response(404)
             self.end_headers()
@@ -2,31 +2,416 @@
 import asyncio
 import logging
 import re
+import signal
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import escape
+import orjson
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
+from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, CallbackQueryHandler
-from config import Config
+from telegram.request import HTTPXRequest
+from config import Config, setup_logging
 from database import Database
 from token_tracker_enhanced import TokenTracker
 from solana_api import SolanaAPI
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Lookups with market data are reused for this long, so repeated pastes of a trending token skip the APIs
+TOKEN_INFO_TTL = 30
+TOKEN_INFO_CACHE_SIZE = 1024
+
+# Messages whose last list/stats render is remembered, so an unchanged refresh skips the edit
+RENDERED_CACHE_SIZE = 1024
+
+# /list, /stats and their menu buttons reuse a chat's rows for this long; adds and removes invalidate them
+CHAT_CACHE_TTL = 5
+
+# Pending processing-message edits; beyond this they are dropped rather than queued
+EDIT_QUEUE_SIZE = 1000
+
+# Edits sent to Telegram at once; the rest wait in the queue above, so a backlog fills it
+MAX_CONCURRENT_EDITS = 8
+
+# Threads behind loop.run_in_executor(None, ...) (DNS lookups, any blocking helper), instead of cpu_count + 4
+BLOCKING_IO_WORKERS = 4
+
+# getUpdates long-poll length in seconds (Telegram allows up to 50), so an idle bot rarely re-polls
+POLL_TIMEOUT = 50
+
+# Only these update types are requested; Telegram filters out the rest before they are sent
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY]
+
+# A chat's contract worker exits after this many idle seconds; the next contract starts a new one
+CHAT_WORKER_IDLE = 300
+
+# Updates handled at once; a slow token lookup in one chat no longer holds up every other chat
+CONCURRENT_UPDATES = 16
+
+# Users allowed to /stop tracking (empty: anyone); a set, resolved once at import
+ADMIN_USERS = frozenset(getattr(Config, 'ADMIN_USERS', ()) or ())
+
+# Per-chat token bucket for contract adds: bursts of ADD_BURST, refilled at ADD_RATE per second
+ADD_BURST = 5
+ADD_RATE = 1.0
+
+# List/stats buttons redraw from the database; presses in the same chat closer than this are dropped
+REFRESH_DEBOUNCE = 1.0
+REFRESH_CALLBACKS = frozenset({"menu_list", "menu_stats"})
+REFRESH_WAIT_TEXT = "Please wait a moment…"
+# Callback answer when a refresh finds the screen already showing the latest data
+UP_TO_DATE_TEXT = "Up to date ✅"
+
+# The inline token list shows this many tokens per page; later pages are "menu_list_p<n>" callbacks
+LIST_PAGE_SIZE = 6
+LIST_PAGE_PREFIX = "menu_list_p"
+
+# Reply templates for the add-token flow, built once instead of per contract
+ALREADY_TRACKED_TEMPLATE = "ℹ️ Token <code>{short}</code> is already being tracked in this group."
+
+RATE_LIMITED_MESSAGE = "🚫 <b>Slow down!</b> Too many tokens submitted in this group, try again in a few seconds."
+
+PROCESSING_TEMPLATE = (
+    "🔍 <b>Processing Token...</b>\n\n"
+    "📊 Fetching data from DexScreener, Birdeye, and Pump.fun\n"
+    "🔗 <code>{short}</code>"
+)
+
+NOT_FOUND_TEMPLATE = (
+    "❌ <b>Token Not Found</b>\n\n"
+    "Could not fetch data for:\n<code>{contract_address}</code>\n\n"
+    "This might be a new token or invalid address."
+)
+
+NO_MARKET_DATA_TEMPLATE = (
+    "⚠️ <b>No Market Data</b>\n\n"
+    "Token found but no trading data available:\n"
+    "• Symbol: {symbol}\n"
+    "• Name: {name}\n"
+    "• Source: {source}\n\n"
+    "Contract: <code>{contract_address}</code>"
+)
+
+CONFIRMATION_TEMPLATE = (
+    "✅ <b>Token Added Successfully!</b> ✅\n\n"
+    "📊 <b>{symbol}</b> - {name}\n\n"
+    "💰 <b>Market Cap:</b> ${market_cap:,.0f}\n"
+    "💵 <b>Price:</b> ${price:.8f}\n"
+    "🔗 <b>Contract:</b> <code>{contract_address}</code>\n\n"
+    "📈 <b>Trading Info:</b>\n"
+    "• DEX: {dex}\n"
+    "• Liquidity: ${liquidity_usd:,.0f}\n"
+    "• 24h Volume: ${volume_24h:,.0f}\n"
+    "• 24h Change: {price_change_24h:+.2f}%\n"
+    "• Data Source: {source}\n\n"
+    "🚀 <b>Alert Levels:</b>\n"
+    "• Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
+    "• Loss Protection: -50%, -70%, -85%, -95%\n"
+    "• Monitoring: Every 15 seconds ⚡\n\n"
+    "🎯 <b>Ready to catch the pump!</b> 🚀"
+)
+
+ERROR_TEMPLATE = (
+    "❌ <b>Error Processing Token</b>\n\n"
+    "An error occurred while processing:\n<code>{contract_address}</code>\n\n"
+    "Please try again or contact support."
+)
+
+# Indexed by the 'trend' code database.get_tokens_with_stats puts on each row
+TREND_EMOJI = ("📉", "➖", "🚀")
+
+# /list pages are cut before they reach this many characters (Telegram's limit is 4096)
+MAX_MESSAGE_LENGTH = 3500
+LIST_HEADER = "📊 <b>Tracked Tokens in This Group</b> 📊\n\n"
+LIST_CONTINUED_HEADER = "📊 <b>Tracked Tokens (continued)</b> 📊\n\n"
+LIST_TIPS = (
+    "💡 <b>Quick Actions:</b>\n"
+    "• Copy and send remove commands above\n"
+    "• Use <code>/search &lt;name&gt;</code> to find specific tokens\n"
+    "• Use <code>/menu</code> for more options"
+)
+
+# Static menu, help and info screens, built once at import instead of per button press
+WELCOME_TEMPLATE = (
+    "🚀 <b>Enhanced Multi-Group Solana Alert Bot</b> 🚀\n\n"
+    "🔍 <b>Perfect Token Detection</b> - Never miss a launch!\n"
+    "📊 <b>DexScreener Integration</b> - Real-time accurate data\n"
+    "👥 <b>Multi-Group Support</b> - Each group has independent tokens\n"
+    "⚡ <b>Real-Time Monitoring</b> - 10-second intervals\n"
+    "🗑️ <b>Auto-Remove Rugged</b> - Removes tokens below -80%\n\n"
+    "📋 <b>Group Info:</b>\n"
+    "• <b>Chat ID</b>: <code>{chat_id}</code>\n"
+    "• <b>Type</b>: {chat_type}\n"
+    "• <b>Title</b>: {chat_title}\n\n"
+    "📋 <b>Quick Commands:</b>\n"
+    "• <code>/menu</code> - Access all features\n"
+    "• <code>/list</code> - View this group's tokens\n"
+    "• <code>/stats</code> - Group statistics\n"
+    "• Send any Solana contract address to start tracking!\n\n"
+    "🎯 <b>Alert Types:</b>\n"
+    "🚀 Multiplier alerts: 2x, 3x, 5x, 8x, 10x, up to 100x!\n"
+    "📉 Loss alerts: -30%, -50%, -70%, -80%, -85%, -95%\n"
+    "�️ Auto-removal at -80% loss\n\n"
+    "🔥 <b>Ready to catch some moonshots!</b> 🔥"
+)
+
+START_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 Main Menu", callback_data="menu_main")],
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list"),
+     InlineKeyboardButton("📈 Statistics", callback_data="menu_stats")],
+    [InlineKeyboardButton("🗑️ Auto-Remove Info", callback_data="menu_autoremove")]
+])
+
+MAIN_MENU_TEXT = (
+    "🎛️ <b>Main Menu</b> 🎛️\n\n"
+    "Choose an option below to manage your Solana token tracking:\n\n"
+    "📊 <b>View Tokens</b> - See all tracked tokens in this group\n"
+    "📈 <b>Statistics</b> - Group performance overview\n"
+    "🔍 <b>Search</b> - Find specific tokens\n"
+    "❌ <b>Remove</b> - Stop tracking unwanted tokens\n"
+    "ℹ️ <b>Help</b> - Commands and usage guide\n"
+    "⚙️ <b>Status</b> - Bot performance information"
+)
+
+MAIN_MENU_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tracked Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 Group Statistics", callback_data="menu_stats")],
+    [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
+    [InlineKeyboardButton("❌ Remove Tokens", callback_data="menu_remove")],
+    [InlineKeyboardButton("ℹ️ Help & Info", callback_data="menu_help")],
+    [InlineKeyboardButton("⚙️ Bot Status", callback_data="menu_status")]
+])
+
+HELP_TEXT = (
+    "🆘 <b>Enhanced Solana Alert Bot Help</b> 🆘\n\n"
+    "<b>🔍 Perfect Token Detection:</b>\n"
+    "• Detects ALL Solana tokens from any launchpad\n"
+    "• Supports pump.fun, DexScreener, Birdeye links\n"
+    "• Recognizes contract addresses in any format\n"
+    "• Enhanced regex patterns for 100% accuracy\n\n"
+    "<b>📊 Data Sources (Priority Order):</b>\n"
+    "1. 🥇 DexScreener - Most comprehensive data\n"
+    "2. 🥈 Birdeye - Real-time price feeds\n"
+    "3. 🥉 Pump.fun - Meme token specialists\n\n"
+    "<b>👥 Group Features:</b>\n"
+    "• Each group tracks its own tokens\n"
+    "• Group-specific statistics and settings\n"
+    "• Individual token management per group\n\n"
+    "<b>⚡ Alert System:</b>\n"
+    "🚀 Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
+    "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
+    "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
+    "<b>🛠️ Commands:</b>\n"
+    "• <code>/menu</code> - Main control panel\n"
+    "• <code>/list</code> - Show all tracked tokens\n"
+    "• <code>/stats</code> - Group performance stats\n"
+    "• <code>/search &lt;query&gt;</code> - Find specific tokens\n"
+    "• <code>/remove &lt;address&gt;</code> - Stop tracking a token\n"
+    "• <code>/status</code> - Bot system status\n\n"
+    "<b>💡 Usage Tips:</b>\n"
+    "• Just paste any Solana contract address\n"
+    "• Works with URLs from any platform\n"
+    "• Each group maintains separate token lists\n"
+    "• Remove unwanted tokens easily\n\n"
+    "🔥 <b>Ready to catch every moonshot!</b> 🔥"
+)
+
+HELP_INFO_TEXT = (
+    "🆘 <b>Enhanced Solana Alert Bot Help</b> 🆘\n\n"
+    "<b>🔍 Perfect Token Detection:</b>\n"
+    "• Detects ALL Solana tokens from any launchpad\n"
+    "• Supports pump.fun, DexScreener, Birdeye links\n"
+    "• Recognizes contract addresses in any format\n\n"
+    "<b>📊 Data Sources (Priority Order):</b>\n"
+    "1. 🥇 DexScreener - Most comprehensive data\n"
+    "2. 🥈 Birdeye - Real-time price feeds\n"
+    "3. 🥉 Pump.fun - Meme token specialists\n\n"
+    "<b>⚡ Alert System:</b>\n"
+    "🚀 Multipliers: 2x, 3x, 5x, 8x, 10x, up to 100x\n"
+    "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
+    "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
+    "<b>🛠️ Commands:</b>\n"
+    "• <code>/menu</code> - Main control panel\n"
+    "• <code>/list</code> - Show all tracked tokens\n"
+    "• <code>/stats</code> - Group performance stats\n"
+    "• <code>/search &lt;query&gt;</code> - Find specific tokens\n"
+    "• <code>/remove &lt;address&gt;</code> - Stop tracking a token\n\n"
+    "<b>� Quick Remove:</b>\n"
+    "Use the remove commands shown in token list!\n\n"
+    "�🔥 <b>Ready to catch every moonshot!</b> 🔥"
+)
+
+INFO_NAV_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
+])
+
+LIST_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔄 Refresh List", callback_data="menu_list")],
+    [InlineKeyboardButton("� View Stats", callback_data="menu_stats")],
+    [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
+])
+
+BACK_TO_MENU_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
+])
+
+# Navigation rows appended under the per-token remove buttons of the menu list
+LIST_NAV_ROWS = (
+    [InlineKeyboardButton("🔄 Refresh List", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 View Stats", callback_data="menu_stats")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")],
+)
+
+STATS_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🔍 Search", callback_data="menu_search")],
+    [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
+])
+
+GROUP_STATS_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
+])
+
+SEARCH_INFO_TEXT = (
+    "🔍 <b>Search Tokens</b>\n\n"
+    "Use the command: <code>/search &lt;query&gt;</code>\n\n"
+    "<b>Examples:</b>\n"
+    "• <code>/search BONK</code> - Find by symbol\n"
+    "• <code>/search Solana</code> - Find by name\n"
+    "• <code>/search 11111111</code> - Find by address\n\n"
+    "Search by symbol, name, or contract address."
+)
+
+REMOVE_INFO_TEXT = (
+    "❌ <b>Remove Token</b>\n\n"
+    "<b>Quick Method:</b>\n"
+    "1. Go to 📊 View Tokens\n"
+    "2. Click the ❌ Remove buttons for each token\n"
+    "3. Confirm removal when prompted!\n\n"
+    "<b>Manual Method:</b>\n"
+    "Use: <code>/remove &lt;contract_address&gt;</code>\n\n"
+    "<b>Example:</b>\n"
+    "<code>/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263</code>\n\n"
+    "💡 Get contract addresses with 📊 View Tokens."
+)
+
+TOKENS_BACK_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
+])
+
+BACK_TO_LIST_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🔙 Back to List", callback_data="menu_list")]
+])
+
+TOKEN_REMOVED_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Remaining Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
+])
+
+STATS_TEMPLATE = (
+    "📈 <b>Group Statistics</b> 📈\n\n"
+    "📊 <b>Overview:</b>\n"
+    "• Total Tokens: {total_tokens}\n"
+    "• Active Tokens: {active_tokens}\n"
+    "• Pumping Tokens: {pumping_tokens} 🚀\n"
+    "• Dumping Tokens: {dumping_tokens} 📉\n\n"
+    "🎯 <b>Performance:</b>\n"
+    "• Average Multiplier: {avg_multiplier}x\n"
+    "• Best Performer: {max_multiplier}x\n\n"
+    "⚡ <b>Bot Status:</b>\n"
+    "• Monitoring: {monitoring}\n"
+    "• Update Interval: 15 seconds\n"
+    "• Data Source: DexScreener Primary\n"
+)
+
+STATUS_TEMPLATE = (
+    "⚙️ <b>Enhanced Bot Status</b> ⚙️\n\n"
+    "🤖 <b>System Status:</b>\n"
+    "• Bot Running: {running}\n"
+    "• Active Tokens: {active_tokens}\n"
+    "• Monitoring Interval: 15 seconds ⚡\n\n"
+    "📊 <b>Data Sources:</b>\n"
+    "• 🥇 DexScreener (Primary)\n"
+    "• 🥈 Birdeye (Backup)\n"
+    "• 🥉 Pump.fun (Meme tokens)\n\n"
+    "🚀 <b>Alert System:</b>\n"
+    "• Multiplier Tracking: Up to 100x\n"
+    "• Loss Protection: 4 levels\n"
+    "• Perfect Token Detection: ✅\n"
+    "• Group-Specific Tracking: ✅\n\n"
+    "{commands}"
+    "⚡ <b>Ready for moonshots!</b> 🚀"
+)
+
+# Extra section /status shows between the system info and the sign-off
+STATUS_COMMANDS = (
+    "🔧 <b>Commands Available:</b>\n"
+    "• <code>/menu</code> - Full control panel\n"
+    "• <code>/list</code> - View tracked tokens\n"
+    "• <code>/stats</code> - Performance stats\n"
+    "• <code>/search</code> - Find tokens\n"
+    "• <code>/remove</code> - Stop tracking\n\n"
+)
+
+SEARCH_RESULTS_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
+])
+
+# Fixed rows of the add-confirmation keyboard; the per-token remove row is added per message
+CONFIRM_KEYBOARD_ROWS = (
+    [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
+)
+
+class OrjsonRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Telegram's JSON responses with orjson."""
+    
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            raise TelegramError("Invalid server response") from exc
+
 class SolanaAlertBot:
     def __init__(self):
         self.application = None
         self.token_tracker = None
         self.database = None
         self.solana_api = None
+        self._stop_event = asyncio.Event()  # set by SIGINT/SIGTERM to shut the bot down
+        self._edit_queue = asyncio.Queue(maxsize=EDIT_QUEUE_SIZE)  # (message, text, kwargs) to edit
+        self._edit_worker_task = None
+        self._tracker_task = None  # the one running start_tracking() loop
+        self._edit_tasks = set()  # in-flight edits, referenced until they finish
+        self._edit_slots = asyncio.Semaphore(MAX_CONCURRENT_EDITS)  # released by _edit_done
+        self._registered_groups: dict[int, tuple] = {}  # chat_id -> (chat_title, chat_type) already in the DB
+        self._token_info_cache = OrderedDict()  # contract_address -> (loop time fetched, token_data)
+        self._token_info_pending: dict[str, asyncio.Future] = {}  # contract_address -> lookup in flight
+        self._chat_cache: dict[int, tuple[float, list, dict]] = {}  # chat_id -> (loop time fetched, tokens, stats)
+        self._list_pages: dict[int, tuple[list, list]] = {}  # chat_id -> (cached token list, /list pages rendered from it)
+        self._rate: dict[int, tuple[float, float]] = {}  # chat_id -> (tokens left, loop time of last refill)
+        self._chat_workers: dict[int, tuple[asyncio.Queue, asyncio.Task]] = {}  # chat_id -> (pending messages' contracts, worker)
+        self._last_refresh: dict[tuple[int, str], float] = {}  # (chat_id, callback_data) -> loop time drawn
+        self._rendered = OrderedDict()  # (chat_id, message_id) -> hash of the list/stats text last shown
+        self._callback_handlers = {  # menu button callback_data -> screen
+            "menu_main": self.show_main_menu,
+            "menu_list": self.show_tokens_list,
+            "menu_stats": self.show_group_stats,
+            "menu_help": self.show_help_info,
+            "menu_status": self.show_bot_status,
+            "menu_search": self.show_search_info,
+            "menu_remove": self.show_remove_info,
+        }
         
     async def initialize(self):
         """Initialize the bot application with enhanced features."""
@@ -34,14 +419,28 @@ class SolanaAlertBot:
             raise ValueError("Invalid configuration")
         
         # Create application
-        self.application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+        self.application = (
+            Application.builder()
+            .token(Config.TELEGRAM_BOT_TOKEN)
+            # HTTP/2 lets concurrent replies and edits share one multiplexed TLS connection
+            .request(OrjsonRequest(connection_pool_size=256, http_version="2.0"))  # same pool size as the builder default
+            .get_updates_request(OrjsonRequest())
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .build()
+        )
         
         # Initialize components
         self.database = Database(Config.DATABASE_PATH)
         await self.database.init_db()
+        # Handlers share one WAL-mode connection so its page cache survives between commands
+        await self.database.apply_pragmas()
+        # Group, token and removal writes are queued and committed in batches on that connection
+        self.database.start_writer()
         
+        # One HTTP session for the bot's lifetime, shared with the tracker so TLS connections are reused
         self.solana_api = SolanaAPI()
-        self.token_tracker = TokenTracker(self.application.bot)
+        await self.solana_api.start()
+        self.token_tracker = TokenTracker(self.application.bot, self.solana_api.session)
         
         # Add handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
@@ -56,8 +455,51 @@ class SolanaAlertBot:
         self.application.add_handler(CallbackQueryHandler(self.handle_callback))
         self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
         
+        # Processing-message edits are sent in the background so handlers never wait on them
+        self._edit_worker_task = asyncio.create_task(self._edit_worker())
+        
         logger.info("🤖 Enhanced Bot initialized successfully with group support")
     
+    def _ensure_tracker_started(self):
+        """Start the tracker loop unless a task already runs it; nothing awaits between check and start."""
+        if not self.token_tracker or self.token_tracker.is_running:
+            return
+        if self._tracker_task and not self._tracker_task.done():
+            return
+        self._tracker_task = asyncio.create_task(self.token_tracker.start_tracking())
+    
+    def _queue_edit(self, message, text: str, **kwargs):
+        """Hand a message edit to the background worker without waiting for Telegram."""
+        try:
+            self._edit_queue.put_nowait((message, text, kwargs))
+        except asyncio.QueueFull:
+            logger.warning("⚠️ Edit queue full, dropping edit for message %s", message.message_id)
+    
+    async def _edit_worker(self):
+        """Send queued edits, each as its own task so one slow edit never holds up the rest."""
+        while True:
+            message, text, kwargs = await self._edit_queue.get()
+            await self._edit_slots.acquire()
+            task = asyncio.create_task(message.edit_text(text, **kwargs))
+            self._edit_tasks.add(task)
+            task.add_done_callback(self._edit_done)
+            self._edit_queue.task_done()
+    
+    def _edit_done(self, task: asyncio.Task):
+        """Forget a finished edit, free its slot and log it if Telegram rejected it."""
+        self._edit_tasks.discard(task)
+        self._edit_slots.release()
+        if not task.cancelled() and task.exception():
+            logger.error("❌ Failed to edit message: %s", task.exception())
+    
+    async def register_group(self, chat_id: int, chat_title: str, chat_type: str):
+        """Register the chat unless it is already stored with the same title and type."""
+        key = (chat_title, chat_type)
+        if self._registered_groups.get(chat_id) == key:
+            return
+        await self.database.register_group(chat_id, chat_title, chat_type)
+        self._registered_groups[chat_id] = key
+    
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command with enhanced welcome."""
         if not update.message:
@@ -68,114 +510,81 @@ class SolanaAlertBot:
         chat_type = update.effective_chat.type if update.effective_chat else "private"
         
         # Register the group/chat
-        await self.database.register_group(chat_id, chat_title, chat_type)
+        await self.register_group(chat_id, chat_title, chat_type)
         
-        welcome_message = (
-            "🚀 *Enhanced Multi-Group Solana Alert Bot* 🚀\n\n"
-            "🔍 *Perfect Token Detection* - Never miss a launch!\n"
-            "📊 *DexScreener Integration* - Real-time accurate data\n"
-            "👥 *Multi-Group Support* - Each group has independent tokens\n"
-            "⚡ *Real-Time Monitoring* - 10-second intervals\n"
-            "🗑️ *Auto-Remove Rugged* - Removes tokens below -80%\n\n"
-            f"📋 *Group Info:*\n"
-            f"• **Chat ID**: `{chat_id}`\n"
-            f"• **Type**: {chat_type.title()}\n"
-            f"• **Title**: {chat_title}\n\n"
-            "📋 *Quick Commands:*\n"
-            "• `/menu` - Access all features\n"
-            "• `/list` - View this group's tokens\n"
-            "• `/stats` - Group statistics\n"
-            "• Send any Solana contract address to start tracking!\n\n"
-            "🎯 *Alert Types:*\n"
-            "🚀 Multiplier alerts: 2x, 3x, 5x, 8x, 10x, up to 100x!\n"
-            "📉 Loss alerts: -30%, -50%, -70%, -80%, -85%, -95%\n"
-            "�️ Auto-removal at -80% loss\n\n"
-            "🔥 *Ready to catch some moonshots!* 🔥"
+        welcome_message = WELCOME_TEMPLATE.format(
+            chat_id=chat_id,
+            chat_type=escape(chat_type.title(), quote=False),
+            chat_title=escape(chat_title, quote=False)
         )
         
-        # Create menu keyboard
-        keyboard = [
-            [InlineKeyboardButton("📋 Main Menu", callback_data="menu_main")],
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list"),
-             InlineKeyboardButton("📈 Statistics", callback_data="menu_stats")],
-            [InlineKeyboardButton("🗑️ Auto-Remove Info", callback_data="menu_autoremove")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await update.message.reply_text(welcome_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await update.message.reply_text(welcome_message, parse_mode=ParseMode.HTML, reply_markup=START_KEYBOARD)
         
         # Start tracking if not already running
-        if self.token_tracker and not self.token_tracker.is_running:
-            asyncio.create_task(self.token_tracker.start_tracking())
+        self._ensure_tracker_started()
     
     async def menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display the main menu with all available options."""
         if not update.message:
             return
             
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tracked Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 Group Statistics", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
-            [InlineKeyboardButton("❌ Remove Tokens", callback_data="menu_remove")],
-            [InlineKeyboardButton("ℹ️ Help & Info", callback_data="menu_help")],
-            [InlineKeyboardButton("⚙️ Bot Status", callback_data="menu_status")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        menu_text = (
-            "🎛️ *Main Menu* 🎛️\n\n"
-            "Choose an option below to manage your Solana token tracking:\n\n"
-            "📊 *View Tokens* - See all tracked tokens in this group\n"
-            "📈 *Statistics* - Group performance overview\n"
-            "🔍 *Search* - Find specific tokens\n"
-            "❌ *Remove* - Stop tracking unwanted tokens\n"
-            "ℹ️ *Help* - Commands and usage guide\n"
-            "⚙️ *Status* - Bot performance information"
-        )
-        
-        await update.message.reply_text(menu_text, parse_mode='Markdown', reply_markup=reply_markup)
+        await update.message.reply_text(MAIN_MENU_TEXT, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_KEYBOARD)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command with comprehensive information."""
         if not update.message:
             return
-            
-        help_message = (
-            "🆘 *Enhanced Solana Alert Bot Help* 🆘\n\n"
-            "*🔍 Perfect Token Detection:*\n"
-            "• Detects ALL Solana tokens from any launchpad\n"
-            "• Supports pump.fun, DexScreener, Birdeye links\n"
-            "• Recognizes contract addresses in any format\n"
-            "• Enhanced regex patterns for 100% accuracy\n\n"
-            "*📊 Data Sources (Priority Order):*\n"
-            "1. 🥇 DexScreener - Most comprehensive data\n"
-            "2. 🥈 Birdeye - Real-time price feeds\n"
-            "3. 🥉 Pump.fun - Meme token specialists\n\n"
-            "*👥 Group Features:*\n"
-            "• Each group tracks its own tokens\n"
-            "• Group-specific statistics and settings\n"
-            "• Individual token management per group\n\n"
-            "*⚡ Alert System:*\n"
-            "🚀 Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
-            "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
-            "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
-            "*🛠️ Commands:*\n"
-            "• `/menu` - Main control panel\n"
-            "• `/list` - Show all tracked tokens\n"
-            "• `/stats` - Group performance stats\n"
-            "• `/search <query>` - Find specific tokens\n"
-            "• `/remove <address>` - Stop tracking a token\n"
-            "• `/status` - Bot system status\n\n"
-            "*💡 Usage Tips:*\n"
-            "• Just paste any Solana contract address\n"
-            "• Works with URLs from any platform\n"
-            "• Each group maintains separate token lists\n"
-            "• Remove unwanted tokens easily\n\n"
-            "🔥 *Ready to catch every moonshot!* 🔥"
+        
+        await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.HTML)
+    
+    @staticmethod
+    def _format_token_row(i: int, token: dict, name_max: int) -> str:
+        """Trend, name, market cap and address lines for one token in a list; callers append the rest."""
+        # symbol and name are nullable columns
+        name = token['name'] or ''
+        if len(name) > name_max:
+            name = name[:name_max] + '...'
+        current_mcap = token.get('current_mcap') or 0
+        return (
+            f"{TREND_EMOJI[token['trend']]} <b>{i}. {escape(token['symbol'] or '', quote=False)}</b> - {escape(name, quote=False)}\n"
+            f"💰 ${current_mcap:,.0f} ({token['multiplier']:.2f}x)\n"
+            f"🔗 <code>{token['contract_address']}</code>\n"
         )
+    
+    def _render_list_pages(self, chat_id: int, tokens: list) -> list:
+        """/list message pages for a chat, reused while the chat cache still hands back the same token list."""
+        entry = self._list_pages.get(chat_id)
+        if entry and entry[0] is tokens:
+            return entry[1]
         
-        await update.message.reply_text(help_message, parse_mode='Markdown')
+        # Create paginated token list with remove commands; pieces are joined once per page
+        message_parts = []
+        buf = [LIST_HEADER]
+        buf_len = len(LIST_HEADER)
+        
+        for i, token in enumerate(tokens, 1):
+            token_info = (
+                self._format_token_row(i, token, 25)
+                + f"❌ Remove: <code>/remove {token['contract_address']}</code>\n"
+                f"⏰ Added: {token['detected_at'][:10]}\n\n"
+            )
+            
+            # Check if adding this token would exceed message limit
+            info_len = len(token_info)
+            if buf_len + info_len > MAX_MESSAGE_LENGTH:
+                message_parts.append("".join(buf))
+                buf = [LIST_CONTINUED_HEADER, token_info]
+                buf_len = len(LIST_CONTINUED_HEADER) + info_len
+            else:
+                buf.append(token_info)
+                buf_len += info_len
+        
+        # Add usage tips to the last message
+        buf.append(LIST_TIPS)
+        message_parts.append("".join(buf))
+        
+        self._list_pages[chat_id] = (tokens, message_parts)
+        return message_parts
     
     async def list_tokens_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display all tracked tokens for this group with remove commands."""
@@ -183,64 +592,24 @@ class SolanaAlertBot:
             return
             
         chat_id = update.effective_chat.id
-        tokens = await self.database.get_tokens_for_chat(chat_id)
+        tokens = await self._get_tokens_cached(chat_id)
         
         if not tokens:
             await update.message.reply_text(
-                "📋 *No Tokens Tracked Yet*\n\n"
+                "📋 <b>No Tokens Tracked Yet</b>\n\n"
                 "Send a Solana contract address to start tracking!",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
-        # Create paginated token list with remove commands
-        message_parts = []
-        current_message = "📊 *Tracked Tokens in This Group* 📊\n\n"
-        
-        for i, token in enumerate(tokens, 1):
-            current_mcap = token.get('current_mcap', 0) or 0
-            initial_mcap = token.get('initial_mcap', 1) or 1
-            multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
-            
-            status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
-            
-            token_info = (
-                f"{status_emoji} *{i}. {token['symbol']}* - {token['name'][:25]}{'...' if len(token['name']) > 25 else ''}\n"
-                f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
-                f"🔗 `{token['contract_address']}`\n"
-                f"❌ Remove: `/remove {token['contract_address']}`\n"
-                f"⏰ Added: {token['detected_at'][:10]}\n\n"
-            )
-            
-            # Check if adding this token would exceed message limit
-            if len(current_message + token_info) > 3500:
-                message_parts.append(current_message)
-                current_message = "📊 *Tracked Tokens (continued)* 📊\n\n" + token_info
-            else:
-                current_message += token_info
-        
-        if current_message:
-            message_parts.append(current_message)
+        message_parts = self._render_list_pages(chat_id, tokens)
         
-        # Add usage tips to the last message
-        if message_parts:
-            message_parts[-1] += (
-                "💡 *Quick Actions:*\n"
-                "• Copy and send remove commands above\n"
-                "• Use `/search <name>` to find specific tokens\n"
-                "• Use `/menu` for more options"
-            )
-        
-        # Send all message parts
-        for i, part in enumerate(message_parts):
-            keyboard = [
-                [InlineKeyboardButton("🔄 Refresh List", callback_data="menu_list")],
-                [InlineKeyboardButton("� View Stats", callback_data="menu_stats")],
-                [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await update.message.reply_text(part, parse_mode='Markdown', reply_markup=reply_markup if i == len(message_parts) - 1 else None)
+        # Send the leading parts concurrently, then the last one (tips + keyboard) so it lands at the bottom
+        await asyncio.gather(*(
+            update.message.reply_text(part, parse_mode=ParseMode.HTML)
+            for part in message_parts[:-1]
+        ))
+        await update.message.reply_text(message_parts[-1], parse_mode=ParseMode.HTML, reply_markup=LIST_KEYBOARD)
     
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display group statistics."""
@@ -248,32 +617,11 @@ class SolanaAlertBot:
             return
             
         chat_id = update.effective_chat.id
-        stats = await self.database.get_token_stats(chat_id)
-        
-        stats_message = (
-            f"📈 *Group Statistics* 📈\n\n"
-            f"📊 *Overview:*\n"
-            f"• Total Tokens: {stats['total_tokens']}\n"
-            f"• Active Tokens: {stats['active_tokens']}\n"
-            f"• Pumping Tokens: {stats['pumping_tokens']} 🚀\n"
-            f"• Dumping Tokens: {stats['dumping_tokens']} 📉\n\n"
-            f"🎯 *Performance:*\n"
-            f"• Average Multiplier: {stats['avg_multiplier']}x\n"
-            f"• Best Performer: {stats['max_multiplier']}x\n\n"
-            f"⚡ *Bot Status:*\n"
-            f"• Monitoring: {'✅ Active' if self.token_tracker and self.token_tracker.is_running else '❌ Stopped'}\n"
-            f"• Update Interval: 15 seconds\n"
-            f"• Data Source: DexScreener Primary\n"
-        )
+        stats = await self._get_stats_cached(chat_id)
         
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("🔍 Search", callback_data="menu_search")],
-            [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        stats_message = self._render_stats(stats)
         
-        await update.message.reply_text(stats_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await update.message.reply_text(stats_message, parse_mode=ParseMode.HTML, reply_markup=STATS_KEYBOARD)
     
     async def search_tokens_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Search for tokens by symbol, name, or address."""
@@ -287,40 +635,39 @@ class SolanaAlertBot:
         
         if not query:
             await update.message.reply_text(
-                "🔍 *Search Tokens*\n\n"
-                "Usage: `/search <symbol/name/address>`\n\n"
+                "🔍 <b>Search Tokens</b>\n\n"
+                "Usage: <code>/search &lt;symbol/name/address&gt;</code>\n\n"
                 "Examples:\n"
-                "• `/search BONK`\n"
-                "• `/search Solana`\n"
-                "• `/search 11111111`\n",
-                parse_mode='Markdown'
+                "• <code>/search BONK</code>\n"
+                "• <code>/search Solana</code>\n"
+                "• <code>/search 11111111</code>\n",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        tokens = await self.database.search_tokens(chat_id, query)
+        # Filter the chat's cached token list so /search shows the same mcap snapshot as /list and stats
+        needle = query.casefold()
+        tokens = [
+            token for token in await self._get_tokens_cached(chat_id)
+            if needle in (token['symbol'] or '').casefold()
+            or needle in (token['name'] or '').casefold()
+            or needle in token['contract_address'].casefold()
+        ]
         
         if not tokens:
             await update.message.reply_text(
-                f"🔍 *Search Results*\n\n"
-                f"No tokens found matching: `{query}`",
-                parse_mode='Markdown'
+                f"🔍 <b>Search Results</b>\n\n"
+                f"No tokens found matching: <code>{escape(query, quote=False)}</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        results_message = f"🔍 *Search Results for: {query}*\n\n"
+        results_message = f"🔍 <b>Search Results for: {escape(query, quote=False)}</b>\n\n"
         
         for i, token in enumerate(tokens[:5], 1):  # Limit to 5 results for better display
-            current_mcap = token.get('current_mcap', 0) or 0
-            initial_mcap = token.get('initial_mcap', 1) or 1
-            multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
-            
-            status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
-            
             results_message += (
-                f"{status_emoji} *{i}. {token['symbol']}* - {token['name'][:20]}{'...' if len(token['name']) > 20 else ''}\n"
-                f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
-                f"🔗 `{token['contract_address']}`\n"
-                f"❌ Remove: `/remove {token['contract_address']}`\n\n"
+                self._format_token_row(i, token, 20)
+                + f"❌ Remove: <code>/remove {token['contract_address']}</code>\n\n"
             )
         
         if len(tokens) > 5:
@@ -328,13 +675,7 @@ class SolanaAlertBot:
         
         results_message += "💡 Copy and send remove commands above to remove tokens!"
         
-        keyboard = [
-            [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await update.message.reply_text(results_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await update.message.reply_text(results_message, parse_mode=ParseMode.HTML, reply_markup=SEARCH_RESULTS_KEYBOARD)
     
     async def remove_token_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Remove a token from tracking."""
@@ -346,11 +687,11 @@ class SolanaAlertBot:
         # Get contract address from command arguments
         if not context.args:
             await update.message.reply_text(
-                "❌ *Remove Token*\n\n"
-                "Usage: `/remove <contract_address>`\n\n"
-                "Example: `/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263`\n\n"
-                "💡 Use `/list` to see all tracked tokens and their addresses.",
-                parse_mode='Markdown'
+                "❌ <b>Remove Token</b>\n\n"
+                "Usage: <code>/remove &lt;contract_address&gt;</code>\n\n"
+                "Example: <code>/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263</code>\n\n"
+                "💡 Use <code>/list</code> to see all tracked tokens and their addresses.",
+                parse_mode=ParseMode.HTML
             )
             return
         
@@ -360,18 +701,19 @@ class SolanaAlertBot:
         success = await self.database.remove_token(contract_address, chat_id)
         
         if success:
+            self.invalidate(chat_id)
             await update.message.reply_text(
-                f"✅ *Token Removed Successfully*\n\n"
-                f"Contract: `{contract_address}`\n\n"
+                f"✅ <b>Token Removed Successfully</b>\n\n"
+                f"Contract: <code>{escape(contract_address, quote=False)}</code>\n\n"
                 f"The token has been removed from tracking in this group.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
         else:
             await update.message.reply_text(
-                f"❌ *Token Not Found*\n\n"
-                f"Contract: `{contract_address}`\n\n"
+                f"❌ <b>Token Not Found</b>\n\n"
+                f"Contract: <code>{escape(contract_address, quote=False)}</code>\n\n"
                 f"This token is not being tracked in this group.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
     
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -380,127 +722,88 @@ class SolanaAlertBot:
             return
             
         query = update.callback_query
-        await query.answer()
-        
-        if query.data == "menu_main":
-            await self.show_main_menu(query)
-        elif query.data == "menu_list":
-            await self.show_tokens_list(query)
-        elif query.data == "menu_stats":
-            await self.show_group_stats(query)
-        elif query.data == "menu_help":
-            await self.show_help_info(query)
-        elif query.data == "menu_status":
-            await self.show_bot_status(query)
-        elif query.data.startswith("remove_"):
+        data = query.data
+        if data in REFRESH_CALLBACKS and query.message and query.message.chat:
+            key = (query.message.chat.id, data)
+            now = asyncio.get_running_loop().time()
+            if now - self._last_refresh.get(key, float("-inf")) < REFRESH_DEBOUNCE:
+                await query.answer(REFRESH_WAIT_TEXT)
+                return
+            self._last_refresh[key] = now
+        
+        # Answered after the screen is drawn, so a refresh that changed nothing can say so
+        up_to_date = False
+        try:
+            up_to_date = await self._dispatch_callback(query, data)
+        finally:
+            await query.answer(UP_TO_DATE_TEXT if up_to_date else None)
+    
+    async def _dispatch_callback(self, query, data: str) -> bool:
+        """Run the handler for a callback; True when it left an already up-to-date screen unchanged."""
+        if data not in REFRESH_CALLBACKS and not data.startswith(LIST_PAGE_PREFIX) and query.message:
+            # Another screen is about to replace the message, so a later refresh must redraw it
+            self._rendered.pop((query.message.chat.id, query.message.message_id), None)
+        
+        if data.startswith("remove_"):
             # Handle remove token button clicks
-            contract_address = query.data[7:]  # Remove "remove_" prefix
+            contract_address = data[7:]  # Remove "remove_" prefix
             await self.handle_remove_token_callback(query, contract_address)
-        elif query.data == "menu_search":
-            keyboard = [
-                [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                "🔍 *Search Tokens*\n\n"
-                "Use the command: `/search <query>`\n\n"
-                "*Examples:*\n"
-                "• `/search BONK` - Find by symbol\n"
-                "• `/search Solana` - Find by name\n"
-                "• `/search 11111111` - Find by address\n\n"
-                "Search by symbol, name, or contract address.",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
-            )
-        elif query.data == "menu_remove":
-            keyboard = [
-                [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                "❌ *Remove Token*\n\n"
-                "*Quick Method:*\n"
-                "1. Go to 📊 View Tokens\n"
-                "2. Click the ❌ Remove buttons for each token\n"
-                "3. Confirm removal when prompted!\n\n"
-                "*Manual Method:*\n"
-                "Use: `/remove <contract_address>`\n\n"
-                "*Example:*\n"
-                "`/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263`\n\n"
-                "💡 Get contract addresses with 📊 View Tokens.",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
-            )
+            return False
+        if data.startswith(LIST_PAGE_PREFIX):
+            # callback_data comes from the client; anything but a plain page number shows the first page
+            page = data[len(LIST_PAGE_PREFIX):]
+            return await self.show_tokens_list(query, int(page) if page.isascii() and page.isdigit() and len(page) <= 6 else 0)
+        
+        handler = self._callback_handlers.get(data)
+        if handler:
+            return bool(await handler(query))
+        return False
+    
+    async def show_search_info(self, query):
+        """Explain /search in callback query."""
+        await query.edit_message_text(SEARCH_INFO_TEXT, parse_mode=ParseMode.HTML, reply_markup=TOKENS_BACK_KEYBOARD)
+    
+    async def show_remove_info(self, query):
+        """Explain how to remove tokens in callback query."""
+        await query.edit_message_text(REMOVE_INFO_TEXT, parse_mode=ParseMode.HTML, reply_markup=TOKENS_BACK_KEYBOARD)
     
     async def show_main_menu(self, query):
         """Display the main menu in callback query."""
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tracked Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 Group Statistics", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
-            [InlineKeyboardButton("❌ Remove Tokens", callback_data="menu_remove")],
-            [InlineKeyboardButton("ℹ️ Help & Info", callback_data="menu_help")],
-            [InlineKeyboardButton("⚙️ Bot Status", callback_data="menu_status")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        menu_text = (
-            "🎛️ *Main Menu* 🎛️\n\n"
-            "Choose an option below to manage your Solana token tracking:\n\n"
-            "📊 *View Tokens* - See all tracked tokens in this group\n"
-            "📈 *Statistics* - Group performance overview\n"
-            "🔍 *Search* - Find specific tokens\n"
-            "❌ *Remove* - Stop tracking unwanted tokens\n"
-            "ℹ️ *Help* - Commands and usage guide\n"
-            "⚙️ *Status* - Bot performance information"
-        )
-        
-        await query.edit_message_text(menu_text, parse_mode='Markdown', reply_markup=reply_markup)
+        await query.edit_message_text(MAIN_MENU_TEXT, parse_mode=ParseMode.HTML, reply_markup=MAIN_MENU_KEYBOARD)
     
-    async def show_tokens_list(self, query):
-        """Display all tracked tokens for this group in callback query."""
+    async def show_tokens_list(self, query, page: int = 0) -> bool:
+        """Display one page of this group's tracked tokens in callback query; True if it was already up to date."""
         if not query.message or not query.message.chat:
-            return
+            return False
             
         chat_id = query.message.chat.id
-        tokens = await self.database.get_tokens_for_chat(chat_id)
+        # One row past the page tells whether a next page exists
+        tokens = await self.database.get_tokens_for_chat_page(chat_id, LIST_PAGE_SIZE + 1, page * LIST_PAGE_SIZE)
+        has_more = len(tokens) > LIST_PAGE_SIZE
+        
+        if not tokens and page:
+            page = 0
+            tokens = await self.database.get_tokens_for_chat_page(chat_id, LIST_PAGE_SIZE + 1)
+            has_more = len(tokens) > LIST_PAGE_SIZE
         
         if not tokens:
-            keyboard = [
-                [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await query.edit_message_text(
-                "📋 *No Tokens Tracked Yet*\n\n"
+            return await self._edit_if_changed(
+                query,
+                "📋 <b>No Tokens Tracked Yet</b>\n\n"
                 "Send a Solana contract address to start tracking!",
-                parse_mode='Markdown',
-                reply_markup=reply_markup
+                reply_markup=BACK_TO_MENU_KEYBOARD
             )
-            return
         
         # Create token list message with clickable remove buttons
-        message_text = "📊 *Tracked Tokens in This Group* 📊\n\n"
+        parts = [LIST_HEADER]
         
         # Build keyboard with remove buttons for each token
         keyboard = []
         
-        for i, token in enumerate(tokens[:6], 1):  # Limit to 6 for better button display
-            current_mcap = token.get('current_mcap', 0) or 0
-            initial_mcap = token.get('initial_mcap', 1) or 1
-            multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
-            
-            status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
-            
-            message_text += (
-                f"{status_emoji} *{i}. {token['symbol']}* - {token['name'][:20]}{'...' if len(token['name']) > 20 else ''}\n"
-                f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
-                f"🔗 `{token['contract_address']}`\n"
-                f"⏰ Added: {token['detected_at'][:10]}\n\n"
+        for i, token in enumerate(tokens[:LIST_PAGE_SIZE], page * LIST_PAGE_SIZE + 1):  # numbering runs on across pages
+            parts.append(
+                self._format_token_row(i, token, 20)
+                + f"⏰ Added: {token['detected_at'][:10]}\n\n"
             )
             
             # Add remove button for this token
@@ -508,155 +811,80 @@ class SolanaAlertBot:
             callback_data = f"remove_{token['contract_address']}"
             keyboard.append([InlineKeyboardButton(button_text, callback_data=callback_data)])
         
-        if len(tokens) > 6:
-            message_text += f"... and {len(tokens) - 6} more tokens\n"
-            message_text += f"💡 Use `/list` command to see all tokens\n\n"
+        if has_more:
+            parts.append("... more tokens on the next page\n")
+            parts.append(f"💡 Use <code>/list</code> command to see all tokens\n\n")
         
-        message_text += "💡 *Click the remove buttons below to delete tokens*\n"
+        parts.append("💡 <b>Click the remove buttons below to delete tokens</b>\n")
+        message_text = "".join(parts)
         
-        # Add navigation buttons
-        keyboard.extend([
-            [InlineKeyboardButton("🔄 Refresh List", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 View Stats", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-        ])
+        # Add page and navigation buttons
+        page_row = []
+        if page:
+            page_row.append(InlineKeyboardButton("⬅️ Previous", callback_data=f"{LIST_PAGE_PREFIX}{page - 1}"))
+        if has_more:
+            page_row.append(InlineKeyboardButton("Next ➡️", callback_data=f"{LIST_PAGE_PREFIX}{page + 1}"))
+        if page_row:
+            keyboard.append(page_row)
+        keyboard.extend(LIST_NAV_ROWS)
         
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        await query.edit_message_text(message_text, parse_mode='Markdown', reply_markup=reply_markup)
+        return await self._edit_if_changed(query, message_text, reply_markup=reply_markup)
     
-    async def show_group_stats(self, query):
-        """Display group statistics in callback query."""
+    async def show_group_stats(self, query) -> bool:
+        """Display group statistics in callback query; True if it was already up to date."""
         if not query.message or not query.message.chat:
-            return
+            return False
             
         chat_id = query.message.chat.id
-        stats = await self.database.get_token_stats(chat_id)
-        
-        stats_message = (
-            f"📈 *Group Statistics* 📈\n\n"
-            f"📊 *Overview:*\n"
-            f"• Total Tokens: {stats['total_tokens']}\n"
-            f"• Active Tokens: {stats['active_tokens']}\n"
-            f"• Pumping Tokens: {stats['pumping_tokens']} 🚀\n"
-            f"• Dumping Tokens: {stats['dumping_tokens']} 📉\n\n"
-            f"🎯 *Performance:*\n"
-            f"• Average Multiplier: {stats['avg_multiplier']}x\n"
-            f"• Best Performer: {stats['max_multiplier']}x\n\n"
-            f"⚡ *Bot Status:*\n"
-            f"• Monitoring: {'✅ Active' if self.token_tracker and self.token_tracker.is_running else '❌ Stopped'}\n"
-            f"• Update Interval: 15 seconds\n"
-            f"• Data Source: DexScreener Primary\n"
-        )
+        stats = await self._get_stats_cached(chat_id)
         
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        stats_message = self._render_stats(stats)
         
-        await query.edit_message_text(stats_message, parse_mode='Markdown', reply_markup=reply_markup)
+        return await self._edit_if_changed(query, stats_message, reply_markup=GROUP_STATS_KEYBOARD)
+    
+    async def _edit_if_changed(self, query, text: str, reply_markup) -> bool:
+        """Edit the callback's message unless it already shows this text (Telegram rejects no-op edits); True if skipped."""
+        key = (query.message.chat.id, query.message.message_id)
+        text_hash = hash(text)
+        if self._rendered.get(key) == text_hash:
+            return True
+        await query.edit_message_text(text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
+        self._rendered[key] = text_hash
+        self._rendered.move_to_end(key)
+        if len(self._rendered) > RENDERED_CACHE_SIZE:
+            self._rendered.popitem(last=False)
+        return False
     
     async def show_help_info(self, query):
         """Display help information in callback query."""
-        help_message = (
-            "🆘 *Enhanced Solana Alert Bot Help* 🆘\n\n"
-            "*🔍 Perfect Token Detection:*\n"
-            "• Detects ALL Solana tokens from any launchpad\n"
-            "• Supports pump.fun, DexScreener, Birdeye links\n"
-            "• Recognizes contract addresses in any format\n\n"
-            "*📊 Data Sources (Priority Order):*\n"
-            "1. 🥇 DexScreener - Most comprehensive data\n"
-            "2. 🥈 Birdeye - Real-time price feeds\n"
-            "3. 🥉 Pump.fun - Meme token specialists\n\n"
-            "*⚡ Alert System:*\n"
-            "🚀 Multipliers: 2x, 3x, 5x, 8x, 10x, up to 100x\n"
-            "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
-            "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
-            "*🛠️ Commands:*\n"
-            "• `/menu` - Main control panel\n"
-            "• `/list` - Show all tracked tokens\n"
-            "• `/stats` - Group performance stats\n"
-            "• `/search <query>` - Find specific tokens\n"
-            "• `/remove <address>` - Stop tracking a token\n\n"
-            "*� Quick Remove:*\n"
-            "Use the remove commands shown in token list!\n\n"
-            "�🔥 *Ready to catch every moonshot!* 🔥"
+        await query.edit_message_text(HELP_INFO_TEXT, parse_mode=ParseMode.HTML, reply_markup=INFO_NAV_KEYBOARD)
+    
+    def _render_stats(self, stats: dict) -> str:
+        """Fill STATS_TEMPLATE for /stats and the stats screen."""
+        monitoring = '✅ Active' if self.token_tracker and self.token_tracker.is_running else '❌ Stopped'
+        return STATS_TEMPLATE.format_map({**stats, 'monitoring': monitoring})
+    
+    def _render_status(self, commands: str) -> str:
+        """Fill STATUS_TEMPLATE from the tracker; /status passes STATUS_COMMANDS, the menu screen ""."""
+        status = self.token_tracker.get_tracking_status() if self.token_tracker else {"active_tokens": 0, "is_running": False}
+        return STATUS_TEMPLATE.format(
+            running='✅ Yes' if status.get('is_running', False) else '❌ No',
+            active_tokens=status.get('active_tokens', 0),
+            commands=commands
         )
-        
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(help_message, parse_mode='Markdown', reply_markup=reply_markup)
     
     async def show_bot_status(self, query):
         """Display bot status in callback query."""
-        status = self.token_tracker.get_tracking_status() if self.token_tracker else {"active_tokens": 0, "is_running": False}
-        
-        status_message = (
-            f"⚙️ *Enhanced Bot Status* ⚙️\n\n"
-            f"🤖 **System Status:**\n"
-            f"• Bot Running: {'✅ Yes' if status.get('is_running', False) else '❌ No'}\n"
-            f"• Active Tokens: {status.get('active_tokens', 0)}\n"
-            f"• Monitoring Interval: 15 seconds ⚡\n\n"
-            f"📊 **Data Sources:**\n"
-            f"• 🥇 DexScreener (Primary)\n"
-            f"• 🥈 Birdeye (Backup)\n"
-            f"• 🥉 Pump.fun (Meme tokens)\n\n"
-            f"🚀 **Alert System:**\n"
-            f"• Multiplier Tracking: Up to 100x\n"
-            f"• Loss Protection: 4 levels\n"
-            f"• Perfect Token Detection: ✅\n"
-            f"• Group-Specific Tracking: ✅\n\n"
-            f"⚡ *Ready for moonshots!* 🚀"
-        )
-        
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        await query.edit_message_text(status_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await query.edit_message_text(self._render_status(""), parse_mode=ParseMode.HTML, reply_markup=INFO_NAV_KEYBOARD)
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command with enhanced system information."""
         if not update.message:
             return
             
-        status = self.token_tracker.get_tracking_status() if self.token_tracker else {"active_tokens": 0, "is_running": False}
-        
-        status_message = (
-            f"⚙️ *Enhanced Bot Status* ⚙️\n\n"
-            f"🤖 **System Status:**\n"
-            f"• Bot Running: {'✅ Yes' if status.get('is_running', False) else '❌ No'}\n"
-            f"• Active Tokens: {status.get('active_tokens', 0)}\n"
-            f"• Monitoring Interval: 15 seconds ⚡\n\n"
-            f"📊 **Data Sources:**\n"
-            f"• 🥇 DexScreener (Primary)\n"
-            f"• 🥈 Birdeye (Backup)\n"
-            f"• 🥉 Pump.fun (Meme tokens)\n\n"
-            f"🚀 **Alert System:**\n"
-            f"• Multiplier Tracking: Up to 100x\n"
-            f"• Loss Protection: 4 levels\n"
-            f"• Perfect Token Detection: ✅\n"
-            f"• Group-Specific Tracking: ✅\n\n"
-            f"🔧 **Commands Available:**\n"
-            f"• `/menu` - Full control panel\n"
-            f"• `/list` - View tracked tokens\n"
-            f"• `/stats` - Performance stats\n"
-            f"• `/search` - Find tokens\n"
-            f"• `/remove` - Stop tracking\n\n"
-            f"⚡ *Ready for moonshots!* 🚀"
-        )
-        
-        await update.message.reply_text(status_message, parse_mode='Markdown')
+        await update.message.reply_text(self._render_status(STATUS_COMMANDS), parse_mode=ParseMode.HTML)
     
     async def stop_tracking_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stop command (admin only)."""
@@ -666,11 +894,10 @@ class SolanaAlertBot:
         user_id = update.effective_user.id
         
         # Only allow specific admin users (you can modify this list in config)
-        admin_users = getattr(Config, 'ADMIN_USERS', [])
-        if admin_users and user_id not in admin_users:
+        if ADMIN_USERS and user_id not in ADMIN_USERS:
             await update.message.reply_text(
-                "❌ *Access Denied*\n\nOnly administrators can stop the tracking system.",
-                parse_mode='Markdown'
+                "❌ <b>Access Denied</b>\n\nOnly administrators can stop the tracking system.",
+                parse_mode=ParseMode.HTML
             )
             return
         
@@ -678,8 +905,8 @@ class SolanaAlertBot:
             self.token_tracker.stop_tracking()
         
         await update.message.reply_text(
-            "🛑 *Tracking Stopped*\n\nToken tracking has been stopped by an administrator.",
-            parse_mode='Markdown'
+            "🛑 <b>Tracking Stopped</b>\n\nToken tracking has been stopped by an administrator.",
+            parse_mode=ParseMode.HTML
         )
     
     async def handle_remove_token_callback(self, query, contract_address):
@@ -690,26 +917,19 @@ class SolanaAlertBot:
         chat_id = query.message.chat.id
         logger.info(f"🗑️ Remove token request: {contract_address} from chat {chat_id}")
         
-        # Get token info before removing
-        tokens = await self.database.get_tokens_for_chat(chat_id)
-        token_to_remove = None
-        
-        for token in tokens:
-            if token['contract_address'] == contract_address:
-                token_to_remove = token
-                break
+        # Get token info before removing; confirmation buttons carry only the first 8 characters
+        token_to_remove = await self.database.get_token_by_contract(chat_id, contract_address)
         
         if not token_to_remove:
             logger.warning(f"❌ Token {contract_address} not found in chat {chat_id}")
             await query.edit_message_text(
-                "❌ *Token Not Found*\n\n"
+                "❌ <b>Token Not Found</b>\n\n"
                 "This token is no longer being tracked.",
-                parse_mode='Markdown',
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🔙 Back to List", callback_data="menu_list")]
-                ])
+                parse_mode=ParseMode.HTML,
+                reply_markup=BACK_TO_LIST_KEYBOARD
             )
             return
+        contract_address = token_to_remove['contract_address']
         
         # Remove the token
         try:
@@ -718,41 +938,46 @@ class SolanaAlertBot:
             logger.info(f"✅ Remove operation result: {success}")
             
             if success:
+                self.invalidate(chat_id)
                 await query.edit_message_text(
-                    f"✅ *Token Removed Successfully!*\n\n"
-                    f"🪙 **{token_to_remove['symbol']}** - {token_to_remove['name']}\n"
-                    f"🔗 `{contract_address}`\n\n"
+                    f"✅ <b>Token Removed Successfully!</b>\n\n"
+                    f"🪙 <b>{escape(token_to_remove['symbol'] or '', quote=False)}</b> - {escape(token_to_remove['name'] or '', quote=False)}\n"
+                    f"🔗 <code>{escape(contract_address, quote=False)}</code>\n\n"
                     f"Token has been removed from tracking.",
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([
-                        [InlineKeyboardButton("📊 View Remaining Tokens", callback_data="menu_list")],
-                        [InlineKeyboardButton("🔙 Back to Menu", callback_data="menu_main")]
-                    ])
+                    parse_mode=ParseMode.HTML,
+                    reply_markup=TOKEN_REMOVED_KEYBOARD
                 )
             else:
                 logger.error(f"❌ Database remove operation failed for {contract_address}")
                 await query.edit_message_text(
-                    f"❌ *Removal Failed*\n\n"
-                    f"Could not remove token: {token_to_remove['symbol']}\n"
+                    f"❌ <b>Removal Failed</b>\n\n"
+                    f"Could not remove token: {escape(token_to_remove['symbol'] or '', quote=False)}\n"
                     f"Database operation returned: {success}\n"
-                    f"Please try again or use `/remove {contract_address}`",
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([
-                        [InlineKeyboardButton("🔙 Back to List", callback_data="menu_list")]
-                    ])
+                    f"Please try again or use <code>/remove {escape(contract_address, quote=False)}</code>",
+                    parse_mode=ParseMode.HTML,
+                    reply_markup=BACK_TO_LIST_KEYBOARD
                 )
         except Exception as e:
             logger.error(f"❌ Error removing token via callback: {e}")
             await query.edit_message_text(
-                f"❌ *Error Occurred*\n\n"
-                f"Failed to remove token: {str(e)}\n"
+                f"❌ <b>Error Occurred</b>\n\n"
+                f"Failed to remove token: {escape(str(e), quote=False)}\n"
                 f"Please try again.",
-                parse_mode='Markdown',
-                reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("🔙 Back to List", callback_data="menu_list")]
-                ])
+                parse_mode=ParseMode.HTML,
+                reply_markup=BACK_TO_LIST_KEYBOARD
             )
     
+    def _allow(self, chat_id: int) -> bool:
+        """Take one add from the chat's token bucket; False once the chat is over its rate."""
+        now = asyncio.get_running_loop().time()
+        tokens, last = self._rate.get(chat_id, (ADD_BURST, now))
+        tokens = min(ADD_BURST, tokens + (now - last) * ADD_RATE)
+        if tokens < 1:
+            self._rate[chat_id] = (tokens, now)
+            return False
+        self._rate[chat_id] = (tokens - 1, now)
+        return True
+    
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Enhanced message handler with perfect token detection."""
         if not update.message or not update.message.text or not update.effective_chat:
@@ -764,129 +989,239 @@ class SolanaAlertBot:
         chat_type = update.effective_chat.type or "private"
         
         # Register the group if not already registered
-        await self.database.register_group(chat_id, chat_title, chat_type)
+        await self.register_group(chat_id, chat_title, chat_type)
         
         # Enhanced contract address detection
-        async with SolanaAPI() as solana_api:
-            contract_addresses = solana_api.detect_contract_addresses(message_text)
+        contract_addresses = self.solana_api.detect_contract_addresses(message_text)
         
         if not contract_addresses:
             return
         
+        contracts = []
         for contract_address in contract_addresses[:3]:  # Limit to 3 addresses per message
+            # Spam bursts are turned away before any database, API or processing-message work
+            if not self._allow(chat_id):
+                await update.message.reply_text(RATE_LIMITED_MESSAGE, parse_mode=ParseMode.HTML)
+                break
+            contracts.append(contract_address)
+        
+        # A message's contracts are handled together, one message at a time per chat, in the order sent
+        if contracts:
+            self._enqueue_contracts(update, chat_id, contracts)
+    
+    def _enqueue_contracts(self, update: Update, chat_id: int, contracts: list[str]):
+        """Queue a message's contracts for the chat's worker, starting the worker if the chat has none."""
+        worker = self._chat_workers.get(chat_id)
+        if worker is None:
+            queue = asyncio.Queue()
+            worker = (queue, asyncio.create_task(self._chat_worker(chat_id, queue)))
+            self._chat_workers[chat_id] = worker
+        worker[0].put_nowait((update, contracts))
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue):
+        """Process one chat's queued messages in order; exits after CHAT_WORKER_IDLE seconds without work."""
+        while True:
             try:
-                # Check if token is already being tracked in this group
-                existing_tokens = await self.database.get_tokens_for_chat(chat_id)
-                if any(token['contract_address'] == contract_address for token in existing_tokens):
-                    await update.message.reply_text(
-                        f"ℹ️ Token `{contract_address[:8]}...{contract_address[-8:]}` is already being tracked in this group.",
-                        parse_mode='Markdown'
-                    )
-                    continue
-                
-                # Send processing message
-                processing_msg = await update.message.reply_text(
-                    f"🔍 *Processing Token...*\n\n"
-                    f"📊 Fetching data from DexScreener, Birdeye, and Pump.fun\n"
-                    f"🔗 `{contract_address[:8]}...{contract_address[-8:]}`",
-                    parse_mode='Markdown'
-                )
-                
-                # Get token data using enhanced API
-                async with SolanaAPI() as solana_api:
-                    token_data = await solana_api.get_token_info(contract_address)
-                
-                if not token_data:
-                    await processing_msg.edit_text(
-                        f"❌ *Token Not Found*\n\n"
-                        f"Could not fetch data for:\n`{contract_address}`\n\n"
-                        f"This might be a new token or invalid address.",
-                        parse_mode='Markdown'
-                    )
-                    continue
-                
-                if token_data.get('market_cap', 0) <= 0:
-                    await processing_msg.edit_text(
-                        f"⚠️ *No Market Data*\n\n"
-                        f"Token found but no trading data available:\n"
-                        f"• Symbol: {token_data.get('symbol', 'Unknown')}\n"
-                        f"• Name: {token_data.get('name', 'Unknown')}\n"
-                        f"• Source: {token_data.get('source', 'Unknown')}\n\n"
-                        f"Contract: `{contract_address}`",
-                        parse_mode='Markdown'
-                    )
-                    continue
-                
-                # Add token to database with enhanced data
-                token_id = await self.database.add_token(
-                    contract_address=contract_address,
-                    symbol=token_data['symbol'],
-                    name=token_data['name'],
-                    initial_mcap=token_data['market_cap'],
-                    initial_price=token_data['price'],
-                    chat_id=chat_id,
-                    message_id=processing_msg.message_id,
-                    platform=token_data.get('platform', 'solana'),
-                    source_api=token_data.get('source', 'dexscreener'),
-                    dex_name=token_data.get('dex', 'unknown'),
-                    pair_address=token_data.get('pair_address'),
-                    liquidity_usd=token_data.get('liquidity_usd', 0),
-                    volume_24h=token_data.get('volume_24h', 0),
-                    price_change_24h=token_data.get('price_change_24h', 0)
+                update, contracts = await asyncio.wait_for(queue.get(), CHAT_WORKER_IDLE)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    del self._chat_workers[chat_id]
+                    return
+                continue
+            try:
+                await self._process_contracts(update, chat_id, contracts)
+            except Exception as e:
+                logger.error(f"Error in contract worker for chat {chat_id}: {e}")
+    
+    async def _process_contracts(self, update: Update, chat_id: int, contracts: list[str]):
+        """Look up a message's contracts concurrently and add the valid ones in one transaction."""
+        # Each lookup reports its own errors; one that still raises must not cost its siblings the save
+        results = await asyncio.gather(
+            *(self._lookup_contract(update, chat_id, contract_address) for contract_address in contracts),
+            return_exceptions=True
+        )
+        ready = [result for result in results if isinstance(result, tuple)]
+        if not ready:
+            return
+        
+        try:
+            await self.database.add_tokens_bulk([
+                {
+                    'contract_address': contract_address,
+                    'symbol': token_data['symbol'],
+                    'name': token_data['name'],
+                    'initial_mcap': token_data['market_cap'],
+                    'initial_price': token_data['price'],
+                    'chat_id': chat_id,
+                    'message_id': processing_msg.message_id,
+                    'platform': token_data.get('platform', 'solana'),
+                    'source_api': token_data.get('source', 'dexscreener'),
+                    'dex_name': token_data.get('dex', 'unknown'),
+                    'pair_address': token_data.get('pair_address'),
+                    'liquidity_usd': token_data.get('liquidity_usd', 0),
+                    'volume_24h': token_data.get('volume_24h', 0),
+                    'price_change_24h': token_data.get('price_change_24h', 0)
+                }
+                for contract_address, token_data, processing_msg in ready
+            ])
+        except Exception as e:
+            logger.error(f"Error saving tokens for chat {chat_id}: {e}")
+            for contract_address, _, processing_msg in ready:
+                self._queue_edit(processing_msg,
+                    ERROR_TEMPLATE.format(contract_address=contract_address),
+                    parse_mode=ParseMode.HTML
                 )
-                
-                # Create confirmation message with enhanced data
-                confirmation_message = (
-                    f"✅ *Token Added Successfully!* ✅\n\n"
-                    f"📊 **{token_data['symbol']}** - {token_data['name']}\n\n"
-                    f"💰 **Market Cap:** ${token_data['market_cap']:,.0f}\n"
-                    f"💵 **Price:** ${token_data['price']:.8f}\n"
-                    f"🔗 **Contract:** `{contract_address}`\n\n"
-                    f"📈 **Trading Info:**\n"
-                    f"• DEX: {token_data.get('dex', 'Unknown').title()}\n"
-                    f"• Liquidity: ${token_data.get('liquidity_usd', 0):,.0f}\n"
-                    f"• 24h Volume: ${token_data.get('volume_24h', 0):,.0f}\n"
-                    f"• 24h Change: {token_data.get('price_change_24h', 0):+.2f}%\n"
-                    f"• Data Source: {token_data.get('source', 'Unknown').title()}\n\n"
-                    f"🚀 **Alert Levels:**\n"
-                    f"• Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
-                    f"• Loss Protection: -50%, -70%, -85%, -95%\n"
-                    f"• Monitoring: Every 15 seconds ⚡\n\n"
-                    f"🎯 *Ready to catch the pump!* 🚀"
+            return
+        self.invalidate(chat_id)
+        
+        for contract_address, token_data, processing_msg in ready:
+            self._confirm_contract(chat_id, contract_address, token_data, processing_msg)
+        
+        # Start tracking if not already running
+        self._ensure_tracker_started()
+    
+    async def _lookup_contract(self, update: Update, chat_id: int, contract_address: str):
+        """Fetch one contract behind a processing message; returns (contract_address, token_data, processing_msg) if it can be added."""
+        processing_msg = None
+        try:
+            # Check if token is already being tracked in this group
+            if await self.database.is_tracked(chat_id, contract_address):
+                await update.message.reply_text(
+                    ALREADY_TRACKED_TEMPLATE.format(short=f"{contract_address[:8]}...{contract_address[-8:]}"),
+                    parse_mode=ParseMode.HTML
                 )
-                
-                # Create action keyboard
-                keyboard = [
-                    [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
-                    [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
-                    [InlineKeyboardButton("❌ Remove This Token", callback_data=f"remove_{contract_address[:8]}")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await processing_msg.edit_text(
-                    confirmation_message, 
-                    parse_mode='Markdown',
-                    reply_markup=reply_markup
+                return None
+            
+            # Send the processing message while the enhanced API lookup runs
+            async with asyncio.TaskGroup() as tg:
+                processing_task = tg.create_task(update.message.reply_text(
+                    PROCESSING_TEMPLATE.format(short=f"{contract_address[:8]}...{contract_address[-8:]}"),
+                    parse_mode=ParseMode.HTML
+                ))
+                token_task = tg.create_task(self._get_token_info(contract_address))
+            processing_msg = processing_task.result()
+            token_data = token_task.result()
+            
+            if not token_data:
+                self._queue_edit(processing_msg,
+                    NOT_FOUND_TEMPLATE.format(contract_address=contract_address),
+                    parse_mode=ParseMode.HTML
                 )
-                
-                logger.info(f"✅ Token {token_data['symbol']} ({contract_address}) added for chat {chat_id}")
-                
-                # Start tracking if not already running
-                if self.token_tracker and not self.token_tracker.is_running:
-                    asyncio.create_task(self.token_tracker.start_tracking())
-                
-            except Exception as e:
-                logger.error(f"Error processing contract {contract_address}: {e}")
-                await update.message.reply_text(
-                    f"❌ *Error Processing Token*\n\n"
-                    f"An error occurred while processing:\n`{contract_address}`\n\n"
-                    f"Please try again or contact support.",
-                    parse_mode='Markdown'
+                return None
+            
+            if token_data.get('market_cap', 0) <= 0:
+                self._queue_edit(processing_msg,
+                    NO_MARKET_DATA_TEMPLATE.format(
+                        symbol=escape(token_data.get('symbol', 'Unknown'), quote=False),
+                        name=escape(token_data.get('name', 'Unknown'), quote=False),
+                        source=escape(token_data.get('source', 'Unknown'), quote=False),
+                        contract_address=contract_address
+                    ),
+                    parse_mode=ParseMode.HTML
                 )
-                continue
+                return None
+            
+            return contract_address, token_data, processing_msg
+            
+        except Exception as e:
+            logger.error(f"Error processing contract {contract_address}: {e}")
+            error_message = ERROR_TEMPLATE.format(contract_address=contract_address)
+            # Turn the processing message into the error when it was sent, rather than leaving it behind
+            if processing_msg is not None:
+                self._queue_edit(processing_msg, error_message, parse_mode=ParseMode.HTML)
+            else:
+                await update.message.reply_text(error_message, parse_mode=ParseMode.HTML)
+            return None
+    
+    def _confirm_contract(self, chat_id: int, contract_address: str, token_data: dict, processing_msg):
+        """Turn a saved contract's processing message into its confirmation."""
+        # Create confirmation message with enhanced data
+        confirmation_message = CONFIRMATION_TEMPLATE.format(
+            symbol=escape(token_data['symbol'], quote=False),
+            name=escape(token_data['name'], quote=False),
+            market_cap=token_data['market_cap'],
+            price=token_data['price'],
+            contract_address=contract_address,
+            dex=escape(token_data.get('dex', 'Unknown').title(), quote=False),
+            liquidity_usd=token_data.get('liquidity_usd', 0),
+            volume_24h=token_data.get('volume_24h', 0),
+            price_change_24h=token_data.get('price_change_24h', 0),
+            source=escape(token_data.get('source', 'Unknown').title(), quote=False)
+        )
+        
+        # Create action keyboard
+        reply_markup = InlineKeyboardMarkup([
+            *CONFIRM_KEYBOARD_ROWS,
+            [InlineKeyboardButton("❌ Remove This Token", callback_data=f"remove_{contract_address[:8]}")]
+        ])
+        
+        self._queue_edit(processing_msg,
+            confirmation_message,
+            parse_mode=ParseMode.HTML,
+            reply_markup=reply_markup
+        )
+        
+        logger.info(f"✅ Token {token_data['symbol']} ({contract_address}) added for chat {chat_id}")
+
+    async def _get_chat_cached(self, chat_id: int) -> tuple[list, dict]:
+        """database.get_tokens_with_stats behind a CHAT_CACHE_TTL-second per-chat cache."""
+        now = asyncio.get_running_loop().time()
+        entry = self._chat_cache.get(chat_id)
+        if entry and now - entry[0] < CHAT_CACHE_TTL:
+            return entry[1], entry[2]
+        tokens, stats = await self.database.get_tokens_with_stats(chat_id)
+        self._chat_cache[chat_id] = (now, tokens, stats)
+        return tokens, stats
+    
+    async def _get_tokens_cached(self, chat_id: int) -> list:
+        """This chat's active tokens, each with 'multiplier' and 'trend', from the chat cache."""
+        tokens, _ = await self._get_chat_cached(chat_id)
+        return tokens
+    
+    async def _get_stats_cached(self, chat_id: int) -> dict:
+        """This chat's token stats, from the chat cache."""
+        _, stats = await self._get_chat_cached(chat_id)
+        return stats
+    
+    def invalidate(self, chat_id: int):
+        """Drop the cached token list and stats for a chat after its tokens change."""
+        self._chat_cache.pop(chat_id, None)
+        self._list_pages.pop(chat_id, None)
+    
+    async def _get_token_info(self, contract_address: str):
+        """solana_api.get_token_info behind a TOKEN_INFO_TTL-second LRU cache, sharing in-flight lookups."""
+        loop = asyncio.get_running_loop()
+        entry = self._token_info_cache.get(contract_address)
+        if entry and loop.time() - entry[0] < TOKEN_INFO_TTL:
+            self._token_info_cache.move_to_end(contract_address)
+            return entry[1]
+        
+        # Concurrent misses for the same contract, e.g. a token posted in several chats at once, share one lookup
+        lookup = self._token_info_pending.get(contract_address)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self.solana_api.get_token_info(contract_address))
+            self._token_info_pending[contract_address] = lookup
+            lookup.add_done_callback(lambda _: self._token_info_pending.pop(contract_address, None))
+        # Shielded so one caller giving up does not cancel the lookup for the others
+        token_data = await asyncio.shield(lookup)
+        # Misses are not cached: a brand-new token may get listed seconds later
+        if token_data and token_data.get('market_cap', 0) > 0:
+            self._token_info_cache[contract_address] = (loop.time(), token_data)
+            self._token_info_cache.move_to_end(contract_address)
+            if len(self._token_info_cache) > TOKEN_INFO_CACHE_SIZE:
+                self._token_info_cache.popitem(last=False)
+        return token_data
     
     async def run(self):
-        """Main run method for the bot."""
+        """Main run method for the bot.
+        
+        Blocking calls must go through loop.run_in_executor(None, ...) rather than run
+        on the loop; that uses the BLOCKING_IO_WORKERS pool installed here, so every
+        entry point (main.py, railway_start.py) gets it.
+        """
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=BLOCKING_IO_WORKERS, thread_name_prefix='botio')
+        )
         try:
             logger.info("🚀 Starting Enhanced Solana Alert Bot...")
             
@@ -901,32 +1236,79 @@ class SolanaAlertBot:
             if self.application.updater:
                 await self.application.initialize()
                 await self.application.start()
-                await self.application.updater.start_polling()
+                if Config.USE_WEBHOOK:
+                    # Telegram pushes updates instead of waiting on getUpdates; the token path keeps the endpoint private
+                    await self.application.updater.start_webhook(
+                        listen=Config.WEBHOOK_LISTEN,
+                        port=Config.WEBHOOK_PORT,
+                        url_path=Config.TELEGRAM_BOT_TOKEN,
+                        webhook_url=f"{Config.WEBHOOK_URL.rstrip('/')}/{Config.TELEGRAM_BOT_TOKEN}",
+                        secret_token=Config.WEBHOOK_SECRET,
+                        allowed_updates=ALLOWED_UPDATES
+                    )
+                else:
+                    await self.application.updater.start_polling(
+                        timeout=POLL_TIMEOUT,
+                        allowed_updates=ALLOWED_UPDATES
+                    )
             else:
                 logger.error("Application updater not available")
                 return
             
             logger.info("✅ Enhanced Bot is running with perfect token detection!")
             
-            # Keep the bot running
-            while True:
-                await asyncio.sleep(1)
+            # Sleep until a shutdown signal arrives instead of waking every second
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self._stop_event.set)
+                except NotImplementedError:
+                    pass  # Windows: Ctrl+C still arrives as KeyboardInterrupt
+            await self._stop_event.wait()
+            logger.info("🛑 Shutdown signal received")
                 
         except KeyboardInterrupt:
             logger.info("🛑 Bot stopped by user")
         except Exception as e:
             logger.error(f"💥 Bot error: {e}")
         finally:
+            # Stop taking updates and let running handlers finish while the session and database are still open
+            if self.application:
+                if self.application.updater and self.application.updater.running:
+                    await self.application.updater.stop()
+                if self.application.running:
+                    await self.application.stop()
             if self.token_tracker:
                 self.token_tracker.stop_tracking()
+            background = [task for task in (self._tracker_task, self._edit_worker_task) if task]
+            background.extend(worker_task for _, worker_task in self._chat_workers.values())
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, *self._edit_tasks, return_exceptions=True)
+            # Nothing uses them any more, so the shared session and connection can go
+            if self.solana_api:
+                await self.solana_api.close()
+            if self.database:
+                await self.database.close()
             if self.application:
-                await self.application.stop()
                 await self.application.shutdown()
 
 async def main():
     """Main entry point."""
-    bot = SolanaAlertBot()
-    await bot.run()
+    log_listener = setup_logging()
+    try:
+        bot = SolanaAlertBot()
+        await bot.run()
+    finally:
+        # Flush whatever is still queued to the log handlers
+        if log_listener:
+            log_listener.stop()
 
 if __name__ == "__main__":
+    # uvloop is optional; fall back to the stdlib loop when it isn't installed (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -2,31 +2,280 @@
 import asyncio
 import logging
 import re
+import signal
+from collections import OrderedDict
 from datetime import datetime
+from html import escape
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, CallbackQueryHandler
-from config import Config
+from config import Config, setup_logging
 from database import Database
 from token_tracker import TokenTracker
 from solana_api import SolanaAPI
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(Config.LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Telegram allows roughly one message per second per chat and 30 per second bot-wide
+CHAT_SEND_INTERVAL = 1.0
+GLOBAL_SENDS_PER_SECOND = 30
+
+# Updates handled at once; a slow command in one chat no longer holds up every other chat
+CONCURRENT_UPDATES = 16
+
+# Addresses arriving in one chat within this many seconds are handled as one batch
+COALESCE_WINDOW = 0.25
+
+# Lookups with market data are reused for this long, so repeated pastes of a trending token skip the APIs
+TOKEN_INFO_TTL = 30
+TOKEN_INFO_CACHE_SIZE = 1024
+
+# Cheap prefilter: only messages with a base58 run long enough to be an address reach handle_message
+SOLANA_ADDRESS_RE = re.compile(r'[1-9A-HJ-NP-Za-km-z]{32,44}')
+
+# Users allowed to /stop tracking (empty: anyone); a set, resolved once at import
+ADMIN_USERS = frozenset(getattr(Config, 'ADMIN_USERS', ()) or ())
+
+# Telegram caps messages at 4096 chars; leave headroom for markup
+MAX_MESSAGE_LENGTH = 3800
+LIST_HEADER = "📊 <b>Tracked Tokens in This Group</b> 📊\n\n"
+LIST_CONTINUED_HEADER = "📊 <b>Tracked Tokens (continued)</b> 📊\n\n"
+
+def short_address(address: str) -> str:
+    """Abbreviate a contract address as first8...last8."""
+    return f"{address[:8]}...{address[-8:]}"
+
+def _mcap_status(token: dict):
+    """Return (status emoji, current mcap, multiplier) for a token row."""
+    current_mcap = token.get('current_mcap', 0) or 0
+    initial_mcap = token.get('initial_mcap', 1) or 1
+    multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
+    status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
+    return status_emoji, current_mcap, multiplier
+
+def _format_row(i: int, token: dict) -> str:
+    """Render one /list entry."""
+    status_emoji, current_mcap, multiplier = _mcap_status(token)
+    name = token['name']
+    # Truncate before escaping so an entity is never cut in half
+    name_trunc = escape(name[:30], quote=False) + ("..." if len(name) > 30 else "")
+    return (
+        f"{status_emoji} <b>{i}. {escape(token['symbol'], quote=False)}</b>\n"
+        f"📝 {name_trunc}\n"
+        f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
+        f"🔗 <code>{short_address(token['contract_address'])}</code>\n"
+        f"⏰ Added: {token['detected_at'][:10]}\n\n"
+    )
+
+def _format_search_row(i: int, token: dict) -> str:
+    """Render one /search result with the full name and address."""
+    status_emoji, current_mcap, multiplier = _mcap_status(token)
+    return (
+        f"{status_emoji} <b>{i}. {escape(token['symbol'], quote=False)}</b>\n"
+        f"📝 {escape(token['name'], quote=False)}\n"
+        f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
+        f"🔗 <code>{token['contract_address']}</code>\n\n"
+    )
+
+# "2x, 3x, 5x, ..." as shown in help and confirmation messages
+ALERT_MULTIPLIERS_STR = ", ".join(f"{m}x" for m in Config.ALERT_MULTIPLIERS)
+
+# Static replies are built once at import time
+WELCOME_MESSAGE = (
+    "🚀 <b>Enhanced Solana Token Alert Bot</b> 🚀\n\n"
+    "🔍 <b>Perfect Token Detection</b> - Never miss a launch!\n"
+    "📊 <b>DexScreener Integration</b> - Real-time accurate data\n"
+    "👥 <b>Group-Specific Tracking</b> - Each group has its own tokens\n"
+    "⚡ <b>Lightning Fast</b> - 15-second monitoring intervals\n\n"
+    "📋 <b>Quick Commands:</b>\n"
+    "• <code>/menu</code> - Access all features\n"
+    "• <code>/list</code> - View tracked tokens\n"
+    "• <code>/stats</code> - Group statistics\n"
+    "• Send any Solana contract address to start tracking!\n\n"
+    "🎯 <b>Alert Types:</b>\n"
+    "🚀 Multiplier alerts: 2x, 3x, 5x, 8x, 10x, up to 100x!\n"
+    "📉 Loss alerts: -50%, -70%, -85%, -95%\n"
+    "💎 Perfect detection of all Solana tokens\n\n"
+    "🔥 <b>Ready to catch some moonshots!</b> 🔥"
+)
+
+MENU_TEXT = (
+    "🎛️ <b>Main Menu</b> 🎛️\n\n"
+    "Choose an option below to manage your Solana token tracking:\n\n"
+    "📊 <b>View Tokens</b> - See all tracked tokens in this group\n"
+    "📈 <b>Statistics</b> - Group performance overview\n"
+    "🔍 <b>Search</b> - Find specific tokens\n"
+    "❌ <b>Remove</b> - Stop tracking unwanted tokens\n"
+    "ℹ️ <b>Help</b> - Commands and usage guide\n"
+    "⚙️ <b>Status</b> - Bot performance information"
+)
+
+HELP_MESSAGE = (
+    "🆘 <b>Enhanced Solana Alert Bot Help</b> 🆘\n\n"
+    "<b>🔍 Perfect Token Detection:</b>\n"
+    "• Detects ALL Solana tokens from any launchpad\n"
+    "• Supports pump.fun, DexScreener, Birdeye links\n"
+    "• Recognizes contract addresses in any format\n"
+    "• Enhanced regex patterns for 100% accuracy\n\n"
+    "<b>📊 Data Sources (Priority Order):</b>\n"
+    "1. 🥇 DexScreener - Most comprehensive data\n"
+    "2. 🥈 Birdeye - Real-time price feeds\n"
+    "3. 🥉 Pump.fun - Meme token specialists\n\n"
+    "<b>👥 Group Features:</b>\n"
+    "• Each group tracks its own tokens\n"
+    "• Group-specific statistics and settings\n"
+    "• Individual token management per group\n\n"
+    "<b>⚡ Alert System:</b>\n"
+    f"🚀 Multipliers: {ALERT_MULTIPLIERS_STR}\n"
+    "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
+    "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
+    "<b>🛠️ Commands:</b>\n"
+    "• <code>/menu</code> - Main control panel\n"
+    "• <code>/list</code> - Show all tracked tokens\n"
+    "• <code>/stats</code> - Group performance stats\n"
+    "• <code>/search &lt;query&gt;</code> - Find specific tokens\n"
+    "• <code>/remove &lt;address&gt;</code> - Stop tracking a token\n"
+    "• <code>/status</code> - Bot system status\n\n"
+    "<b>💡 Usage Tips:</b>\n"
+    "• Just paste any Solana contract address\n"
+    "• Works with URLs from any platform\n"
+    "• Each group maintains separate token lists\n"
+    "• Remove unwanted tokens easily\n\n"
+    "🔥 <b>Ready to catch every moonshot!</b> 🔥"
+)
+
+STATS_TEMPLATE = (
+    "📈 <b>Group Statistics</b> 📈\n\n"
+    "📊 <b>Overview:</b>\n"
+    "• Total Tokens: {total_tokens}\n"
+    "• Active Tokens: {active_tokens}\n"
+    "• Pumping Tokens: {pumping_tokens} 🚀\n"
+    "• Dumping Tokens: {dumping_tokens} 📉\n\n"
+    "🎯 <b>Performance:</b>\n"
+    "• Average Multiplier: {avg_multiplier}x\n"
+    "• Best Performer: {max_multiplier}x\n\n"
+    "⚡ <b>Bot Status:</b>\n"
+    "• Monitoring: {monitoring}\n"
+    "• Update Interval: 15 seconds\n"
+    "• Data Source: DexScreener Primary\n"
+)
+
+STATUS_TEMPLATE = (
+    "⚙️ <b>Enhanced Bot Status</b> ⚙️\n\n"
+    "🤖 <b>System Status:</b>\n"
+    "• Bot Running: {running}\n"
+    "• Active Tokens: {active_tokens}\n"
+    "• Monitoring Interval: 15 seconds ⚡\n\n"
+    "📊 <b>Data Sources:</b>\n"
+    "• 🥇 DexScreener (Primary)\n"
+    "• 🥈 Birdeye (Backup)\n"
+    "• 🥉 Pump.fun (Meme tokens)\n\n"
+    "🚀 <b>Alert System:</b>\n"
+    "• Multiplier Tracking: Up to 100x\n"
+    "• Loss Protection: 4 levels\n"
+    "• Perfect Token Detection: ✅\n"
+    "• Group-Specific Tracking: ✅\n\n"
+    "🔧 <b>Commands Available:</b>\n"
+    "• <code>/menu</code> - Full control panel\n"
+    "• <code>/list</code> - View tracked tokens\n"
+    "• <code>/stats</code> - Performance stats\n"
+    "• <code>/search</code> - Find tokens\n"
+    "• <code>/remove</code> - Stop tracking\n\n"
+    "⚡ <b>Ready for moonshots!</b> 🚀"
+)
+
+PROCESSING_TEMPLATE = (
+    "🔍 <b>Processing Token...</b>\n\n"
+    "📊 Fetching data from DexScreener, Birdeye, and Pump.fun\n"
+    "🔗 <code>{short}</code>"
+)
+
+CONFIRMATION_TEMPLATE = (
+    "✅ <b>Token Added Successfully!</b> ✅\n\n"
+    "📊 <b>{symbol}</b> - {name}\n\n"
+    "💰 <b>Market Cap:</b> ${market_cap:,.0f}\n"
+    "💵 <b>Price:</b> ${price:.8f}\n"
+    "🔗 <b>Contract:</b> <code>{contract_address}</code>\n\n"
+    "📈 <b>Trading Info:</b>\n"
+    "• DEX: {dex}\n"
+    "• Liquidity: ${liquidity_usd:,.0f}\n"
+    "• 24h Volume: ${volume_24h:,.0f}\n"
+    "• 24h Change: {price_change_24h:+.2f}%\n"
+    "• Data Source: {source}\n\n"
+    "🚀 <b>Alert Levels:</b>\n"
+    f"• Multipliers: {ALERT_MULTIPLIERS_STR}\n"
+    "• Loss Protection: -50%, -70%, -85%, -95%\n"
+    "• Monitoring: Every 15 seconds ⚡\n\n"
+    "🎯 <b>Ready to catch the pump!</b> 🚀"
+)
+
+SEARCH_HINT = (
+    "🔍 <b>Search Tokens</b>\n\n"
+    "Use the command: <code>/search &lt;query&gt;</code>\n\n"
+    "Search by symbol, name, or contract address."
+)
+
+REMOVE_HINT = (
+    "❌ <b>Remove Token</b>\n\n"
+    "Use the command: <code>/remove &lt;contract_address&gt;</code>\n\n"
+    "Get contract addresses with <code>/list</code>."
+)
+
+# Keyboards never change, so one instance serves every reply
+START_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 Main Menu", callback_data="menu_main")],
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list"),
+     InlineKeyboardButton("📈 Statistics", callback_data="menu_stats")]
+])
+
+MENU_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tracked Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 Group Statistics", callback_data="menu_stats")],
+    [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
+    [InlineKeyboardButton("❌ Remove Tokens", callback_data="menu_remove")],
+    [InlineKeyboardButton("ℹ️ Help & Info", callback_data="menu_help")],
+    [InlineKeyboardButton("⚙️ Bot Status", callback_data="menu_status")]
+])
+
+LIST_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("❌ Remove Token", callback_data="menu_remove")],
+    [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
+    [InlineKeyboardButton("📈 View Stats", callback_data="menu_stats")]
+])
+
+STATS_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("🔍 Search", callback_data="menu_search")],
+    [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
+])
+
+SEARCH_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton("❌ Remove Token", callback_data="menu_remove")],
+    [InlineKeyboardButton("📊 View All", callback_data="menu_list")]
+])
+
+# Shared rows of the per-token confirmation keyboard; only the remove button varies
+CONFIRM_KEYBOARD_ROWS = (
+    [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
+    [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
+)
+
 class SolanaAlertBot:
     def __init__(self):
         self.application = None
         self.token_tracker = None
         self.database = None
         self.solana_api = None
+        self._registered_groups = {}  # chat_id -> (chat_title, chat_type) already in the DB
+        self._tracked = {}  # chat_id -> contract addresses actively tracked there
+        self._next_send_at = {}  # chat_id -> loop time of the next allowed send
+        self._send_slots = asyncio.Semaphore(GLOBAL_SENDS_PER_SECOND)
+        self._tracker_task = None
+        self._pending = {}  # chat_id -> {contract_address: update} waiting for the next flush
+        self._flush_tasks = set()  # scheduled _flush_after tasks, referenced until they finish
+        self._token_info_cache = OrderedDict()  # contract_address -> (loop time fetched, token_data)
+        self._token_info_pending: dict[str, asyncio.Future] = {}  # contract_address -> lookup in flight
+        self._stop_event = asyncio.Event()  # set by SIGINT/SIGTERM to shut the bot down
         
     async def initialize(self):
         """Initialize the bot application with enhanced features."""
@@ -34,14 +283,25 @@ class SolanaAlertBot:
             raise ValueError("Invalid configuration")
         
         # Create application
-        self.application = Application.builder().token(Config.TELEGRAM_BOT_TOKEN).build()
+        self.application = (
+            Application.builder()
+            .token(Config.TELEGRAM_BOT_TOKEN)
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .build()
+        )
         
         # Initialize components
         self.database = Database(Config.DATABASE_PATH)
         await self.database.init_db()
+        # Handlers share one WAL-mode connection so its page cache survives between commands
+        await self.database.apply_pragmas()
+        self._registered_groups = await self.database.get_registered_groups()
+        self._tracked = await self.database.get_tracked_contracts()
         
+        # One long-lived HTTP session, shared by every message handler
         self.solana_api = SolanaAPI()
-        self.token_tracker = TokenTracker(self.application.bot)
+        await self.solana_api.start()
+        self.token_tracker = TokenTracker(self.application.bot, self.solana_api.session)
         
         # Add handlers
         self.application.add_handler(CommandHandler("start", self.start_command))
@@ -54,10 +314,35 @@ class SolanaAlertBot:
         self.application.add_handler(CommandHandler("status", self.status_command))
         self.application.add_handler(CommandHandler("stop", self.stop_tracking_command))
         self.application.add_handler(CallbackQueryHandler(self.handle_callback))
-        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
+        self.application.add_handler(MessageHandler(
+            filters.TEXT & ~filters.COMMAND & filters.Regex(SOLANA_ADDRESS_RE), self.handle_message
+        ))
         
         logger.info("🤖 Enhanced Bot initialized successfully with group support")
     
+    async def _send(self, chat_id: int, send_method, *args, **kwargs):
+        """Call a Telegram send/edit method within the per-chat and bot-wide rate limits."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # Reserve this chat's next slot before sleeping so concurrent sends queue up in order
+        send_at = max(now, self._next_send_at.get(chat_id, 0))
+        self._next_send_at[chat_id] = send_at + CHAT_SEND_INTERVAL
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+        
+        # Each bot-wide slot is handed back one second after it was taken
+        await self._send_slots.acquire()
+        loop.call_later(1, self._send_slots.release)
+        return await send_method(*args, **kwargs)
+    
+    async def register_group(self, chat_id: int, chat_title: str, chat_type: str):
+        """Register the chat unless it is already stored with the same title and type."""
+        key = (chat_title, chat_type)
+        if self._registered_groups.get(chat_id) == key:
+            return
+        await self.database.register_group(chat_id, chat_title, chat_type)
+        self._registered_groups[chat_id] = key
+    
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command with enhanced welcome."""
         if not update.message:
@@ -68,108 +353,23 @@ class SolanaAlertBot:
         chat_type = update.effective_chat.type if update.effective_chat else "private"
         
         # Register the group/chat
-        await self.database.register_group(chat_id, chat_title, chat_type)
-        
-        welcome_message = (
-            "🚀 *Enhanced Solana Token Alert Bot* 🚀\n\n"
-            "🔍 *Perfect Token Detection* - Never miss a launch!\n"
-            "📊 *DexScreener Integration* - Real-time accurate data\n"
-            "👥 *Group-Specific Tracking* - Each group has its own tokens\n"
-            "⚡ *Lightning Fast* - 15-second monitoring intervals\n\n"
-            "📋 *Quick Commands:*\n"
-            "• `/menu` - Access all features\n"
-            "• `/list` - View tracked tokens\n"
-            "• `/stats` - Group statistics\n"
-            "• Send any Solana contract address to start tracking!\n\n"
-            "🎯 *Alert Types:*\n"
-            "🚀 Multiplier alerts: 2x, 3x, 5x, 8x, 10x, up to 100x!\n"
-            "📉 Loss alerts: -50%, -70%, -85%, -95%\n"
-            "💎 Perfect detection of all Solana tokens\n\n"
-            "🔥 *Ready to catch some moonshots!* 🔥"
-        )
-        
-        # Create menu keyboard
-        keyboard = [
-            [InlineKeyboardButton("📋 Main Menu", callback_data="menu_main")],
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list"),
-             InlineKeyboardButton("📈 Statistics", callback_data="menu_stats")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        await self.register_group(chat_id, chat_title, chat_type)
         
-        await update.message.reply_text(welcome_message, parse_mode='Markdown', reply_markup=reply_markup)
-        
-        # Start tracking if not already running
-        if self.token_tracker and not self.token_tracker.is_running:
-            asyncio.create_task(self.token_tracker.start_tracking())
+        await self._send(chat_id, update.message.reply_text, WELCOME_MESSAGE, parse_mode=ParseMode.HTML, reply_markup=START_KEYBOARD)
     
     async def menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display the main menu with all available options."""
         if not update.message:
             return
             
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tracked Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("📈 Group Statistics", callback_data="menu_stats")],
-            [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
-            [InlineKeyboardButton("❌ Remove Tokens", callback_data="menu_remove")],
-            [InlineKeyboardButton("ℹ️ Help & Info", callback_data="menu_help")],
-            [InlineKeyboardButton("⚙️ Bot Status", callback_data="menu_status")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        menu_text = (
-            "🎛️ *Main Menu* 🎛️\n\n"
-            "Choose an option below to manage your Solana token tracking:\n\n"
-            "📊 *View Tokens* - See all tracked tokens in this group\n"
-            "📈 *Statistics* - Group performance overview\n"
-            "🔍 *Search* - Find specific tokens\n"
-            "❌ *Remove* - Stop tracking unwanted tokens\n"
-            "ℹ️ *Help* - Commands and usage guide\n"
-            "⚙️ *Status* - Bot performance information"
-        )
-        
-        await update.message.reply_text(menu_text, parse_mode='Markdown', reply_markup=reply_markup)
+        await self._send(update.message.chat_id, update.message.reply_text, MENU_TEXT, parse_mode=ParseMode.HTML, reply_markup=MENU_KEYBOARD)
     
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command with comprehensive information."""
         if not update.message:
             return
             
-        help_message = (
-            "🆘 *Enhanced Solana Alert Bot Help* 🆘\n\n"
-            "*🔍 Perfect Token Detection:*\n"
-            "• Detects ALL Solana tokens from any launchpad\n"
-            "• Supports pump.fun, DexScreener, Birdeye links\n"
-            "• Recognizes contract addresses in any format\n"
-            "• Enhanced regex patterns for 100% accuracy\n\n"
-            "*📊 Data Sources (Priority Order):*\n"
-            "1. 🥇 DexScreener - Most comprehensive data\n"
-            "2. 🥈 Birdeye - Real-time price feeds\n"
-            "3. 🥉 Pump.fun - Meme token specialists\n\n"
-            "*👥 Group Features:*\n"
-            "• Each group tracks its own tokens\n"
-            "• Group-specific statistics and settings\n"
-            "• Individual token management per group\n\n"
-            "*⚡ Alert System:*\n"
-            "🚀 Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
-            "📉 Loss Protection: -50%, -70%, -85%, -95%\n"
-            "⏱️ Ultra-fast monitoring: Every 15 seconds\n\n"
-            "*🛠️ Commands:*\n"
-            "• `/menu` - Main control panel\n"
-            "• `/list` - Show all tracked tokens\n"
-            "• `/stats` - Group performance stats\n"
-            "• `/search <query>` - Find specific tokens\n"
-            "• `/remove <address>` - Stop tracking a token\n"
-            "• `/status` - Bot system status\n\n"
-            "*💡 Usage Tips:*\n"
-            "• Just paste any Solana contract address\n"
-            "• Works with URLs from any platform\n"
-            "• Each group maintains separate token lists\n"
-            "• Remove unwanted tokens easily\n\n"
-            "🔥 *Ready to catch every moonshot!* 🔥"
-        )
-        
-        await update.message.reply_text(help_message, parse_mode='Markdown')
+        await self._send(update.message.chat_id, update.message.reply_text, HELP_MESSAGE, parse_mode=ParseMode.HTML)
     
     async def list_tokens_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display all tracked tokens for this group."""
@@ -180,52 +380,34 @@ class SolanaAlertBot:
         tokens = await self.database.get_tokens_for_chat(chat_id)
         
         if not tokens:
-            await update.message.reply_text(
-                "📋 *No Tokens Tracked Yet*\n\n"
+            await self._send(chat_id, update.message.reply_text,
+                "📋 <b>No Tokens Tracked Yet</b>\n\n"
                 "Send a Solana contract address to start tracking!",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             return
         
-        # Create paginated token list
+        # Create paginated token list; pieces are joined once per page
         message_parts = []
-        current_message = "📊 *Tracked Tokens in This Group* 📊\n\n"
+        buf = [LIST_HEADER]
+        buf_len = len(LIST_HEADER)
         
-        for i, token in enumerate(tokens, 1):
-            current_mcap = token.get('current_mcap', 0) or 0
-            initial_mcap = token.get('initial_mcap', 1) or 1
-            multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
-            
-            status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
-            
-            token_info = (
-                f"{status_emoji} *{i}. {token['symbol']}*\n"
-                f"📝 {token['name'][:30]}{'...' if len(token['name']) > 30 else ''}\n"
-                f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
-                f"🔗 `{token['contract_address'][:8]}...{token['contract_address'][-8:]}`\n"
-                f"⏰ Added: {token['detected_at'][:10]}\n\n"
-            )
-            
+        for token_info in (_format_row(i, t) for i, t in enumerate(tokens, 1)):
             # Check if adding this token would exceed message limit
-            if len(current_message + token_info) > 3800:
-                message_parts.append(current_message)
-                current_message = "📊 *Tracked Tokens (continued)* 📊\n\n" + token_info
+            info_len = len(token_info)
+            if buf_len + info_len > MAX_MESSAGE_LENGTH:
+                message_parts.append("".join(buf))
+                buf = [LIST_CONTINUED_HEADER, token_info]
+                buf_len = len(LIST_CONTINUED_HEADER) + info_len
             else:
-                current_message += token_info
+                buf.append(token_info)
+                buf_len += info_len
         
-        if current_message:
-            message_parts.append(current_message)
+        message_parts.append("".join(buf))
         
         # Send all message parts
         for part in message_parts:
-            keyboard = [
-                [InlineKeyboardButton("❌ Remove Token", callback_data="menu_remove")],
-                [InlineKeyboardButton("🔍 Search Tokens", callback_data="menu_search")],
-                [InlineKeyboardButton("📈 View Stats", callback_data="menu_stats")]
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            
-            await update.message.reply_text(part, parse_mode='Markdown', reply_markup=reply_markup)
+            await self._send(chat_id, update.message.reply_text, part, parse_mode=ParseMode.HTML, reply_markup=LIST_KEYBOARD)
     
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Display group statistics."""
@@ -235,30 +417,10 @@ class SolanaAlertBot:
         chat_id = update.effective_chat.id
         stats = await self.database.get_token_stats(chat_id)
         
-        stats_message = (
-            f"📈 *Group Statistics* 📈\n\n"
-            f"📊 *Overview:*\n"
-            f"• Total Tokens: {stats['total_tokens']}\n"
-            f"• Active Tokens: {stats['active_tokens']}\n"
-            f"• Pumping Tokens: {stats['pumping_tokens']} 🚀\n"
-            f"• Dumping Tokens: {stats['dumping_tokens']} 📉\n\n"
-            f"🎯 *Performance:*\n"
-            f"• Average Multiplier: {stats['avg_multiplier']}x\n"
-            f"• Best Performer: {stats['max_multiplier']}x\n\n"
-            f"⚡ *Bot Status:*\n"
-            f"• Monitoring: {'✅ Active' if self.token_tracker and self.token_tracker.is_running else '❌ Stopped'}\n"
-            f"• Update Interval: 15 seconds\n"
-            f"• Data Source: DexScreener Primary\n"
-        )
-        
-        keyboard = [
-            [InlineKeyboardButton("📊 View Tokens", callback_data="menu_list")],
-            [InlineKeyboardButton("🔍 Search", callback_data="menu_search")],
-            [InlineKeyboardButton("🎛️ Main Menu", callback_data="menu_main")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        monitoring = '✅ Active' if self.token_tracker and self.token_tracker.is_running else '❌ Stopped'
+        stats_message = STATS_TEMPLATE.format_map({**stats, 'monitoring': monitoring})
         
-        await update.message.reply_text(stats_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await self._send(chat_id, update.message.reply_text, stats_message, parse_mode=ParseMode.HTML, reply_markup=STATS_KEYBOARD)
     
     async def search_tokens_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Search for tokens by symbol, name, or address."""
@@ -271,50 +433,34 @@ class SolanaAlertBot:
         query = ' '.join(context.args) if context.args else ''
         
         if not query:
-            await update.message.reply_text(
-                "🔍 *Search Tokens*\n\n"
-                "Usage: `/search <symbol/name/address>`\n\n"
+            await self._send(chat_id, update.message.reply_text,
+                "🔍 <b>Search Tokens</b>\n\n"
+                "Usage: <code>/search &lt;symbol/name/address&gt;</code>\n\n"
                 "Examples:\n"
-                "• `/search BONK`\n"
-                "• `/search Solana`\n"
-                "• `/search 11111111`\n",
-                parse_mode='Markdown'
+                "• <code>/search BONK</code>\n"
+                "• <code>/search Solana</code>\n"
+                "• <code>/search 11111111</code>\n",
+                parse_mode=ParseMode.HTML
             )
             return
         
         tokens = await self.database.search_tokens(chat_id, query)
+        query_html = escape(query, quote=False)
         
         if not tokens:
-            await update.message.reply_text(
-                f"🔍 *Search Results*\n\n"
-                f"No tokens found matching: `{query}`",
-                parse_mode='Markdown'
+            await self._send(chat_id, update.message.reply_text,
+                f"🔍 <b>Search Results</b>\n\n"
+                f"No tokens found matching: <code>{query_html}</code>",
+                parse_mode=ParseMode.HTML
             )
             return
         
-        results_message = f"🔍 *Search Results for: {query}*\n\n"
-        
-        for i, token in enumerate(tokens[:10], 1):  # Limit to 10 results
-            current_mcap = token.get('current_mcap', 0) or 0
-            initial_mcap = token.get('initial_mcap', 1) or 1
-            multiplier = current_mcap / initial_mcap if initial_mcap > 0 else 0
-            
-            status_emoji = "🚀" if multiplier > 1 else "📉" if multiplier < 1 else "➖"
-            
-            results_message += (
-                f"{status_emoji} *{i}. {token['symbol']}*\n"
-                f"📝 {token['name']}\n"
-                f"💰 ${current_mcap:,.0f} ({multiplier:.2f}x)\n"
-                f"🔗 `{token['contract_address']}`\n\n"
-            )
-        
-        keyboard = [
-            [InlineKeyboardButton("❌ Remove Token", callback_data="menu_remove")],
-            [InlineKeyboardButton("📊 View All", callback_data="menu_list")]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        # Limit to 10 results
+        results_message = f"🔍 <b>Search Results for: {query_html}</b>\n\n" + "".join(
+            _format_search_row(i, t) for i, t in enumerate(tokens[:10], 1)
+        )
         
-        await update.message.reply_text(results_message, parse_mode='Markdown', reply_markup=reply_markup)
+        await self._send(chat_id, update.message.reply_text, results_message, parse_mode=ParseMode.HTML, reply_markup=SEARCH_KEYBOARD)
     
     async def remove_token_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Remove a token from tracking."""
@@ -325,33 +471,35 @@ class SolanaAlertBot:
         
         # Get contract address from command arguments
         if not context.args:
-            await update.message.reply_text(
-                "❌ *Remove Token*\n\n"
-                "Usage: `/remove <contract_address>`\n\n"
-                "Example: `/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263`\n\n"
-                "💡 Use `/list` to see all tracked tokens and their addresses.",
-                parse_mode='Markdown'
+            await self._send(chat_id, update.message.reply_text,
+                "❌ <b>Remove Token</b>\n\n"
+                "Usage: <code>/remove &lt;contract_address&gt;</code>\n\n"
+                "Example: <code>/remove DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263</code>\n\n"
+                "💡 Use <code>/list</code> to see all tracked tokens and their addresses.",
+                parse_mode=ParseMode.HTML
             )
             return
         
         contract_address = context.args[0]
+        address_html = escape(contract_address, quote=False)
         
         # Remove the token
         success = await self.database.remove_token(contract_address, chat_id)
         
         if success:
-            await update.message.reply_text(
-                f"✅ *Token Removed Successfully*\n\n"
-                f"Contract: `{contract_address}`\n\n"
+            self._tracked.get(chat_id, set()).discard(contract_address)
+            await self._send(chat_id, update.message.reply_text,
+                f"✅ <b>Token Removed Successfully</b>\n\n"
+                f"Contract: <code>{address_html}</code>\n\n"
                 f"The token has been removed from tracking in this group.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
         else:
-            await update.message.reply_text(
-                f"❌ *Token Not Found*\n\n"
-                f"Contract: `{contract_address}`\n\n"
+            await self._send(chat_id, update.message.reply_text,
+                f"❌ <b>Token Not Found</b>\n\n"
+                f"Contract: <code>{address_html}</code>\n\n"
                 f"This token is not being tracked in this group.",
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
     
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -362,30 +510,19 @@ class SolanaAlertBot:
         query = update.callback_query
         await query.answer()
         
-        if query.data == "menu_main":
-            await self.menu_command(update, context)
-        elif query.data == "menu_list":
-            await self.list_tokens_command(update, context)
-        elif query.data == "menu_stats":
-            await self.stats_command(update, context)
-        elif query.data == "menu_help":
-            await self.help_command(update, context)
-        elif query.data == "menu_status":
-            await self.status_command(update, context)
-        elif query.data == "menu_search":
-            await query.edit_message_text(
-                "🔍 *Search Tokens*\n\n"
-                "Use the command: `/search <query>`\n\n"
-                "Search by symbol, name, or contract address.",
-                parse_mode='Markdown'
-            )
-        elif query.data == "menu_remove":
-            await query.edit_message_text(
-                "❌ *Remove Token*\n\n"
-                "Use the command: `/remove <contract_address>`\n\n"
-                "Get contract addresses with `/list`.",
-                parse_mode='Markdown'
-            )
+        handler = self._CALLBACKS.get(query.data)
+        if handler:
+            await handler(self, update, context)
+    
+    async def show_search_hint(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Replace the menu with /search usage."""
+        chat_id = update.effective_chat.id if update.effective_chat else 0
+        await self._send(chat_id, update.callback_query.edit_message_text, SEARCH_HINT, parse_mode=ParseMode.HTML)
+    
+    async def show_remove_hint(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Replace the menu with /remove usage."""
+        chat_id = update.effective_chat.id if update.effective_chat else 0
+        await self._send(chat_id, update.callback_query.edit_message_text, REMOVE_HINT, parse_mode=ParseMode.HTML)
     
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command with enhanced system information."""
@@ -394,31 +531,12 @@ class SolanaAlertBot:
             
         status = self.token_tracker.get_tracking_status() if self.token_tracker else {"active_tokens": 0, "is_running": False}
         
-        status_message = (
-            f"⚙️ *Enhanced Bot Status* ⚙️\n\n"
-            f"🤖 **System Status:**\n"
-            f"• Bot Running: {'✅ Yes' if status.get('is_running', False) else '❌ No'}\n"
-            f"• Active Tokens: {status.get('active_tokens', 0)}\n"
-            f"• Monitoring Interval: 15 seconds ⚡\n\n"
-            f"📊 **Data Sources:**\n"
-            f"• 🥇 DexScreener (Primary)\n"
-            f"• 🥈 Birdeye (Backup)\n"
-            f"• 🥉 Pump.fun (Meme tokens)\n\n"
-            f"🚀 **Alert System:**\n"
-            f"• Multiplier Tracking: Up to 100x\n"
-            f"• Loss Protection: 4 levels\n"
-            f"• Perfect Token Detection: ✅\n"
-            f"• Group-Specific Tracking: ✅\n\n"
-            f"🔧 **Commands Available:**\n"
-            f"• `/menu` - Full control panel\n"
-            f"• `/list` - View tracked tokens\n"
-            f"• `/stats` - Performance stats\n"
-            f"• `/search` - Find tokens\n"
-            f"• `/remove` - Stop tracking\n\n"
-            f"⚡ *Ready for moonshots!* 🚀"
+        status_message = STATUS_TEMPLATE.format(
+            running='✅ Yes' if status.get('is_running', False) else '❌ No',
+            active_tokens=status.get('active_tokens', 0)
         )
         
-        await update.message.reply_text(status_message, parse_mode='Markdown')
+        await self._send(update.message.chat_id, update.message.reply_text, status_message, parse_mode=ParseMode.HTML)
     
     async def stop_tracking_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /stop command (admin only)."""
@@ -428,20 +546,19 @@ class SolanaAlertBot:
         user_id = update.effective_user.id
         
         # Only allow specific admin users (you can modify this list in config)
-        admin_users = getattr(Config, 'ADMIN_USERS', [])
-        if admin_users and user_id not in admin_users:
-            await update.message.reply_text(
-                "❌ *Access Denied*\n\nOnly administrators can stop the tracking system.",
-                parse_mode='Markdown'
+        if ADMIN_USERS and user_id not in ADMIN_USERS:
+            await self._send(update.message.chat_id, update.message.reply_text,
+                "❌ <b>Access Denied</b>\n\nOnly administrators can stop the tracking system.",
+                parse_mode=ParseMode.HTML
             )
             return
         
         if self.token_tracker:
             self.token_tracker.stop_tracking()
         
-        await update.message.reply_text(
-            "🛑 *Tracking Stopped*\n\nToken tracking has been stopped by an administrator.",
-            parse_mode='Markdown'
+        await self._send(update.message.chat_id, update.message.reply_text,
+            "🛑 <b>Tracking Stopped</b>\n\nToken tracking has been stopped by an administrator.",
+            parse_mode=ParseMode.HTML
         )
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -455,126 +572,199 @@ class SolanaAlertBot:
         chat_type = update.effective_chat.type or "private"
         
         # Register the group if not already registered
-        await self.database.register_group(chat_id, chat_title, chat_type)
+        await self.register_group(chat_id, chat_title, chat_type)
         
         # Enhanced contract address detection
-        async with SolanaAPI() as solana_api:
-            contract_addresses = solana_api.detect_contract_addresses(message_text)
-        
+        contract_addresses = self.solana_api.detect_contract_addresses(message_text)
         if not contract_addresses:
             return
         
-        for contract_address in contract_addresses[:3]:  # Limit to 3 addresses per message
-            try:
-                # Check if token is already being tracked in this group
-                existing_tokens = await self.database.get_tokens_for_chat(chat_id)
-                if any(token['contract_address'] == contract_address for token in existing_tokens):
-                    await update.message.reply_text(
-                        f"ℹ️ Token `{contract_address[:8]}...{contract_address[-8:]}` is already being tracked in this group.",
-                        parse_mode='Markdown'
-                    )
-                    continue
-                
-                # Send processing message
-                processing_msg = await update.message.reply_text(
-                    f"🔍 *Processing Token...*\n\n"
-                    f"📊 Fetching data from DexScreener, Birdeye, and Pump.fun\n"
-                    f"🔗 `{contract_address[:8]}...{contract_address[-8:]}`",
-                    parse_mode='Markdown'
-                )
-                
-                # Get token data using enhanced API
-                async with SolanaAPI() as solana_api:
-                    token_data = await solana_api.get_token_info(contract_address)
-                
-                if not token_data:
-                    await processing_msg.edit_text(
-                        f"❌ *Token Not Found*\n\n"
-                        f"Could not fetch data for:\n`{contract_address}`\n\n"
-                        f"This might be a new token or invalid address.",
-                        parse_mode='Markdown'
-                    )
-                    continue
-                
-                if token_data.get('market_cap', 0) <= 0:
-                    await processing_msg.edit_text(
-                        f"⚠️ *No Market Data*\n\n"
-                        f"Token found but no trading data available:\n"
-                        f"• Symbol: {token_data.get('symbol', 'Unknown')}\n"
-                        f"• Name: {token_data.get('name', 'Unknown')}\n"
-                        f"• Source: {token_data.get('source', 'Unknown')}\n\n"
-                        f"Contract: `{contract_address}`",
-                        parse_mode='Markdown'
+        # Queue the addresses; the first message of a burst schedules this chat's flush
+        pending = self._pending.get(chat_id)
+        if pending is None:
+            pending = self._pending[chat_id] = {}
+            task = asyncio.create_task(self._flush_after(chat_id, COALESCE_WINDOW))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_done)
+        for address in contract_addresses[:3]:  # Limit to 3 addresses per message
+            pending.setdefault(address, update)
+    
+    def _flush_done(self, task: asyncio.Task):
+        """Forget a finished flush and log it if it failed."""
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Error flushing queued addresses: %s", task.exception())
+    
+    async def _flush_after(self, chat_id: int, delay: float):
+        """Process every address queued for a chat during the coalescing window as one batch."""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Popped even if the flush is cancelled, so the chat's next address schedules a new one
+            pending = self._pending.pop(chat_id, {})
+        
+        # Look every address up concurrently; each one reports its own errors
+        results = await asyncio.gather(
+            *(self._lookup_one(update, chat_id, address) for address, update in pending.items()),
+            return_exceptions=True
+        )
+        ready = [result for result in results if isinstance(result, tuple)]
+        if not ready:
+            return
+        
+        # Add the whole batch to the database in one transaction
+        try:
+            await self.database.add_tokens_bulk([
+                {
+                    'contract_address': contract_address,
+                    'symbol': token_data['symbol'],
+                    'name': token_data['name'],
+                    'initial_mcap': token_data['market_cap'],
+                    'initial_price': token_data['price'],
+                    'chat_id': chat_id,
+                    'message_id': processing_msg.message_id,
+                    'platform': token_data.get('platform', 'solana'),
+                    'source_api': token_data.get('source', 'dexscreener'),
+                    'dex_name': token_data.get('dex', 'unknown'),
+                    'pair_address': token_data.get('pair_address'),
+                    'liquidity_usd': token_data.get('liquidity_usd', 0),
+                    'volume_24h': token_data.get('volume_24h', 0),
+                    'price_change_24h': token_data.get('price_change_24h', 0)
+                }
+                for contract_address, token_data, processing_msg in ready
+            ])
+        except Exception as e:
+            logger.error("Error saving tokens for chat %s: %s", chat_id, e)
+            await asyncio.gather(
+                *(self._report_error(pending[contract_address], chat_id, contract_address)
+                  for contract_address, _, _ in ready),
+                return_exceptions=True
+            )
+            return
+        
+        self._tracked.setdefault(chat_id, set()).update(contract_address for contract_address, _, _ in ready)
+        await asyncio.gather(
+            *(self._confirm_one(chat_id, *result) for result in ready),
+            return_exceptions=True
+        )
+    
+    async def _lookup_one(self, update: Update, chat_id: int, contract_address: str):
+        """Fetch one detected contract; returns (contract_address, token_data, processing_msg) if it can be added."""
+        short = short_address(contract_address)
+        try:
+            # Check if token is already being tracked in this group
+            tracked = self._tracked.setdefault(chat_id, set())
+            if contract_address in tracked:
+                # The set can lag behind tokens the tracker deactivated; the indexed lookup has the final say
+                if await self.database.is_tracked(chat_id, contract_address):
+                    await self._send(chat_id, update.message.reply_text,
+                        f"ℹ️ Token <code>{short}</code> is already being tracked in this group.",
+                        parse_mode=ParseMode.HTML
                     )
-                    continue
-                
-                # Add token to database with enhanced data
-                token_id = await self.database.add_token(
-                    contract_address=contract_address,
-                    symbol=token_data['symbol'],
-                    name=token_data['name'],
-                    initial_mcap=token_data['market_cap'],
-                    initial_price=token_data['price'],
-                    chat_id=chat_id,
-                    message_id=processing_msg.message_id,
-                    platform=token_data.get('platform', 'solana'),
-                    source_api=token_data.get('source', 'dexscreener'),
-                    dex_name=token_data.get('dex', 'unknown'),
-                    pair_address=token_data.get('pair_address'),
-                    liquidity_usd=token_data.get('liquidity_usd', 0),
-                    volume_24h=token_data.get('volume_24h', 0),
-                    price_change_24h=token_data.get('price_change_24h', 0)
-                )
-                
-                # Create confirmation message with enhanced data
-                confirmation_message = (
-                    f"✅ *Token Added Successfully!* ✅\n\n"
-                    f"📊 **{token_data['symbol']}** - {token_data['name']}\n\n"
-                    f"💰 **Market Cap:** ${token_data['market_cap']:,.0f}\n"
-                    f"💵 **Price:** ${token_data['price']:.8f}\n"
-                    f"🔗 **Contract:** `{contract_address}`\n\n"
-                    f"📈 **Trading Info:**\n"
-                    f"• DEX: {token_data.get('dex', 'Unknown').title()}\n"
-                    f"• Liquidity: ${token_data.get('liquidity_usd', 0):,.0f}\n"
-                    f"• 24h Volume: ${token_data.get('volume_24h', 0):,.0f}\n"
-                    f"• 24h Change: {token_data.get('price_change_24h', 0):+.2f}%\n"
-                    f"• Data Source: {token_data.get('source', 'Unknown').title()}\n\n"
-                    f"🚀 **Alert Levels:**\n"
-                    f"• Multipliers: 2x, 3x, 5x, 8x, 10x, 15x, 20x, 25x, 30x, 35x, 40x, 45x, 50x, 55x, 60x, 65x, 70x, 75x, 80x, 85x, 90x, 95x, 100x\n"
-                    f"• Loss Protection: -50%, -70%, -85%, -95%\n"
-                    f"• Monitoring: Every 15 seconds ⚡\n\n"
-                    f"🎯 *Ready to catch the pump!* 🚀"
-                )
-                
-                # Create action keyboard
-                keyboard = [
-                    [InlineKeyboardButton("📊 View All Tokens", callback_data="menu_list")],
-                    [InlineKeyboardButton("📈 Group Stats", callback_data="menu_stats")],
-                    [InlineKeyboardButton("❌ Remove This Token", callback_data=f"remove_{contract_address[:8]}")]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await processing_msg.edit_text(
-                    confirmation_message, 
-                    parse_mode='Markdown',
-                    reply_markup=reply_markup
+                    return None
+                tracked.discard(contract_address)
+            
+            # Post the processing placeholder while the lookup runs
+            processing_msg, token_data = await asyncio.gather(
+                self._send(chat_id, update.message.reply_text,
+                    PROCESSING_TEMPLATE.format(short=short), parse_mode=ParseMode.HTML),
+                self._get_token_info(contract_address)
+            )
+            
+            if not token_data:
+                await self._send(chat_id, processing_msg.edit_text,
+                    f"❌ <b>Token Not Found</b>\n\n"
+                    f"Could not fetch data for:\n<code>{contract_address}</code>\n\n"
+                    f"This might be a new token or invalid address.",
+                    parse_mode=ParseMode.HTML
                 )
-                
-                logger.info(f"✅ Token {token_data['symbol']} ({contract_address}) added for chat {chat_id}")
-                
-                # Start tracking if not already running
-                if self.token_tracker and not self.token_tracker.is_running:
-                    asyncio.create_task(self.token_tracker.start_tracking())
-                
-            except Exception as e:
-                logger.error(f"Error processing contract {contract_address}: {e}")
-                await update.message.reply_text(
-                    f"❌ *Error Processing Token*\n\n"
-                    f"An error occurred while processing:\n`{contract_address}`\n\n"
-                    f"Please try again or contact support.",
-                    parse_mode='Markdown'
+                return None
+            
+            if token_data.get('market_cap', 0) <= 0:
+                await self._send(chat_id, processing_msg.edit_text,
+                    f"⚠️ <b>No Market Data</b>\n\n"
+                    f"Token found but no trading data available:\n"
+                    f"• Symbol: {escape(token_data.get('symbol', 'Unknown'), quote=False)}\n"
+                    f"• Name: {escape(token_data.get('name', 'Unknown'), quote=False)}\n"
+                    f"• Source: {escape(token_data.get('source', 'Unknown'), quote=False)}\n\n"
+                    f"Contract: <code>{contract_address}</code>",
+                    parse_mode=ParseMode.HTML
                 )
-                continue
+                return None
+            
+            return contract_address, token_data, processing_msg
+            
+        except Exception as e:
+            logger.error("Error processing contract %s: %s", contract_address, e)
+            await self._report_error(update, chat_id, contract_address)
+            return None
+    
+    async def _get_token_info(self, contract_address: str):
+        """solana_api.get_token_info_fastest behind a TOKEN_INFO_TTL-second LRU cache, sharing in-flight lookups."""
+        loop = asyncio.get_running_loop()
+        entry = self._token_info_cache.get(contract_address)
+        if entry and loop.time() - entry[0] < TOKEN_INFO_TTL:
+            self._token_info_cache.move_to_end(contract_address)
+            return entry[1]
+        
+        # Concurrent misses for the same contract, e.g. a token posted in several chats at once, share one lookup
+        lookup = self._token_info_pending.get(contract_address)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self.solana_api.get_token_info_fastest(contract_address))
+            self._token_info_pending[contract_address] = lookup
+            lookup.add_done_callback(lambda _: self._token_info_pending.pop(contract_address, None))
+        # Shielded so one caller giving up does not cancel the lookup for the others
+        token_data = await asyncio.shield(lookup)
+        # Misses are not cached: a brand-new token may get listed seconds later
+        if token_data and token_data.get('market_cap', 0) > 0:
+            self._token_info_cache[contract_address] = (loop.time(), token_data)
+            self._token_info_cache.move_to_end(contract_address)
+            if len(self._token_info_cache) > TOKEN_INFO_CACHE_SIZE:
+                self._token_info_cache.popitem(last=False)
+        return token_data
+    
+    async def _confirm_one(self, chat_id: int, contract_address: str, token_data: dict, processing_msg):
+        """Turn a token's processing placeholder into the tracking confirmation."""
+        try:
+            # Create confirmation message with enhanced data
+            confirmation_message = CONFIRMATION_TEMPLATE.format(
+                symbol=escape(token_data['symbol'], quote=False),
+                name=escape(token_data['name'], quote=False),
+                market_cap=token_data['market_cap'],
+                price=token_data['price'],
+                contract_address=contract_address,
+                dex=escape(token_data.get('dex', 'Unknown').title(), quote=False),
+                liquidity_usd=token_data.get('liquidity_usd', 0),
+                volume_24h=token_data.get('volume_24h', 0),
+                price_change_24h=token_data.get('price_change_24h', 0),
+                source=escape(token_data.get('source', 'Unknown').title(), quote=False)
+            )
+            
+            # Create action keyboard
+            reply_markup = InlineKeyboardMarkup([
+                *CONFIRM_KEYBOARD_ROWS,
+                [InlineKeyboardButton("❌ Remove This Token", callback_data=f"remove_{contract_address[:8]}")]
+            ])
+            
+            await self._send(chat_id, processing_msg.edit_text,
+                confirmation_message, 
+                parse_mode=ParseMode.HTML,
+                reply_markup=reply_markup
+            )
+            
+            logger.info("✅ Token %s (%s) added for chat %s", token_data['symbol'], contract_address, chat_id)
+            
+        except Exception as e:
+            logger.error("Error confirming contract %s: %s", contract_address, e)
+    
+    async def _report_error(self, update: Update, chat_id: int, contract_address: str):
+        """Tell the chat that a contract could not be processed."""
+        await self._send(chat_id, update.message.reply_text,
+            f"❌ <b>Error Processing Token</b>\n\n"
+            f"An error occurred while processing:\n<code>{contract_address}</code>\n\n"
+            f"Please try again or contact support.",
+            parse_mode=ParseMode.HTML
+        )
     
     async def run(self):
         """Main run method for the bot."""
@@ -592,32 +782,84 @@ class SolanaAlertBot:
             if self.application.updater:
                 await self.application.initialize()
                 await self.application.start()
-                await self.application.updater.start_polling()
+                if Config.USE_WEBHOOK:
+                    # Telegram pushes updates instead of waiting on getUpdates; the token path keeps the endpoint private
+                    await self.application.updater.start_webhook(
+                        listen=Config.WEBHOOK_LISTEN,
+                        port=Config.WEBHOOK_PORT,
+                        url_path=Config.TELEGRAM_BOT_TOKEN,
+                        webhook_url=f"{Config.WEBHOOK_URL.rstrip('/')}/{Config.TELEGRAM_BOT_TOKEN}",
+                        secret_token=Config.WEBHOOK_SECRET
+                    )
+                else:
+                    await self.application.updater.start_polling()
             else:
                 logger.error("Application updater not available")
                 return
             
+            # Start the tracking loop once, now that the bot can send alerts
+            self._tracker_task = asyncio.create_task(self.token_tracker.start_tracking())
+            
             logger.info("✅ Enhanced Bot is running with perfect token detection!")
             
-            # Keep the bot running
-            while True:
-                await asyncio.sleep(1)
+            # Sleep until a shutdown signal arrives instead of waking every second
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self._stop_event.set)
+                except NotImplementedError:
+                    pass  # Windows: Ctrl+C still arrives as KeyboardInterrupt
+            await self._stop_event.wait()
+            logger.info("🛑 Shutdown signal received")
                 
         except KeyboardInterrupt:
             logger.info("🛑 Bot stopped by user")
         except Exception as e:
-            logger.error(f"💥 Bot error: {e}")
+            logger.error("💥 Bot error: %s", e)
         finally:
+            # Stop taking updates and let running handlers finish while the session and database are still open
+            if self.application:
+                if self.application.updater and self.application.updater.running:
+                    await self.application.updater.stop()
+                if self.application.running:
+                    await self.application.stop()
             if self.token_tracker:
                 self.token_tracker.stop_tracking()
+            if self._tracker_task:
+                self._tracker_task.cancel()
+            # Batches already queued are still looked up and saved before the session goes
+            await asyncio.gather(
+                *(task for task in (self._tracker_task,) if task), *self._flush_tasks,
+                return_exceptions=True
+            )
+            if self.solana_api:
+                await self.solana_api.close()
+            if self.database:
+                await self.database.close()
             if self.application:
-                await self.application.stop()
                 await self.application.shutdown()
+    
+    # Inline button callback_data -> handler
+    _CALLBACKS = {
+        "menu_main": menu_command,
+        "menu_list": list_tokens_command,
+        "menu_stats": stats_command,
+        "menu_help": help_command,
+        "menu_status": status_command,
+        "menu_search": show_search_hint,
+        "menu_remove": show_remove_hint,
+    }
 
 async def main():
     """Main entry point."""
-    bot = SolanaAlertBot()
-    await bot.run()
+    log_listener = setup_logging()
+    try:
+        bot = SolanaAlertBot()
+        await bot.run()
+    finally:
+        # Flush whatever is still queued to the log handlers
+        if log_listener:
+            log_listener.stop()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -83,4 +83,10 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # uvloop is optional; fall back to the stdlib loop when it isn't installed (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -348,6 +348,7 @@ if __name__ == "__main__":
         logger.info("🚀 STARTING SAFE RAILWAY DEPLOYMENT")
         logger.info("=" * 50)
         
+        backup_path = None
         try:
             # Step 1: Pre-deployment checks
             if not await self.pre_deployment_checks():
@@ -379,7 +380,7 @@ if __name__ == "__main__":
             
         except Exception as e:
             logger.error(f"❌ Deployment failed: {e}")
-            if 'backup_path' in locals():
+            if backup_path is not None:
                 await self.rollback_deployment(backup_path)
             return False
 
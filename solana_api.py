@@ -3,15 +3,56 @@ import aiohttp
 import asyncio
 import logging
 from typing import Optional, Dict, Any, List
-import json
+import orjson
 import re
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Comprehensive regex patterns for different Solana address formats, compiled once at import
+_ADDRESS_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Standard Solana address (44 chars base58) - most common
+    r'(?:^|(?<=\s)|(?<=\W))([1-9A-HJ-NP-Za-km-z]{43,44})(?=\s|[\.\,\!\?\;\:\)\]\}]|$|(?=\W))',
+    # Pump.fun specific format
+    r'(?:pump\.fun/)?([1-9A-HJ-NP-Za-km-z]{43,44})(?:pump)?',
+    # DexScreener URL format
+    r'dexscreener\.com/solana/([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Birdeye URL format
+    r'birdeye\.so/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Jupiter URL format
+    r'jup\.ag/swap/[^-]+-([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Raydium URL format
+    r'raydium\.io/swap/\?inputCurrency=[^&]*&outputCurrency=([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Generic token address in any context
+    r'(?:token|contract|address|ca)[:=\s]*([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Solscan format
+    r'solscan\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Solana Beach format
+    r'solanabeach\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
+    # Direct address without context
+    r'\b([1-9A-HJ-NP-Za-km-z]{44})\b',
+    # Address with common prefixes
+    r'(?:CA|ca|Contract|ADDRESS|Token)[:=\s]+([1-9A-HJ-NP-Za-km-z]{43,44})',
+)]
+
+# Shortest run any of _ADDRESS_PATTERNS can capture, matched with the same case folding
+_ADDRESS_RUN = re.compile(r'[1-9A-HJ-NP-Za-km-z]{43}', re.IGNORECASE)
+
+_BASE58_CHARS = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+
+_FALSE_POSITIVE_ADDRESSES = frozenset((
+    '11111111111111111111111111111111',  # System program
+    'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',  # Token program
+    'So11111111111111111111111111111111111111112',  # Wrapped SOL
+    'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
+    'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
+))
+
 class SolanaAPI:
-    def __init__(self):
-        self.session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        # A session passed in is shared with its owner and is left open by close()
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         # DexScreener as primary, others as fallbacks
         self.api_sources = {
             'dexscreener': 'https://api.dexscreener.com/latest/dex',
@@ -21,66 +62,45 @@ class SolanaAPI:
             'raydium': 'https://api.raydium.io/v2'
         }
         
-    async def __aenter__(self):
+    async def start(self):
+        """Open the shared HTTP session; safe to call repeatedly."""
+        if self.session and not self.session.closed:
+            return
+        self._owns_session = True
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=60),
             timeout=timeout,
             headers={'User-Agent': 'SolanaAlertBot/2.0'}
         )
+    
+    async def close(self):
+        """Close the HTTP session and its connection pool, unless it was borrowed."""
+        if self._owns_session and self.session and not self.session.closed:
+            await self.session.close()
+        
+    async def __aenter__(self):
+        await self.start()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session and not self.session.closed:
-            await self.session.close()
+        await self.close()
     
     def detect_contract_addresses(self, text: str) -> List[str]:
         """Enhanced contract address detection for all Solana token formats"""
-        # Comprehensive regex patterns for different Solana address formats
-        patterns = [
-            # Standard Solana address (44 chars base58) - most common
-            r'(?:^|(?<=\s)|(?<=\W))([1-9A-HJ-NP-Za-km-z]{43,44})(?=\s|[\.\,\!\?\;\:\)\]\}]|$|(?=\W))',
-            # Pump.fun specific format
-            r'(?:pump\.fun/)?([1-9A-HJ-NP-Za-km-z]{43,44})(?:pump)?',
-            # DexScreener URL format
-            r'dexscreener\.com/solana/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Birdeye URL format  
-            r'birdeye\.so/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Jupiter URL format
-            r'jup\.ag/swap/[^-]+-([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Raydium URL format
-            r'raydium\.io/swap/\?inputCurrency=[^&]*&outputCurrency=([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Generic token address in any context
-            r'(?:token|contract|address|ca)[:=\s]*([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Solscan format
-            r'solscan\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Solana Beach format
-            r'solanabeach\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Direct address without context
-            r'\b([1-9A-HJ-NP-Za-km-z]{44})\b',
-            # Address with common prefixes
-            r'(?:CA|ca|Contract|ADDRESS|Token)[:=\s]+([1-9A-HJ-NP-Za-km-z]{43,44})',
-        ]
-        
-        addresses = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Handle tuple results from capture groups
-                    for addr in match:
-                        if addr and len(addr) >= 43:
-                            addresses.add(addr)
-                else:
-                    if match and len(match) >= 43:
-                        addresses.add(match)
+        # Every pattern needs a 43-character run, so ordinary chat text costs one scan
+        if not _ADDRESS_RUN.search(text):
+            return []
         
-        # Validate addresses (basic Solana address validation)
-        valid_addresses = []
-        for addr in addresses:
-            if self._is_valid_solana_address(addr):
-                valid_addresses.append(addr)
+        # Each pattern has one capture group, so findall yields the address strings;
+        # dict keys dedupe while keeping the order they were found in
+        addresses = {}
+        for pattern in _ADDRESS_PATTERNS:
+            for addr in pattern.findall(text):
+                if addr not in addresses and self._is_valid_solana_address(addr):
+                    addresses[addr] = None
         
-        return valid_addresses
+        return list(addresses)
     
     def _is_valid_solana_address(self, address: str) -> bool:
         """Validate Solana address format"""
@@ -88,20 +108,11 @@ class SolanaAPI:
             return False
         
         # Check if it's valid base58
-        base58_chars = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-        if not all(c in base58_chars for c in address):
+        if not _BASE58_CHARS.issuperset(address):
             return False
         
         # Exclude common false positives
-        false_positives = [
-            '11111111111111111111111111111111',  # System program
-            'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',  # Token program
-            'So11111111111111111111111111111111111111112',  # Wrapped SOL
-            'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
-            'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
-        ]
-        
-        return address not in false_positives
+        return address not in _FALSE_POSITIVE_ADDRESSES
     
     async def get_token_data_dexscreener(self, contract_address: str) -> Optional[Dict[str, Any]]:
         """Get token data from DexScreener (primary source)"""
@@ -120,7 +131,7 @@ class SolanaAPI:
                 try:
                     async with self.session.get(endpoint) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = orjson.loads(await response.read())
                             
                             # Parse DexScreener response format
                             token_info = self._parse_dexscreener_data(data, contract_address)
@@ -219,7 +230,7 @@ class SolanaAPI:
                 try:
                     async with self.session.get(endpoint) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = orjson.loads(await response.read())
                             
                             if 'data' in data and data['data']:
                                 token_info = data['data']
@@ -262,7 +273,7 @@ class SolanaAPI:
                 try:
                     async with self.session.get(endpoint) as response:
                         if response.status == 200:
-                            data = await response.json()
+                            data = orjson.loads(await response.read())
                             
                             if isinstance(data, dict) and data:
                                 return {
@@ -305,6 +316,33 @@ class SolanaAPI:
             return token_data
         
         # If all APIs fail, return basic data
+        return self._fallback_token_data(contract_address)
+    
+    async def get_token_info_fastest(self, contract_address: str) -> Optional[Dict[str, Any]]:
+        """Query all sources at once and return the first result with market data"""
+        logger.info(f"🔍 Fetching token data for {contract_address} from all sources")
+        
+        pending = {
+            asyncio.create_task(self.get_token_data_dexscreener(contract_address)),
+            asyncio.create_task(self.get_token_data_birdeye(contract_address)),
+            asyncio.create_task(self.get_token_data_pump(contract_address)),
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    token_data = task.result()
+                    if token_data and token_data.get('market_cap', 0) > 0:
+                        return token_data
+        finally:
+            # The slower sources are no longer needed
+            for task in pending:
+                task.cancel()
+        
+        return self._fallback_token_data(contract_address)
+    
+    def _fallback_token_data(self, contract_address: str) -> Dict[str, Any]:
+        """Basic token data for when no source has market data"""
         logger.warning(f"⚠️ No market data found for {contract_address}, using basic info")
         return {
             'symbol': 'UNKNOWN',
@@ -4,8 +4,9 @@ import asyncio
 import logging
 from typing import Optional, Dict, Any, List
 import json
-import re
 from datetime import datetime
+# Shared with solana_api so both detectors find the same addresses
+from solana_api import _ADDRESS_PATTERNS, _BASE58_CHARS, _FALSE_POSITIVE_ADDRESSES
 
 logger = logging.getLogger(__name__)
 
@@ -35,35 +36,9 @@ class SolanaAPI:
     
     def detect_contract_addresses(self, text: str) -> List[str]:
         """Enhanced contract address detection for all Solana token formats"""
-        # Comprehensive regex patterns for different Solana address formats
-        patterns = [
-            # Standard Solana address (44 chars base58) - most common
-            r'(?:^|(?<=\s)|(?<=\W))([1-9A-HJ-NP-Za-km-z]{43,44})(?=\s|[\.\,\!\?\;\:\)\]\}]|$|(?=\W))',
-            # Pump.fun specific format
-            r'(?:pump\.fun/)?([1-9A-HJ-NP-Za-km-z]{43,44})(?:pump)?',
-            # DexScreener URL format
-            r'dexscreener\.com/solana/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Birdeye URL format  
-            r'birdeye\.so/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Jupiter URL format
-            r'jup\.ag/swap/[^-]+-([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Raydium URL format
-            r'raydium\.io/swap/\?inputCurrency=[^&]*&outputCurrency=([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Generic token address in any context
-            r'(?:token|contract|address|ca)[:=\s]*([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Solscan format
-            r'solscan\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Solana Beach format
-            r'solanabeach\.io/token/([1-9A-HJ-NP-Za-km-z]{43,44})',
-            # Direct address without context
-            r'\b([1-9A-HJ-NP-Za-km-z]{44})\b',
-            # Address with common prefixes
-            r'(?:CA|ca|Contract|ADDRESS|Token)[:=\s]+([1-9A-HJ-NP-Za-km-z]{43,44})',
-        ]
-        
         addresses = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _ADDRESS_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     # Handle tuple results from capture groups
@@ -88,20 +63,11 @@ class SolanaAPI:
             return False
         
         # Check if it's valid base58
-        base58_chars = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
-        if not all(c in base58_chars for c in address):
+        if not _BASE58_CHARS.issuperset(address):
             return False
         
         # Exclude common false positives
-        false_positives = [
-            '11111111111111111111111111111111',  # System program
-            'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',  # Token program
-            'So11111111111111111111111111111111111111112',  # Wrapped SOL
-            'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
-            'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
-        ]
-        
-        return address not in false_positives
+        return address not in _FALSE_POSITIVE_ADDRESSES
     
     async def get_token_data_dexscreener(self, contract_address: str) -> Optional[Dict[str, Any]]:
         """Get token data from DexScreener (primary source)"""
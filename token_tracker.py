@@ -1,7 +1,8 @@
 """Enhanced token tracking and alert system with multi-group support."""
 import asyncio
 import logging
-from typing import Dict, Set, List
+import aiohttp
+from typing import Dict, Set, List, Optional
 from datetime import datetime, timedelta
 from database import Database
 from solana_api import SolanaAPI
@@ -11,8 +12,9 @@ import json
 logger = logging.getLogger(__name__)
 
 class TokenTracker:
-    def __init__(self, bot):
+    def __init__(self, bot, session: Optional[aiohttp.ClientSession] = None):
         self.bot = bot
+        self.session = session  # shared HTTP session; None opens one per call
         self.tracking_tokens_by_group: Dict[int, Dict[str, Dict]] = {}  # chat_id -> {contract -> token_data}
         self.sent_alerts: Dict[str, Dict[int, Set[int]]] = {}  # contract -> {chat_id -> set of multipliers}
         self.last_alert_time: Dict[str, Dict[int, datetime]] = {}  # contract -> {chat_id -> last_alert_time}
@@ -58,7 +60,7 @@ class TokenTracker:
                 return False
             
             # Get token info from API
-            api = SolanaAPI()
+            api = SolanaAPI(self.session)
             async with api:
                 token_info = await api.get_token_info(contract_address)
                 
@@ -177,7 +179,7 @@ class TokenTracker:
     
     async def _check_group_tokens(self, chat_id: int, tokens: Dict[str, Dict]):
         """Check tokens for a specific group."""
-        api = SolanaAPI()
+        api = SolanaAPI(self.session)
         
         async with api:
             for contract_address, token_data in list(tokens.items()):
@@ -1,7 +1,11 @@
 """Enhanced token tracking and alert system with multi-group support."""
 import asyncio
 import logging
-from typing import Dict, Set, List
+from typing import Dict, Set, List, Optional
+import aiohttp
+from telegram.constants import ParseMode
+from dataclasses import dataclass
+from html import escape
 from datetime import datetime, timedelta
 from database import Database
 from solana_api import SolanaAPI
@@ -10,10 +14,30 @@ import json
 
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class TokenRecord:
+    """Live tracking state for one token in one group."""
+    name: str
+    symbol: str
+    initial_price: float
+    initial_mcap: float
+    confirmed_scan_mcap: float
+    current_price: float
+    current_mcap: float
+    highest_mcap: float
+    lowest_mcap: float
+    chat_id: int
+    message_id: int
+    last_updated: datetime
+    loss_alerts_sent: str = '[]'
+    multipliers_alerted: str = '[]'
+    current_loss_percentage: float = 0.0
+
 class TokenTracker:
-    def __init__(self, bot):
+    def __init__(self, bot, session: Optional[aiohttp.ClientSession] = None):
         self.bot = bot
-        self.tracking_tokens_by_group: Dict[int, Dict[str, Dict]] = {}  # chat_id -> {contract -> token_data}
+        self.session = session  # shared HTTP session; None opens one per update cycle
+        self.tracking_tokens_by_group: Dict[int, Dict[str, TokenRecord]] = {}  # chat_id -> {contract -> token_data}
         self.sent_alerts: Dict[str, Dict[int, Set[int]]] = {}  # contract -> {chat_id -> set of multipliers}
         self.last_alert_time: Dict[str, Dict[int, Dict[str, datetime]]] = {}  # contract -> {chat_id -> {alert_type -> last_alert_time}}
         self.is_running = False
@@ -83,7 +107,7 @@ class TokenTracker:
                 return False
             
             # Get token info from API
-            api = SolanaAPI()
+            api = SolanaAPI(self.session)
             async with api:
                 token_info = await api.get_token_info(contract_address)
                 
@@ -108,22 +132,20 @@ class TokenTracker:
                 
                 if success:
                     # Add to group tracking
-                    self.tracking_tokens_by_group[chat_id][contract_address] = {
-                        'name': token_info['name'],
-                        'symbol': token_info['symbol'],
-                        'initial_price': token_info['price'],
-                        'initial_mcap': token_info['market_cap'],
-                        'confirmed_scan_mcap': token_info['market_cap'],
-                        'current_price': token_info['price'],
-                        'current_mcap': token_info['market_cap'],
-                        'highest_mcap': token_info['market_cap'],
-                        'lowest_mcap': token_info['market_cap'],
-                        'chat_id': chat_id,
-                        'message_id': message_id,
-                        'last_updated': datetime.now(),
-                        'loss_alerts_sent': '[]',
-                        'multipliers_alerted': '[]'
-                    }
+                    self.tracking_tokens_by_group[chat_id][contract_address] = TokenRecord(
+                        name=token_info['name'],
+                        symbol=token_info['symbol'],
+                        initial_price=token_info['price'],
+                        initial_mcap=token_info['market_cap'],
+                        confirmed_scan_mcap=token_info['market_cap'],
+                        current_price=token_info['price'],
+                        current_mcap=token_info['market_cap'],
+                        highest_mcap=token_info['market_cap'],
+                        lowest_mcap=token_info['market_cap'],
+                        chat_id=chat_id,
+                        message_id=message_id,
+                        last_updated=datetime.now()
+                    )
                     
                     # Initialize alert tracking
                     if contract_address not in self.sent_alerts:
@@ -156,22 +178,22 @@ class TokenTracker:
                     contract_address = token['contract_address']
                     
                     # Initialize token data for this group
-                    self.tracking_tokens_by_group[chat_id][contract_address] = {
-                        'name': token['name'],
-                        'symbol': token['symbol'],
-                        'initial_price': token['initial_price'],
-                        'initial_mcap': token['initial_mcap'],
-                        'confirmed_scan_mcap': token.get('confirmed_scan_mcap') or token['initial_mcap'],
-                        'current_price': token['current_price'] or token['initial_price'],
-                        'current_mcap': token['current_mcap'] or token['initial_mcap'],
-                        'highest_mcap': token.get('highest_mcap') or token['initial_mcap'],
-                        'lowest_mcap': token.get('lowest_mcap') or token['initial_mcap'],
-                        'chat_id': token['chat_id'],
-                        'message_id': token['message_id'],
-                        'last_updated': datetime.fromisoformat(token['last_updated']) if token['last_updated'] else datetime.now(),
-                        'loss_alerts_sent': token.get('loss_alerts_sent', '[]'),
-                        'multipliers_alerted': token.get('multipliers_alerted', '[]')
-                    }
+                    self.tracking_tokens_by_group[chat_id][contract_address] = TokenRecord(
+                        name=token['name'] or '',
+                        symbol=token['symbol'] or '',
+                        initial_price=token['initial_price'],
+                        initial_mcap=token['initial_mcap'],
+                        confirmed_scan_mcap=token.get('confirmed_scan_mcap') or token['initial_mcap'],
+                        current_price=token['current_price'] or token['initial_price'],
+                        current_mcap=token['current_mcap'] or token['initial_mcap'],
+                        highest_mcap=token.get('highest_mcap') or token['initial_mcap'],
+                        lowest_mcap=token.get('lowest_mcap') or token['initial_mcap'],
+                        chat_id=token['chat_id'],
+                        message_id=token['message_id'],
+                        last_updated=datetime.fromisoformat(token['last_updated']) if token['last_updated'] else datetime.now(),
+                        loss_alerts_sent=token.get('loss_alerts_sent', '[]'),
+                        multipliers_alerted=token.get('multipliers_alerted', '[]')
+                    )
                     
                     # Initialize alert tracking for this token-group combination
                     if contract_address not in self.sent_alerts:
@@ -213,7 +235,7 @@ class TokenTracker:
         logger.info(f"🎯 Processing {len(all_unique_tokens)} unique tokens for real-time updates")
         
         # Create parallel tasks for ALL unique tokens
-        api = SolanaAPI()
+        api = SolanaAPI(self.session)
         update_tasks = []
         async with api:
             for contract_address, token_data in all_unique_tokens.items():
@@ -235,7 +257,7 @@ class TokenTracker:
             else:
                 logger.warning("⚠️ No update tasks created")
     
-    async def _update_single_token_realtime(self, api: SolanaAPI, contract_address: str, token_data: Dict):
+    async def _update_single_token_realtime(self, api: SolanaAPI, contract_address: str, token_data: TokenRecord):
         """Update a single token with real-time price data for ALL groups tracking it."""
         try:
             # Get current token info from API
@@ -246,11 +268,11 @@ class TokenTracker:
                 new_price = current_info['price']
                 
                 # Log significant price changes
-                old_mcap = token_data.get('current_mcap', token_data.get('initial_mcap', 0))
+                old_mcap = token_data.current_mcap
                 if old_mcap > 0:
                     change_pct = ((new_mcap - old_mcap) / old_mcap) * 100
                     if abs(change_pct) > 1:  # Log changes > 1%
-                        logger.info(f"📈 {token_data.get('symbol', 'UNKNOWN')}: {change_pct:+.2f}% (${old_mcap:,.0f} → ${new_mcap:,.0f})")
+                        logger.info(f"📈 {token_data.symbol}: {change_pct:+.2f}% (${old_mcap:,.0f} → ${new_mcap:,.0f})")
                 
                 # Update database immediately
                 await self.database.update_token_price(contract_address, new_mcap, new_price)
@@ -260,7 +282,7 @@ class TokenTracker:
                 
                 return True
             else:
-                logger.warning(f"⚠️ No data for {token_data.get('symbol', 'Unknown')} ({contract_address[:8]}...)")
+                logger.warning(f"⚠️ No data for {token_data.symbol} ({contract_address[:8]}...)")
                 return False
                 
         except Exception as e:
@@ -292,7 +314,7 @@ class TokenTracker:
         except Exception as e:
             logger.error(f"❌ Error checking alerts for all tokens: {e}")
     
-    async def _check_all_alerts_for_token_in_group(self, contract_address: str, token_data: Dict, chat_id: int):
+    async def _check_all_alerts_for_token_in_group(self, contract_address: str, token_data: TokenRecord, chat_id: int):
         """Check all alert types for a specific token in a specific group."""
         try:
             # Check multiplier alerts
@@ -302,8 +324,8 @@ class TokenTracker:
             await self._check_loss_alerts_for_group(contract_address, token_data, chat_id)
             
             # Check rug detection
-            baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-            current_mcap = token_data['current_mcap']
+            baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
+            current_mcap = token_data.current_mcap
             if baseline_mcap > 0:
                 loss_percentage = ((current_mcap - baseline_mcap) / baseline_mcap) * 100
                 await self._check_rug_detection_alert(contract_address, token_data, chat_id, loss_percentage)
@@ -314,12 +336,12 @@ class TokenTracker:
             logger.error(f"❌ Error checking alerts for {contract_address} in group {chat_id}: {e}")
             return False
     
-    async def _check_group_tokens(self, chat_id: int, tokens: Dict[str, Dict]):
+    async def _check_group_tokens(self, chat_id: int, tokens: Dict[str, TokenRecord]):
         """Check tokens for a specific group with detailed logging."""
         group_token_count = len(tokens)
         logger.info(f"🔍 Checking {group_token_count} tokens in group {chat_id}")
         
-        api = SolanaAPI()
+        api = SolanaAPI(self.session)
         updated_count = 0
         error_count = 0
         
@@ -331,7 +353,7 @@ class TokenTracker:
                     
                     if current_info and current_info.get('market_cap', 0) > 0:
                         # Update token data with real-time price information
-                        old_mcap = token_data['current_mcap']
+                        old_mcap = token_data.current_mcap
                         new_mcap = current_info['market_cap']
                         new_price = current_info['price']
                         
@@ -339,20 +361,20 @@ class TokenTracker:
                         if old_mcap > 0:
                             price_change = ((new_mcap - old_mcap) / old_mcap) * 100
                             if abs(price_change) > 1:  # Log changes > 1%
-                                logger.info(f"📈 {token_data['symbol']} price change: {price_change:+.2f}% (Group {chat_id})")
+                                logger.info(f"📈 {token_data.symbol} price change: {price_change:+.2f}% (Group {chat_id})")
                         
                         # Update tracking data with all current values for THIS group
-                        token_data['current_mcap'] = new_mcap
-                        token_data['current_price'] = new_price
-                        token_data['highest_mcap'] = max(token_data['highest_mcap'], new_mcap)
-                        token_data['lowest_mcap'] = min(token_data['lowest_mcap'], new_mcap)
-                        token_data['last_updated'] = datetime.now()
+                        token_data.current_mcap = new_mcap
+                        token_data.current_price = new_price
+                        token_data.highest_mcap = max(token_data.highest_mcap, new_mcap)
+                        token_data.lowest_mcap = min(token_data.lowest_mcap, new_mcap)
+                        token_data.last_updated = datetime.now()
                         
                         # Calculate real-time loss percentage for rug detection
-                        baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
+                        baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
                         if baseline_mcap > 0:
                             loss_percentage = ((new_mcap - baseline_mcap) / baseline_mcap) * 100
-                            token_data['current_loss_percentage'] = loss_percentage
+                            token_data.current_loss_percentage = loss_percentage
                             
                             # Real-time rug detection alert
                             await self._check_rug_detection_alert(contract_address, token_data, chat_id, loss_percentage)
@@ -370,7 +392,7 @@ class TokenTracker:
                         
                     else:
                         # Token might be rugged or delisted
-                        logger.warning(f"⚠️ No data found for {token_data['symbol']} in group {chat_id}")
+                        logger.warning(f"⚠️ No data found for {token_data.symbol} in group {chat_id}")
                         error_count += 1
                         
                 except Exception as e:
@@ -380,11 +402,11 @@ class TokenTracker:
         logger.info(f"✅ Group {chat_id}: {updated_count} tokens updated, {error_count} errors")
         return updated_count
 
-    async def _check_multiplier_alerts_for_group(self, contract_address: str, token_data: Dict, chat_id: int):
+    async def _check_multiplier_alerts_for_group(self, contract_address: str, token_data: TokenRecord, chat_id: int):
         """Check and send multiplier alerts for a specific group."""
         try:
-            baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-            current_mcap = token_data['current_mcap']
+            baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
+            current_mcap = token_data.current_mcap
             
             if baseline_mcap <= 0:
                 return
@@ -423,11 +445,11 @@ class TokenTracker:
         except Exception as e:
             logger.error(f"Error checking multiplier alerts for {contract_address} in group {chat_id}: {e}")
     
-    async def _check_loss_alerts_for_group(self, contract_address: str, token_data: Dict, chat_id: int):
+    async def _check_loss_alerts_for_group(self, contract_address: str, token_data: TokenRecord, chat_id: int):
         """Check and send loss alerts for a specific group."""
         try:
-            baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
-            current_mcap = token_data['current_mcap']
+            baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
+            current_mcap = token_data.current_mcap
             
             if baseline_mcap <= 0:
                 return
@@ -440,7 +462,7 @@ class TokenTracker:
             
             # Load sent loss alerts
             try:
-                sent_loss_alerts = json.loads(token_data.get('loss_alerts_sent', '[]'))
+                sent_loss_alerts = json.loads(token_data.loss_alerts_sent)
             except:
                 sent_loss_alerts = []
             
@@ -456,7 +478,7 @@ class TokenTracker:
                     
                     # Mark as sent
                     sent_loss_alerts.append(threshold)
-                    token_data['loss_alerts_sent'] = json.dumps(sent_loss_alerts)
+                    token_data.loss_alerts_sent = json.dumps(sent_loss_alerts)
                     
                     # Update database
                     await self._update_loss_alerts_db(contract_address, sent_loss_alerts)
@@ -474,19 +496,19 @@ class TokenTracker:
                 token_data = group_tokens[contract_address]
                 
                 # Update all price-related data for this token in this group
-                token_data['current_mcap'] = new_mcap
-                token_data['current_price'] = new_price
-                token_data['highest_mcap'] = max(token_data['highest_mcap'], new_mcap)
-                token_data['lowest_mcap'] = min(token_data['lowest_mcap'], new_mcap)
-                token_data['last_updated'] = datetime.now()
+                token_data.current_mcap = new_mcap
+                token_data.current_price = new_price
+                token_data.highest_mcap = max(token_data.highest_mcap, new_mcap)
+                token_data.lowest_mcap = min(token_data.lowest_mcap, new_mcap)
+                token_data.last_updated = datetime.now()
                 
                 # Update loss percentage for this group's tracking
-                baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
+                baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
                 if baseline_mcap > 0:
                     loss_percentage = ((new_mcap - baseline_mcap) / baseline_mcap) * 100
-                    token_data['current_loss_percentage'] = loss_percentage
+                    token_data.current_loss_percentage = loss_percentage
                 
-                logger.debug(f"📊 Updated {token_data.get('symbol', 'Unknown')} in group {group_id}: ${new_mcap:,.0f}")
+                logger.debug(f"📊 Updated {token_data.symbol} in group {group_id}: ${new_mcap:,.0f}")
     
     async def _check_alerts_across_all_groups(self, contract_address: str, new_mcap: float, new_price: float):
         """Check and send alerts to ALL groups tracking this token."""
@@ -501,12 +523,12 @@ class TokenTracker:
                 await self._check_loss_alerts_for_group(contract_address, token_data, group_id)
                 
                 # Check rug detection for this group (if significant loss)
-                baseline_mcap = token_data.get('confirmed_scan_mcap') or token_data['initial_mcap']
+                baseline_mcap = token_data.confirmed_scan_mcap or token_data.initial_mcap
                 if baseline_mcap > 0:
                     loss_percentage = ((new_mcap - baseline_mcap) / baseline_mcap) * 100
                     await self._check_rug_detection_alert(contract_address, token_data, group_id, loss_percentage)
     
-    async def _check_rug_detection_alert(self, contract_address: str, token_data: Dict, chat_id: int, loss_percentage: float):
+    async def _check_rug_detection_alert(self, contract_address: str, token_data: TokenRecord, chat_id: int, loss_percentage: float):
         """Check and send real-time rug detection alerts."""
         try:
             # Check if token is potentially rugged (below rug detection threshold)
@@ -535,79 +557,79 @@ class TokenTracker:
         except Exception as e:
             logger.error(f"Error checking rug detection for {contract_address} in group {chat_id}: {e}")
     
-    async def _send_rug_detection_alert(self, contract_address: str, token_data: Dict, chat_id: int, loss_percentage: float):
+    async def _send_rug_detection_alert(self, contract_address: str, token_data: TokenRecord, chat_id: int, loss_percentage: float):
         """Send real-time rug detection alert."""
         try:
-            message = f"""🚨 **POTENTIAL RUG DETECTED** 🚨
+            message = f"""🚨 <b>POTENTIAL RUG DETECTED</b> 🚨
 
-🪙 **{token_data['symbol']}** ({token_data['name']})
-📉 **SEVERE LOSS**: {loss_percentage:.1f}%
-💰 **Current MCap**: ${token_data['current_mcap']:,.0f}
-📊 **Baseline MCap**: ${token_data.get('confirmed_scan_mcap', token_data['initial_mcap']):,.0f}
+🪙 <b>{escape(token_data.symbol, quote=False)}</b> ({escape(token_data.name, quote=False)})
+📉 <b>SEVERE LOSS</b>: {loss_percentage:.1f}%
+💰 <b>Current MCap</b>: ${token_data.current_mcap:,.0f}
+📊 <b>Baseline MCap</b>: ${token_data.confirmed_scan_mcap:,.0f}
 
-⚠️ **WARNING**: Token has dropped below {Config.RUG_DETECTION_THRESHOLD}%
-⚠️ **CAUTION**: This may indicate a rug pull or major dump
-⚠️ **ADVICE**: Consider exit strategy immediately
+⚠️ <b>WARNING</b>: Token has dropped below {Config.RUG_DETECTION_THRESHOLD}%
+⚠️ <b>CAUTION</b>: This may indicate a rug pull or major dump
+⚠️ <b>ADVICE</b>: Consider exit strategy immediately
 
-🔗 **Contract**: `{contract_address}`"""
+🔗 <b>Contract</b>: <code>{contract_address}</code>"""
 
             await self.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             
-            logger.info(f"🚨 Sent rug detection alert for {token_data['symbol']} in group {chat_id} ({loss_percentage:.1f}% loss)")
+            logger.info(f"🚨 Sent rug detection alert for {token_data.symbol} in group {chat_id} ({loss_percentage:.1f}% loss)")
             
         except Exception as e:
             logger.error(f"Error sending rug detection alert: {e}")
 
-    async def _send_multiplier_alert(self, contract_address: str, token_data: Dict, chat_id: int, 
+    async def _send_multiplier_alert(self, contract_address: str, token_data: TokenRecord, chat_id: int, 
                                    alert_multiplier: int, current_multiplier: float):
         """Send multiplier alert to specific group."""
         try:
-            message = f"""🚨 **{alert_multiplier}x MULTIPLIER ALERT** 🚨
+            message = f"""🚨 <b>{alert_multiplier}x MULTIPLIER ALERT</b> 🚨
 
-🪙 **{token_data['symbol']}** ({token_data['name']})
-💰 **Current Price**: ${token_data['current_price']:.8f}
-📊 **Current MCap**: ${token_data['current_mcap']:,.0f}
-📈 **Multiplier**: {current_multiplier:.2f}x
-⏰ **Time**: {datetime.now().strftime('%H:%M:%S')}
+🪙 <b>{escape(token_data.symbol, quote=False)}</b> ({escape(token_data.name, quote=False)})
+💰 <b>Current Price</b>: ${token_data.current_price:.8f}
+📊 <b>Current MCap</b>: ${token_data.current_mcap:,.0f}
+📈 <b>Multiplier</b>: {current_multiplier:.2f}x
+⏰ <b>Time</b>: {datetime.now().strftime('%H:%M:%S')}
 
 🎉 Your token has reached a {alert_multiplier}x multiplier!"""
 
             await self.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             
-            logger.info(f"🚨 Sent {alert_multiplier}x alert for {token_data['symbol']} to group {chat_id}")
+            logger.info(f"🚨 Sent {alert_multiplier}x alert for {token_data.symbol} to group {chat_id}")
             
         except Exception as e:
             logger.error(f"Error sending multiplier alert: {e}")
     
-    async def _send_loss_alert(self, contract_address: str, token_data: Dict, chat_id: int, 
+    async def _send_loss_alert(self, contract_address: str, token_data: TokenRecord, chat_id: int, 
                              threshold: float, current_loss: float):
         """Send loss alert to specific group."""
         try:
-            message = f"""🚨 **{abs(threshold):.0f}% LOSS ALERT** 🚨
+            message = f"""🚨 <b>{abs(threshold):.0f}% LOSS ALERT</b> 🚨
 
-🪙 **{token_data['symbol']}** ({token_data['name']})
-💰 **Current Price**: ${token_data['current_price']:.8f}
-📊 **Current MCap**: ${token_data['current_mcap']:,.0f}
-📉 **Loss**: {current_loss:.1f}%
-⏰ **Time**: {datetime.now().strftime('%H:%M:%S')}
+🪙 <b>{escape(token_data.symbol, quote=False)}</b> ({escape(token_data.name, quote=False)})
+💰 <b>Current Price</b>: ${token_data.current_price:.8f}
+📊 <b>Current MCap</b>: ${token_data.current_mcap:,.0f}
+📉 <b>Loss</b>: {current_loss:.1f}%
+⏰ <b>Time</b>: {datetime.now().strftime('%H:%M:%S')}
 
 ⚠️ Your token has dropped {abs(threshold):.0f}% from baseline!"""
 
             await self.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             
-            logger.info(f"🚨 Sent {abs(threshold):.0f}% loss alert for {token_data['symbol']} to group {chat_id}")
+            logger.info(f"🚨 Sent {abs(threshold):.0f}% loss alert for {token_data.symbol} to group {chat_id}")
             
         except Exception as e:
             logger.error(f"Error sending loss alert: {e}")
@@ -681,19 +703,19 @@ class TokenTracker:
     async def _send_auto_removal_notification(self, token: Dict):
         """Send notification about auto-removed token."""
         try:
-            message = f"""🗑️ **AUTO-REMOVED TOKEN**
+            message = f"""🗑️ <b>AUTO-REMOVED TOKEN</b>
 
-🪙 **{token['symbol']}** ({token['name']})
-📉 **Loss**: {token['loss_percentage']:.1f}%
-💰 **Current MCap**: ${token['current_mcap']:,.0f}
-📊 **Baseline MCap**: ${token['baseline_mcap']:,.0f}
+🪙 <b>{escape(token['symbol'] or '', quote=False)}</b> ({escape(token['name'] or '', quote=False)})
+📉 <b>Loss</b>: {token['loss_percentage']:.1f}%
+💰 <b>Current MCap</b>: ${token['current_mcap']:,.0f}
+📊 <b>Baseline MCap</b>: ${token['baseline_mcap']:,.0f}
 
 ⚠️ Token automatically removed due to severe loss (below {Config.AUTO_REMOVE_THRESHOLD}%)"""
 
             await self.bot.send_message(
                 chat_id=token['chat_id'],
                 text=message,
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             
         except Exception as e:
@@ -702,18 +724,18 @@ class TokenTracker:
     async def _send_zero_liquidity_notification(self, token: Dict):
         """Send notification about zero liquidity token removal."""
         try:
-            message = f"""🗑️ **AUTO-REMOVED TOKEN**
+            message = f"""🗑️ <b>AUTO-REMOVED TOKEN</b>
 
-🪙 **{token['symbol']}** ({token['name']})
-💧 **Liquidity**: ${token['liquidity_usd']:,.0f}
-💰 **MCap**: ${token['current_mcap']:,.0f}
+🪙 <b>{escape(token['symbol'] or '', quote=False)}</b> ({escape(token['name'] or '', quote=False)})
+💧 <b>Liquidity</b>: ${token['liquidity_usd']:,.0f}
+💰 <b>MCap</b>: ${token['current_mcap']:,.0f}
 
 ⚠️ Token automatically removed due to zero/low liquidity"""
 
             await self.bot.send_message(
                 chat_id=token['chat_id'],
                 text=message,
-                parse_mode='Markdown'
+                parse_mode=ParseMode.HTML
             )
             
         except Exception as e: